@@ -0,0 +1,105 @@
+try:
+    from . import generic as g
+except BaseException:
+    import generic as g
+
+from trimesh.exchange import binary
+
+
+class BinaryTest(g.unittest.TestCase):
+
+    def test_roundtrip(self):
+        m = g.get_mesh('featuretype.STL')
+        m.visual.face_colors = [255, 0, 0, 255]
+        # populate the values which are stored
+        for name in binary._default_properties:
+            getattr(m, name)
+
+        data = binary.export_binary(m)
+        with g.TemporaryDirectory() as d:
+            path = g.os.path.join(d, 'mesh.bin')
+            with open(path, 'wb') as f:
+                binary.export_binary(m, file_obj=f)
+
+            for r in [binary.load_binary(g.trimesh.util.wrap_as_stream(data)),
+                      binary.load_binary(path),
+                      binary.load_binary(path, mmap=False)]:
+                assert g.np.allclose(r.vertices, m.vertices)
+                assert (r.faces == m.faces).all()
+                assert (r.visual.face_colors == m.visual.face_colors).all()
+                # cached values should be restored not recomputed
+                for name in binary._default_properties:
+                    assert name in r._cache.cache
+                assert (r.face_adjacency == m.face_adjacency).all()
+                # values derived from the side effects of a
+                # stored property should work without recomputing
+                assert (r.faces_unique_edges == m.faces_unique_edges).all()
+                assert g.np.allclose(r.edges_unique_length,
+                                     m.edges_unique_length)
+                assert (r.edges_unique_inverse ==
+                        m.edges_unique_inverse).all()
+                assert len(r.facets) == len(m.facets)
+                assert all((a == b).all() for a, b in zip(r.facets, m.facets))
+                # the stored tree should still be usable
+                points = g.random((100, 3))
+                assert g.np.allclose(r.nearest.on_surface(points)[1],
+                                     m.nearest.on_surface(points)[1])
+                # changing the data should clear the cache
+                r.vertices += 1.0
+                r._cache.verify()
+                assert 'face_normals' not in r._cache.cache
+                assert g.np.allclose(r.bounds, m.bounds + 1.0)
+                del r
+
+    def test_invalid(self):
+        data = binary.export_binary(g.trimesh.creation.box())
+        with self.assertRaises(ValueError):
+            binary.load_binary(g.trimesh.util.wrap_as_stream(b'x' + data))
+        # a future version shouldn't be loaded
+        data = data[:8] + g.np.array(
+            [binary._version + 1], dtype='<u4').tobytes() + data[12:]
+        with self.assertRaises(ValueError):
+            binary.load_binary(g.trimesh.util.wrap_as_stream(data))
+
+    def test_cache(self):
+        with g.TemporaryDirectory() as d:
+            cache = binary.MeshCache(d)
+            file_name = g.os.path.join(g.dir_models, 'featuretype.STL')
+            miss = cache.load(file_name)
+            assert len(g.os.listdir(d)) == 1
+            hit = cache.load(file_name)
+            assert len(g.os.listdir(d)) == 1
+            assert 'facets' in hit._cache.cache
+            assert g.np.allclose(hit.vertices, miss.vertices)
+            assert (hit.faces == miss.faces).all()
+
+            # different options should be stored separately
+            assert cache.key(file_name) != cache.key(file_name, process=False)
+            del hit
+
+            with self.assertRaises(ValueError):
+                cache.load(file_name, force='scene')
+
+            # a corrupt entry should be replaced
+            path = g.os.path.join(d, cache.key(file_name) + '.bin')
+            with open(path, 'wb') as f:
+                f.write(b'trimesh\x00garbage')
+            with self.assertLogs('trimesh', level='WARNING'):
+                check = cache.load(file_name)
+            assert (check.faces == miss.faces).all()
+            assert 'facets' in cache.load(file_name)._cache.cache
+
+    def test_side_effects(self):
+        m = g.get_mesh('featuretype.STL')
+        expected = m.faces_unique_edges.copy()
+        # a property missing one of its side effects is skipped
+        m._cache.delete('edges_unique_inverse')
+        r = binary.load_binary(g.trimesh.util.wrap_as_stream(
+            binary.export_binary(m)))
+        assert 'edges_unique' not in r._cache.cache
+        assert (r.faces_unique_edges == expected).all()
+
+
+if __name__ == '__main__':
+    g.trimesh.util.attach_to_log()
+    g.unittest.main()
@@ -0,0 +1,143 @@
+try:
+    from . import generic as g
+except BaseException:
+    import generic as g
+
+
+def brute_bounds(bounds, query):
+    """
+    Find overlapping pairs of boxes by comparing every box
+    to every query, to check the tree against.
+    """
+    ok = g.np.logical_and(
+        (query[:, None, 0] <= bounds[None, :, 1]).all(axis=2),
+        (query[:, None, 1] >= bounds[None, :, 0]).all(axis=2))
+    return set(zip(*g.np.nonzero(ok)))
+
+
+class BVHTest(g.unittest.TestCase):
+
+    def test_query_bounds(self):
+        for dimension in (2, 3):
+            for count in (1, 2, 3, 7, 8, 9, 100, 1000):
+                for leaf_size in (1, 4, 8):
+                    points = g.random((count, dimension))
+                    bounds = g.np.stack(
+                        (points,
+                         points + g.random((count, dimension)) * 0.1),
+                        axis=1)
+                    tree = g.trimesh.bvh.BVH(bounds, leaf_size=leaf_size)
+
+                    # every box should be in exactly one leaf
+                    assert set(tree.order) == set(range(count))
+                    assert g.np.allclose(
+                        tree.bounds,
+                        [bounds[:, 0].min(axis=0),
+                         bounds[:, 1].max(axis=0)])
+
+                    query = g.random((50, dimension))
+                    query = g.np.stack((query, query + 0.05), axis=1)
+                    index, box = tree.query_bounds(query)
+                    # query indexes should come back sorted
+                    assert (g.np.diff(index) >= 0).all()
+                    assert set(zip(index, box)) == brute_bounds(
+                        bounds, query)
+
+    def test_query_rays(self):
+        m = g.get_mesh('featuretype.STL')
+        tree = m.triangles_tree
+        origins = (g.random((1000, 3)) * m.extents * 1.5 +
+                   m.bounds[0] - m.extents * 0.25)
+        directions = g.trimesh.unitize(g.random((1000, 3)) - 0.5)
+        # include some axis aligned rays
+        directions[:100] = [0, 0, 1]
+        directions[100:200] = [-1, 0, 0]
+
+        index, candidates = tree.query_rays(origins, directions)
+        assert (g.np.diff(index) >= 0).all()
+        pairs = set(zip(index, candidates))
+
+        # every actual hit must have been a candidate
+        hits = g.trimesh.ray.ray_triangle.ray_triangle_id(
+            triangles=m.triangles,
+            ray_origins=origins,
+            ray_directions=directions,
+            tree=g.trimesh.triangles.bounds_tree(m.triangles))
+        assert len(hits[0]) > 0
+        assert set(zip(hits[1], hits[0])).issubset(pairs)
+
+        # chunked candidates should match a single pass
+        chunked = g.trimesh.ray.ray_triangle.ray_triangle_candidates(
+            origins, directions, tree=tree, chunk=7)
+        assert set(zip(chunked[1], chunked[0])) == pairs
+
+    def test_query_nearest(self):
+        bounds = g.random((500, 3))
+        bounds = g.np.stack(
+            (bounds, bounds + g.random((500, 3)) * 0.1), axis=1)
+        tree = g.trimesh.bvh.BVH(bounds, leaf_size=4)
+        points = g.random((100, 3)) * 2 - 0.5
+
+        index, box = tree.query_nearest(points)
+        # the box with the smallest farthest distance bounds
+        # the distance to the primitive inside of it
+        far = g.trimesh.bvh.farthest_sq(points[:, None], bounds[None])
+        near = g.trimesh.bvh.distance_sq(points[:, None], bounds[None])
+        bound = far.min(axis=1)
+        truth = set(zip(*g.np.nonzero(near <= bound[:, None])))
+        assert set(zip(index, box)) == truth
+
+        # a greedy leaf should be returned for every point
+        index, box = tree.nearest_leaf(points)
+        assert set(index) == set(range(len(points)))
+
+    def test_intersection(self):
+        # should be usable anywhere an rtree was
+        bounds = g.np.array([[i.min(axis=0), i.max(axis=0)]
+                             for i in [g.random((4, 3))
+                                       for i in range(10)]])
+        tree = g.trimesh.bvh.BVH(bounds.reshape((-1, 6)))
+        for i, b in enumerate(bounds):
+            assert i in set(tree.intersection(b.ravel()))
+        assert len(tree.intersection([10, 10, 10])) == 0
+
+    def test_refit(self):
+        points = g.random((100, 3))
+        tree = g.trimesh.bvh.BVH(g.np.stack((points, points + 0.1), axis=1))
+        order = tree.order.copy()
+
+        # move the boxes and refit the same structure
+        points = g.random((100, 3)) * 10
+        bounds = g.np.stack((points, points + 0.1), axis=1)
+        tree.refit(bounds)
+        assert (tree.order == order).all()
+        assert g.np.allclose(tree.bounds, [bounds[:, 0].min(axis=0),
+                                           bounds[:, 1].max(axis=0)])
+        # queries should match comparing every box
+        query = g.random((50, 3)) * 10
+        query = g.np.stack((query, query + 1.0), axis=1)
+        assert set(zip(*tree.query_bounds(query))) == brute_bounds(
+            bounds, query)
+
+        # the number of boxes can't change
+        with self.assertRaises(ValueError):
+            tree.refit(bounds[:10])
+
+    def test_empty(self):
+        tree = g.trimesh.bvh.BVH(g.np.zeros((0, 2, 3)))
+        assert tree.bounds is None
+        index, box = tree.query_bounds([[[0, 0, 0], [1, 1, 1]]])
+        assert len(index) == 0
+        assert len(box) == 0
+
+    def test_mesh(self):
+        m = g.get_mesh('featuretype.STL')
+        tree = m.triangles_tree
+        assert isinstance(tree, g.trimesh.bvh.BVH)
+        assert len(tree) == len(m.faces)
+        assert g.np.allclose(tree.bounds, m.bounds)
+
+
+if __name__ == '__main__':
+    g.trimesh.util.attach_to_log()
+    g.unittest.main()
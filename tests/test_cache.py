@@ -182,6 +182,186 @@ class CacheTest(g.unittest.TestCase):
         # for some reason return a different type?
         assert isinstance(a.max(), type(o.max()))
 
+    def test_depends(self):
+        m = g.get_mesh('featuretype.STL')
+        adjacency = m.face_adjacency
+        edges = m.edges_unique
+        area = m.area
+        # move the vertices but not the faces
+        m.vertices += 1.0
+        m._cache.verify()
+        # values which only depend on faces should survive
+        assert 'face_adjacency' in m._cache.cache
+        assert 'face_adjacency_edges' in m._cache.cache
+        assert m.face_adjacency is adjacency
+        assert m.edges_unique is edges
+        # values which depend on vertices should not
+        assert 'bounds' not in m._cache.cache
+        assert g.np.allclose(m.bounds[0], m.vertices.min(axis=0))
+        assert g.np.isclose(m.area, area)
+
+        # changing the faces should clear everything
+        m.faces = m.faces[1:]
+        m._cache.verify()
+        assert 'face_adjacency' not in m._cache.cache
+        assert len(m.face_adjacency) < len(adjacency)
+
+        # caches without a key function clear everything
+        m = g.get_mesh('featuretype.STL')
+        m._cache._key_function = None
+        _ = m.face_adjacency
+        m.vertices += 1.0
+        m._cache.verify()
+        assert 'face_adjacency' not in m._cache.cache
+
+    def test_budget(self):
+        m = g.get_mesh('featuretype.STL')
+        _ = m.face_adjacency
+        assert m._cache.stats['misses'] > 0
+        hits = m._cache.stats['hits']
+        _ = m.face_adjacency
+        assert m._cache.stats['hits'] == hits + 1
+
+        # size should include arrays and objects
+        size = m._cache.nbytes
+        assert size > m.face_adjacency.nbytes
+        _ = m.kdtree
+        assert m._cache.nbytes > size + m.vertices.nbytes
+
+        # a budget should evict the least recently used values
+        budget = m.triangles.nbytes * 2
+        m._cache.max_bytes = budget
+        _ = m.area_faces
+        assert m._cache.nbytes <= budget
+        assert 'edges_sorted' not in m._cache.cache
+        assert m._cache.stats['evictions'] > 0
+        # the value just computed should have been kept
+        assert 'area_faces' in m._cache.cache
+        # evicted values should be recomputed correctly
+        assert g.np.isclose(m.area, m.area_faces.sum())
+        assert len(m.face_adjacency) > 0
+
+        # process- wide budget across every cache
+        try:
+            g.trimesh.caching.budget.total = 0
+            m = g.trimesh.creation.icosphere()
+            _ = m.face_adjacency
+            _ = m.triangles_tree
+            # only the last value computed and the values
+            # it stored while computing should be left
+            assert set(m._cache.cache.keys()) == {
+                'triangles_tree', 'triangles'}
+            assert g.trimesh.caching.stats()['evictions'] > 0
+        finally:
+            g.trimesh.caching.budget.total = None
+
+    def test_accounting(self):
+        caching = g.trimesh.caching
+        m = g.get_mesh('featuretype.STL')
+        _ = m.face_adjacency
+        _ = m.area_faces
+        cache = m._cache
+        # without a budget values shouldn't be measured
+        assert len(cache._nbytes) == 0
+        assert cache._bytes[0] == 0
+        # the running total should match the values stored
+        size = cache.nbytes
+        assert size > 0
+        assert cache._bytes[0] == size
+        assert set(cache._used.keys()) == set(cache.cache.keys())
+        total = caching._total_bytes
+        assert total >= cache._bytes[0]
+
+        # changing the mesh should drop the bookkeeping
+        # along with the values
+        m.vertices += 1.0
+        cache.verify()
+        assert set(cache._used.keys()) == set(cache.cache.keys())
+        assert cache._bytes[0] == cache.nbytes
+        assert caching._total_bytes < total
+
+        _ = m.face_adjacency
+        cache.clear()
+        assert len(cache._used) == 0
+        assert len(cache._nbytes) == 0
+        assert cache._bytes[0] == 0
+
+        # collecting a cache should release its bytes
+        import gc
+        _ = m.area_faces
+        # collect any other garbage caches first
+        gc.collect()
+        total = caching._total_bytes
+        size = cache.nbytes
+        assert size > 0
+        assert caching._total_bytes == total + size
+        total += size
+        del m, cache
+        gc.collect()
+        assert caching._total_bytes == total - size
+
+    def test_evict_group(self):
+        caching = g.trimesh.caching
+        m = g.trimesh.creation.icosphere(subdivisions=4)
+        truth = m.edges_face.copy()
+        # use the producer more recently than the
+        # value it stored as a side effect
+        for _ in range(3):
+            _ = m.edges
+        try:
+            caching.budget.cache = m._cache.nbytes - 1
+            m._cache['area'] = 1.0
+        finally:
+            caching.budget.cache = None
+        assert m._cache.stats['evictions'] > 0
+        # the side effect should have been evicted with
+        # its producer rather than leaving it stale
+        assert ('edges' in m._cache.cache) == (
+            'edges_face' in m._cache.cache)
+        assert g.np.allclose(m.edges_face, truth)
+
+    def test_version(self):
+        a = g.trimesh.caching.tracked_array(g.random((100, 3)))
+        version = a.version
+        hashed = hash(a)
+        # slicing and copying shouldn't change the version
+        b = a[:10]
+        c = a[[0, 1, 2]]
+        d = a + 1
+        assert a.version == version
+        assert hash(a) == hashed
+
+        # altering a view should change the source
+        b += 1.0
+        assert a.version != version
+        assert hash(a) != hashed
+        # but altering a copy should not
+        version = a.version
+        c += 1.0
+        d[0] = 3.0
+        assert a.version == version
+
+        # ufuncs writing to the array in- place
+        g.np.add(a, 1.0, out=a)
+        assert a.version != version
+        version = a.version
+        a.fill(1.0)
+        assert a.version != version
+
+        # checking a mesh cache shouldn't hash the contents
+        m = g.get_mesh('featuretype.STL')
+        _ = m.area
+        original = g.trimesh.caching.hash_fast
+        try:
+            def fail(*args):
+                raise ValueError('hashed')
+            g.trimesh.caching.hash_fast = fail
+            m.vertices[:10] += 1.0
+            _ = m.area
+            assert 'area' in m._cache
+        finally:
+            g.trimesh.caching.hash_fast = original
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
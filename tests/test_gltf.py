@@ -839,11 +839,44 @@ class GLTFTest(g.unittest.TestCase):
         # interleaved vertex normals should all be unit vectors
         assert g.np.allclose(
             1.0, g.np.linalg.norm(c['vertex_normals'], axis=1))
+        # interleaved accessors should be strided views of the buffer
+        for key in ['vertices', 'vertex_normals']:
+            assert not c[key].flags['OWNDATA']
+            assert c[key].strides[0] == 24
 
         # should also load as a box
         m = g.get_mesh('BoxInterleaved.glb').geometry['Mesh']
         assert g.np.isclose(m.volume, 1.0)
 
+    def test_export_stream(self):
+        # writing to a file object should match the returned bytes
+        for name in ['fuze.obj', 'BoxInterleaved.glb', 'CesiumMilkTruck.glb']:
+            s = g.get_mesh(name)
+            export = g.trimesh.exchange.gltf.export_glb(s)
+            stream = g.trimesh.util.BytesIO()
+            result = g.trimesh.exchange.gltf.export_glb(s, file_obj=stream)
+            assert result is None
+            assert stream.getvalue() == export
+            validate_glb(stream.getvalue())
+
+            # a buffer postprocessor gets every item in memory
+            seen = []
+            stream = g.trimesh.util.BytesIO()
+            g.trimesh.exchange.gltf.export_glb(
+                s, file_obj=stream,
+                buffer_postprocessor=lambda b, t: seen.extend(b.values()))
+            assert stream.getvalue() == export
+            assert all(isinstance(i, bytes) for i in seen)
+
+            # spooled items should be written and only keep a length
+            spooled = g.trimesh.util.BytesIO()
+            _, items = g.trimesh.exchange.gltf._create_gltf_structure(
+                g.trimesh.Scene(s), buffer_items=g.trimesh.exchange.gltf._SpooledBuffers(
+                    spooled))
+            assert not any(isinstance(i, bytes) for i in items.values())
+            assert len(spooled.getvalue()) == sum(
+                len(i) for i in items.values())
+
     def test_equal_by_default(self):
         # all things being equal we shouldn't be moving things
         # for the usual load-export loop
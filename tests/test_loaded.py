@@ -69,6 +69,33 @@ class LoaderTest(g.unittest.TestCase):
         # clean up
         file_obj.close()
 
+    def test_load_many(self):
+        names = ['featuretype.STL', 'fuze.obj', 'box.STL',
+                 'points_ascii.ply', '2D/wrench.dxf',
+                 'not_a_file.stl']
+        paths = [g.os.path.join(g.dir_models, n) for n in names]
+        for workers in [1, 2]:
+            loaded = dict(g.trimesh.load_many(
+                paths, workers=workers, process=False))
+            # every file should have a result
+            assert set(loaded.keys()) == set(paths)
+            # errors should be returned rather than raised
+            assert isinstance(loaded[paths[-1]], Exception)
+            for path in paths[:-1]:
+                truth = g.trimesh.load(path, process=False)
+                check = loaded[path]
+                assert type(truth) is type(check)
+                assert g.np.allclose(truth.bounds, check.bounds)
+                if hasattr(truth, 'faces'):
+                    assert (truth.faces == check.faces).all()
+
+        # arrays should survive a round trip through pickle
+        import pickle
+        m = g.get_mesh('featuretype.STL')
+        r = pickle.loads(pickle.dumps(m.vertices))
+        assert isinstance(r, g.trimesh.caching.TrackedArray)
+        assert g.np.allclose(r, m.vertices)
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
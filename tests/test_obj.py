@@ -273,7 +273,8 @@ class OBJTest(g.unittest.TestCase):
         sphere.visual = g.trimesh.visual.TextureVisuals(
             uv=None,
             material=g.trimesh.visual.material.empty_material())
-        output = sphere.export('sphere.obj')
+        with g.TemporaryDirectory() as d:
+            output = sphere.export(g.os.path.join(d, 'sphere.obj'))
         assert 'usemtl' in output
 
     def test_chair(self):
@@ -407,6 +408,82 @@ class OBJTest(g.unittest.TestCase):
         assert len(t.geometry.keys()) == len(c.geometry.keys())
         assert g.np.isclose(t.area, c.area)
 
+    def test_stream(self):
+        # streaming in small blocks should match reading
+        # the whole file at once, including files with
+        # materials, objects, quads and line continuations
+        for name in ['fuze.obj',
+                     'rabbit.obj',
+                     'target.obj',
+                     'wallhole.obj',
+                     'negative_indices.obj',
+                     'quadknot.obj',
+                     'groups.obj',
+                     'polygonfaces.obj']:
+            for group_material in [True, False]:
+                truth = g.get_mesh(name, group_material=group_material)
+                for block_size in [100, 4096]:
+                    check = g.get_mesh(name,
+                                       group_material=group_material,
+                                       stream=True,
+                                       block_size=block_size)
+                    assert type(truth) is type(check)
+                    if isinstance(truth, g.trimesh.Scene):
+                        assert list(truth.geometry.keys()) == list(
+                            check.geometry.keys())
+                        pairs = zip(truth.geometry.values(),
+                                    check.geometry.values())
+                    else:
+                        pairs = [(truth, check)]
+                    for a, b in pairs:
+                        assert g.np.allclose(a.vertices, b.vertices)
+                        if hasattr(a, 'faces'):
+                            assert (a.faces == b.faces).all()
+                            assert type(a.visual) is type(b.visual)
+                            if getattr(a.visual, 'uv', None) is not None:
+                                assert g.np.allclose(
+                                    a.visual.uv, b.visual.uv)
+
+    def test_export_stream(self):
+        obj = g.trimesh.exchange.obj
+        m = g.get_mesh('fuze.obj')
+        # store normals so they are exported
+        m.vertex_normals
+        for digits in [3, 8]:
+            text, mtl = obj.export_obj(
+                m, digits=digits, return_texture=True)
+            # writing to a file object in chunks should match
+            stream = g.BytesIO()
+            assert obj.export_obj(m, digits=digits, file_obj=stream) is None
+            assert stream.getvalue().decode('utf-8') == text
+            assert 'mtllib material.mtl' in text
+            assert text.count('\nf ') == len(m.faces)
+
+        # formatting in blocks should match formatting at once
+        rows = g.np.array(g.random((1000, 3)))
+        blocks = ''.join(obj._format_rows(
+            'v', (rows, rows[:, :1]), digits=5, count=7))
+        lines = blocks.strip().split('\n')
+        assert len(lines) == len(rows)
+        assert lines[10] == 'v ' + g.trimesh.util.array_to_string(
+            g.np.append(rows[10], rows[10][0]), digits=5)
+
+        # faces are offset and repeated as written
+        faces = g.np.arange(6).reshape((2, 3))
+        assert ''.join(obj._format_rows(
+            'f', (faces,), value_format='{}/{}', offset=1)) == (
+                'f 1/1 2/2 3/3\nf 4/4 5/5 6/6\n')
+        # the offset shouldn't change the source
+        assert (faces == g.np.arange(6).reshape((2, 3))).all()
+
+        with g.TemporaryDirectory() as d:
+            path = g.os.path.join(d, 'fuze.obj')
+            with open(path, 'w') as f:
+                obj.export_obj(m, file_obj=f, write_texture=False)
+            r = g.trimesh.load(path, process=False, skip_materials=True)
+            assert g.np.allclose(r.vertices, m.vertices, atol=1e-6)
+            assert (r.faces == m.faces).all()
+
 
 def simple_load(text):
     # we're going to load faces in a basic text way
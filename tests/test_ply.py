@@ -150,6 +150,78 @@ class PlyTest(g.unittest.TestCase):
         assert g.np.allclose(ea.visual.vertex_colors, color)
         assert ea.visual.kind == 'vertex'
 
+    def test_ascii_block(self):
+        # ASCII rows of the same length are parsed in one pass
+        m = g.get_mesh('featuretype.STL')
+        ascii = g.wrapload(m.export(file_type='ply', encoding='ascii'),
+                           file_type='ply')
+        assert g.np.allclose(ascii.vertices, m.vertices)
+        assert (ascii.faces == m.faces).all()
+
+        # mixed triangles and quads need the per- row path
+        text = '\n'.join(['ply',
+                          'format ascii 1.0',
+                          'element vertex 5',
+                          'property float x',
+                          'property float y',
+                          'property float z',
+                          'element face 2',
+                          'property list uchar int vertex_indices',
+                          'end_header',
+                          '0 0 0', '1 0 0', '1 1 0', '0 1 0', '2 0 0',
+                          '4 0 1 2 3',
+                          '3 1 4 2'])
+        r = g.wrapload(text.encode('utf-8'), file_type='ply')
+        assert r.vertices.shape == (5, 3)
+        assert r.faces.shape == (3, 3)
+
+        # a list of the same length in every row but a
+        # length which doesn't fill the row isn't valid
+        data = g.trimesh.exchange.ply._ascii_block(
+            {'a': '<u1, ($LIST,)<i4'}, b'2 1 2 3\n2 1 2 3\n', 2)
+        assert data is None
+
+    def test_mmap(self):
+        path = g.os.path.join(g.dir_models, 'reference.ply')
+        m = g.trimesh.load(path, process=False)
+        mapped = g.trimesh.load(path, mmap=True)
+        assert g.np.allclose(mapped.vertices, m.vertices)
+        assert (mapped.faces == m.faces).all()
+        assert g.np.allclose(mapped.visual.vertex_colors,
+                             m.visual.vertex_colors)
+        # elements should reference the file
+        raw = mapped.metadata['_ply_raw']
+        assert isinstance(raw['vertex']['data'], g.np.memmap)
+
+        # file objects which can't be mapped should still load
+        with open(path, 'rb') as f:
+            data = g.trimesh.util.wrap_as_stream(f.read())
+        streamed = g.trimesh.load(data, file_type='ply', mmap=True)
+        assert g.np.allclose(streamed.vertices, m.vertices)
+
+        # a point cloud of doubles shouldn't be read into memory
+        points = g.random((100, 3))
+        header = '\n'.join(['ply',
+                            'format binary_little_endian 1.0',
+                            'element vertex 100',
+                            'property double x',
+                            'property double y',
+                            'property double z',
+                            'end_header\n'])
+        with g.TemporaryDirectory() as d:
+            path = g.os.path.join(d, 'points.ply')
+            with open(path, 'wb') as f:
+                f.write(header.encode('utf-8'))
+                f.write(points.astype('<f8').tobytes())
+            cloud = g.trimesh.load(path, mmap=True)
+            assert g.np.allclose(cloud.vertices, points)
+            assert not cloud.vertices.flags['OWNDATA']
+            # changes should not be written to the file
+            cloud.vertices[0] = 10.0
+            assert g.np.allclose(
+                g.trimesh.load(path).vertices, points)
+            del cloud
+
     def test_empty_or_pointcloud(self):
         # demo files to check
         empty_files = ['ply_empty_ascii.ply',
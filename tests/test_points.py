@@ -282,6 +282,28 @@ class PointsTest(g.unittest.TestCase):
         cloud_sum = cloud_1 + cloud_2
         assert g.np.allclose(cloud_sum.colors[:len(cloud_1.vertices)], cloud_1.colors)
 
+    def test_memmap(self):
+        points = g.random((100, 3))
+        with g.TemporaryDirectory() as d:
+            path = g.os.path.join(d, 'points.bin')
+            points.tofile(path)
+            for mode in ['r', 'c', 'r+']:
+                mapped = g.np.memmap(
+                    path, dtype=g.np.float64, mode=mode, shape=(100, 3))
+                cloud = g.trimesh.PointCloud(mapped)
+                assert g.np.allclose(cloud.vertices, points)
+                # only maps which can't edit the file are referenced
+                assert (mode != 'r+') == g.np.shares_memory(
+                    cloud.vertices, mapped)
+                if mode != 'r':
+                    cloud.vertices[0] = 10.0
+                cloud.apply_translation([1, 2, 3])
+                del cloud
+                del mapped
+                # the file should never have been changed
+                assert g.np.allclose(g.np.fromfile(path).reshape((-1, 3)),
+                                     points)
+
     def test_radial_sort(self):
         theta = g.np.linspace(0.0, g.np.pi * 2.0, 1000)
         points = g.np.column_stack((
@@ -248,6 +248,58 @@ class NearestTest(g.unittest.TestCase):
         assert len(q) == 3
         assert all(len(i) == 1 for i in q)
 
+    def test_skinny(self):
+        # long thin triangles would give the nearest- vertex
+        # heuristic huge candidate sets, but should be exact
+        mesh = g.trimesh.creation.cylinder(
+            radius=1.0, height=100.0, sections=64)
+        points = g.random((200, 3)) * [3, 3, 100] - [1.5, 1.5, 50]
+        closest, distance, tid = mesh.nearest.on_surface(points)
+        naive = g.trimesh.proximity.closest_point_naive(mesh, points)
+        assert g.np.allclose(distance, naive[1])
+        assert g.np.allclose(closest, naive[0])
+
+        query, faces = g.trimesh.proximity.nearest_candidates(
+            tree=mesh.triangles_tree,
+            triangles=mesh.triangles,
+            points=points)
+        # the winning face must be a candidate
+        assert set(zip(range(len(points)), tid)).issubset(
+            zip(query, faces))
+
+    def test_chunks(self):
+        # results in small blocks and on threads should
+        # be identical to doing every point at once
+        mesh = g.get_mesh('featuretype.STL')
+        points = (g.random((1000, 3)) * mesh.extents * 1.5 +
+                  mesh.bounds[0] - mesh.extents * 0.25)
+
+        truth = mesh.nearest.on_surface(points, chunk=len(points))
+        for workers in [None, 4]:
+            check = mesh.nearest.on_surface(
+                points, chunk=77, workers=workers)
+            assert all(g.np.allclose(a, b) for a, b in zip(truth, check))
+
+        # blocks should be yielded in order
+        blocks = list(mesh.nearest.on_surface_chunks(
+            points, chunk=300, workers=2))
+        assert [b[0] for b in blocks] == [0, 300, 600, 900]
+        assert g.np.allclose(
+            g.np.concatenate([b[2] for b in blocks]), truth[1])
+
+        # blocks with more candidate pairs than the cap should
+        # be split into runs of points and get the same result
+        proximity = g.trimesh.proximity
+        query, _ = proximity.nearest_candidates(
+            mesh.triangles_tree, mesh.triangles, points)
+        assert len(query) > 1000
+        try:
+            proximity._max_pairs = 50
+            check = mesh.nearest.on_surface(points)
+            assert all(g.np.allclose(a, b) for a, b in zip(truth, check))
+        finally:
+            proximity._max_pairs = 1 << 20
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
@@ -243,6 +243,33 @@ class RayTests(g.unittest.TestCase):
                 # should be same number of location hits
                 assert len(locations) == len(ray_origins)
 
+    def test_workers(self):
+        # the threaded path should match the serial path exactly
+        mesh = g.get_mesh('featuretype.STL', use_embree=False)
+        scene = g.trimesh.Scene(mesh)
+        scene.camera.resolution = (64, 48)
+        origins, vectors, pixels = scene.camera_rays()
+
+        for multiple_hits in [True, False]:
+            serial = mesh.ray.intersects_id(
+                origins, vectors,
+                multiple_hits=multiple_hits,
+                return_locations=True)
+            parallel = mesh.ray.intersects_id(
+                origins, vectors,
+                multiple_hits=multiple_hits,
+                return_locations=True,
+                workers=4)
+            assert len(serial[0]) > 0
+            assert all(g.np.array_equal(a, b)
+                       for a, b in zip(serial, parallel))
+
+        # a default can be set on the intersector
+        mesh.ray.workers = 3
+        assert g.np.array_equal(
+            mesh.ray.intersects_first(origins, vectors),
+            mesh.ray.intersects_first(origins, vectors, workers=1))
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
@@ -458,6 +458,220 @@ class SceneTests(g.unittest.TestCase):
 
         assert scene_sum.graph.base_frame == 'not_world'
 
+    def test_lazy(self):
+        for name in ['CesiumMilkTruck.glb', 'cycloidal.3DXML']:
+            file_name = g.os.path.join(g.dir_models, name)
+            eager = g.trimesh.load(file_name)
+            lazy = g.trimesh.load(file_name, lazy=True)
+
+            # nothing should have been loaded yet
+            assert set(lazy.geometry.lazy.keys()) == set(
+                eager.geometry.keys())
+            assert (len(lazy.graph.nodes_geometry) ==
+                    len(eager.graph.nodes_geometry))
+            assert lazy.is_valid
+
+            # GLTF bounds should come from the accessors
+            bounds = lazy.bounds
+            if name.endswith('.glb'):
+                assert len(lazy.geometry.lazy) == len(eager.geometry)
+            # boxes of rotated geometry may be slightly larger
+            assert (bounds[0] <= eager.bounds[0] + 1e-8).all()
+            assert (bounds[1] >= eager.bounds[1] - 1e-8).all()
+            assert g.np.allclose(bounds, eager.bounds, atol=0.1)
+
+            # accessing a geometry should load only that geometry
+            key = list(eager.geometry.keys())[0]
+            mesh = lazy.geometry[key]
+            assert isinstance(mesh, type(eager.geometry[key]))
+            assert key not in lazy.geometry.lazy
+            assert g.np.allclose(mesh.vertices, eager.geometry[key].vertices)
+            assert g.np.isclose(lazy.dump(concatenate=True).area,
+                                eager.dump(concatenate=True).area)
+            assert len(lazy.geometry.lazy) == 0
+
+    def test_instanced(self):
+        tf = g.trimesh.transformations
+        scene = g.trimesh.Scene()
+        scene.add_geometry(g.get_mesh('featuretype.STL'),
+                           geom_name='part', node_name='a')
+        scene.add_geometry(g.trimesh.creation.box(),
+                           geom_name='box', node_name='b')
+        for i in range(100):
+            matrix = tf.random_rotation_matrix()
+            matrix[:3, 3] = g.random(3) * 10
+            if i % 3 == 0:
+                # a reflection should flip the winding
+                matrix = g.np.dot(matrix, tf.reflection_matrix(
+                    [0, 0, 0], [1, 0, 0]))
+            # alternate geometry so instances aren't adjacent
+            name = ['part', 'box'][int(i > 50 and i % 2 == 0)]
+            scene.graph.update(
+                'node_{}'.format(i), matrix=matrix, geometry=name)
+        nodes = scene.graph.nodes_geometry
+
+        # compare to transforming a copy of every instance
+        copies = scene.dump()
+        assert len(copies) == len(nodes)
+        dumped = scene.dump(concatenate=True)
+        check = g.trimesh.util.concatenate(copies)
+        assert g.np.allclose(dumped.vertices, check.vertices)
+        assert (dumped.faces == check.faces).all()
+        assert g.np.isclose(dumped.volume, check.volume)
+
+        # bounds should be the same using the hull
+        for mesh in copies:
+            assert g.np.allclose(
+                scene.bounds_corners[mesh.metadata['node']],
+                mesh.bounds)
+        part = scene.geometry['part']
+        assert 'convex_hull' in part._cache
+
+        # every geometry once with its transforms
+        instanced = scene.dump(instanced=True)
+        assert set(instanced.keys()) == {'part', 'box'}
+        assert instanced['part']['geometry'] is part
+        assert sum(len(v['nodes']) for v in instanced.values()) == len(nodes)
+        for value in instanced.values():
+            assert value['transforms'].shape == (len(value['nodes']), 4, 4)
+            for node, matrix in zip(value['nodes'], value['transforms']):
+                assert g.np.allclose(matrix, scene.graph[node][0])
+
+    def test_query(self):
+        tf = g.trimesh.transformations
+        scene = g.trimesh.Scene()
+        scene.add_geometry(g.trimesh.creation.icosphere(),
+                           geom_name='ball', node_name='ball')
+        scene.add_geometry(g.trimesh.creation.annulus(
+            r_min=1, r_max=2, height=1), geom_name='ring', node_name='ring')
+        for i in range(20):
+            matrix = tf.random_rotation_matrix()
+            matrix[:3, 3] = g.random(3) * 20
+            if i % 4 == 0:
+                matrix[:3, :3] *= 2.0
+            scene.graph.update('node_{}'.format(i), matrix=matrix,
+                               geometry=['ball', 'ring'][i % 2])
+
+        origins = g.random((200, 3)) * 30 - 5
+        # aim most of the rays near a node
+        targets = scene.graph.get_world(scene.graph.nodes_geometry)[
+            g.np.arange(200) % len(scene.graph.nodes_geometry), :3, 3]
+        directions = g.trimesh.unitize(
+            targets + g.random((200, 3)) - 0.5 - origins)
+        points = g.random((200, 3)) * 30 - 5
+
+        def check():
+            # compare to queries on a single concatenated mesh
+            mesh = scene.dump(concatenate=True)
+            locations, index_ray, _, nodes = scene.ray.intersects_location(
+                origins, directions)
+            expected = mesh.ray.intersects_location(origins, directions)
+            assert len(locations) > 0
+            assert set(nodes).issubset(scene.graph.nodes_geometry)
+            # a ray through a shared edge may be reported once or
+            # twice so check every hit has a match on the same ray
+            a, b = [g.np.column_stack((v[0], v[1] * 1000.0)) for v in
+                    [(locations, index_ray), expected[:2]]]
+            assert g.spatial.cKDTree(a).query(b)[0].max() < 1e-8
+            assert g.spatial.cKDTree(b).query(a)[0].max() < 1e-8
+
+            triangle, node = scene.ray.intersects_first(origins, directions)
+            hit = mesh.ray.intersects_first(origins, directions) >= 0
+            assert ((triangle >= 0) == hit).all()
+            assert (node[~hit] == None).all()  # NOQA
+            assert (scene.ray.intersects_any(origins, directions) == hit).all()
+
+            closest, distance, _, node = scene.nearest.on_surface(points)
+            assert g.np.allclose(
+                distance, mesh.nearest.on_surface(points)[1])
+            assert g.np.allclose(
+                g.np.linalg.norm(closest - points, axis=1), distance)
+
+        check()
+        # moving a node should refit the same tree
+        tree = scene.ray._tree.bvh
+        scene.graph.update('node_1', matrix=tf.translation_matrix(
+            [5, 5, 5]), geometry='ring')
+        check()
+        assert scene.ray._tree.bvh is tree
+        # adding a node should build a new one
+        scene.graph.update('node_new', matrix=tf.translation_matrix(
+            [1, 2, 3]), geometry='ball')
+        check()
+        assert scene.ray._tree.bvh is not tree
+
+        # a ray through the box of an instance which misses it
+        ball = g.trimesh.Scene(g.trimesh.creation.icosphere())
+        origin, direction = [[0.95, 0.95, -5]], [[0, 0, 1]]
+        assert not ball.ray.intersects_any(origin, direction).any()
+        triangle, node = ball.ray.intersects_first(origin, direction)
+        assert (triangle == -1).all()
+        assert len(ball.ray.intersects_location(origin, direction)[0]) == 0
+        assert len(ball.ray.intersects_id(origin, direction)[0]) == 0
+
+        # an empty scene should have empty results
+        empty = g.trimesh.Scene()
+        assert len(empty.ray.intersects_id(origins, directions)[0]) == 0
+        assert g.np.isinf(empty.nearest.on_surface(points)[1]).all()
+
+    def test_reinstance(self):
+        tf = g.trimesh.transformations
+        original = g.trimesh.creation.annulus(r_min=1, r_max=2, height=1)
+        scene = g.trimesh.Scene()
+        matrices = []
+        for i in range(10):
+            matrix = tf.random_rotation_matrix()
+            matrix[:3, 3] = g.random(3) * 10
+            matrices.append(matrix)
+            # bake the transform into a copy of the vertices
+            scene.add_geometry(original.copy().apply_transform(matrix),
+                               geom_name='copy_{}'.format(i))
+        # a mirrored and a scaled copy are not rigid transforms
+        scene.add_geometry(original.copy().apply_transform(
+            tf.reflection_matrix([0, 0, 0], [1, 0, 0])), geom_name='mirror')
+        scene.add_geometry(original.copy().apply_scale(2.0),
+                           geom_name='scaled')
+
+        duplicates = scene.duplicate_geometry
+        assert len(duplicates) == 9
+        for name, (source, matrix) in duplicates.items():
+            assert source == 'copy_0'
+            assert g.np.allclose(g.np.dot(
+                matrices[int(name.split('_')[1])],
+                g.np.linalg.inv(matrices[0])), matrix)
+
+        # should group the same as comparing every identifier
+        groups = g.collections.defaultdict(list)
+        for node in scene.graph.nodes_geometry:
+            groups[scene.geometry[
+                scene.graph[node][1]].identifier_hash].append(node)
+        assert sorted(sorted(i) for i in scene.duplicate_nodes) == sorted(
+            sorted(i) for i in groups.values())
+
+        bounds = scene.bounds.copy()
+        dumped = scene.dump(concatenate=True)
+        removed = scene.reinstance()
+        assert len(removed) == 9
+        assert set(scene.geometry.keys()) == {'copy_0', 'mirror', 'scaled'}
+        assert len(scene.graph.nodes_geometry) == 12
+        assert g.np.allclose(scene.bounds, bounds)
+        assert g.np.allclose(
+            scene.dump(concatenate=True).vertices, dumped.vertices)
+        assert len(scene.duplicate_geometry) == 0
+        assert len(scene.reinstance()) == 0
+
+        # should be able to instance when loading
+        exported = g.trimesh.Scene([
+            original.copy().apply_transform(m) for m in matrices]).export(
+                file_type='glb')
+        loaded = g.trimesh.load(g.trimesh.util.wrap_as_stream(exported),
+                                file_type='glb', reinstance=True)
+        assert len(loaded.geometry) == 1
+        assert len(loaded.graph.nodes_geometry) == 10
+        assert g.np.allclose(loaded.bounds, g.trimesh.load(
+            g.trimesh.util.wrap_as_stream(exported),
+            file_type='glb').bounds)
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
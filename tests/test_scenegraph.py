@@ -291,6 +291,142 @@ class GraphTests(g.unittest.TestCase):
         s.apply_translation(-s.bounds[0])
         assert g.np.allclose(s.bounds[0], 0)
 
+    def test_world(self):
+        tf = g.trimesh.transformations
+        graph = g.trimesh.scene.transforms.SceneGraph()
+        # a tree a few levels deep with a disconnected branch
+        graph.update(frame_to='a', matrix=tf.random_rotation_matrix())
+        graph.update(frame_from='a', frame_to='b',
+                     matrix=tf.translation_matrix([1, 2, 3]))
+        graph.update(frame_from='b', frame_to='c',
+                     matrix=tf.random_rotation_matrix(), geometry='mesh')
+        graph.update(frame_from='a', frame_to='d',
+                     matrix=tf.random_rotation_matrix())
+        graph.update(frame_from='other', frame_to='e')
+
+        index = graph.node_index
+        world = graph.world_transforms
+        assert world.shape == (5, 4, 4)
+        assert set(index.keys()) == {'world', 'a', 'b', 'c', 'd'}
+        # parents should come before their children
+        assert index['world'] < index['a'] < index['b'] < index['c']
+        # the batched transforms should match walking the tree
+        for node, i in index.items():
+            assert g.np.allclose(
+                world[i], graph.get(node, 'world')[0])
+        # which shouldn't be editable in-place
+        assert not world.flags['WRITEABLE']
+
+        nodes = ['c', 'a', 'c']
+        assert g.np.allclose(graph.get_world(nodes), world[
+            [index[n] for n in nodes]])
+        assert graph.get_world([]).shape == (0, 4, 4)
+        # nodes not connected to the base frame should raise
+        with self.assertRaises(ValueError):
+            graph.get_world(['c', 'e'])
+
+        # changing an edge should update the transforms
+        graph.update(frame_from='a', frame_to='b',
+                     matrix=tf.translation_matrix([3, 2, 1]))
+        assert g.np.allclose(
+            graph.world_transforms[graph.node_index['c']],
+            g.trimesh.util.multi_dot([graph.get('a')[0],
+                                      tf.translation_matrix([3, 2, 1]),
+                                      graph.get('c', 'b')[0]]))
+        # a cached transform should come from the batch
+        matrix, geometry = graph.get('c')
+        assert geometry == 'mesh'
+        assert g.np.allclose(
+            matrix, graph.world_transforms[graph.node_index['c']])
+
+        # flattening requires every node to be connected
+        graph.transforms.remove_node('other')
+        graph.transforms.remove_node('e')
+        flat = graph.to_flattened()
+        assert set(flat.keys()) == {'a', 'b', 'c', 'd'}
+        assert flat['c']['geometry'] == 'mesh'
+        assert g.np.allclose(flat['c']['transform'], matrix)
+
+    def test_moved(self):
+        tf = g.trimesh.transformations
+        graph = g.trimesh.scene.transforms.SceneGraph()
+        graph.update(frame_to='a', matrix=tf.random_rotation_matrix())
+        graph.update(frame_from='a', frame_to='b',
+                     matrix=tf.random_rotation_matrix())
+        graph.update(frame_from='b', frame_to='c',
+                     matrix=tf.random_rotation_matrix(), geometry='mesh')
+        graph.update(frame_from='a', frame_to='d',
+                     matrix=tf.random_rotation_matrix())
+
+        world = graph.world_transforms
+        for node in ['a', 'b', 'c', 'd']:
+            graph.get(node)
+        graph.get('c', 'd')
+        graph.get('d', 'a')
+        hashed = hash(graph)
+
+        # move an edge without changing the topology
+        graph.update(frame_from='a', frame_to='b',
+                     matrix=tf.random_rotation_matrix())
+        assert hash(graph) != hashed
+        cache = graph._cache.cache
+        # values outside of the subtree should be kept
+        assert cache['world_transforms'] is world
+        assert ('world', 'd') in cache
+        assert ('a', 'd') in cache
+        # and paths through the moved edge should be dropped
+        assert ('world', 'c') not in cache
+        assert ('d', 'c') not in cache
+
+        # everything should match a graph built from scratch
+        fresh = graph.copy()
+        assert hash(fresh) == hash(graph)
+        assert g.np.allclose(fresh.world_transforms, world)
+        for u in ['world', 'a', 'b', 'c', 'd']:
+            for v in ['world', 'a', 'b', 'c', 'd']:
+                assert g.np.allclose(graph.get(v, u)[0],
+                                     fresh.get(v, u)[0])
+
+        # the hash shouldn't depend on the order edges are added
+        edges = graph.to_edgelist()
+        other = g.trimesh.scene.transforms.SceneGraph()
+        other.from_edgelist(edges[::-1])
+        assert hash(other) == hash(graph)
+
+        # changing the geometry should clear everything
+        graph.update(frame_from='b', frame_to='c',
+                     matrix=graph.get('c', 'b')[0], geometry='other')
+        assert ('world', 'd') not in graph._cache
+
+    def test_added(self):
+        tf = g.trimesh.transformations
+        graph = g.trimesh.scene.transforms.SceneGraph()
+        graph.update(frame_to='n0', matrix=tf.random_rotation_matrix())
+        graph.world_transforms
+        graph.get('n0')
+        for i in range(1, 100):
+            # build a tree while querying it
+            graph.update(frame_from='n{}'.format((i - 1) // 2),
+                         frame_to='n{}'.format(i),
+                         matrix=tf.random_rotation_matrix(),
+                         geometry='mesh')
+            graph.get('n{}'.format(i))
+            cache = graph._cache.cache
+            # transforms of existing nodes should be kept
+            assert ('world', 'n{}'.format((i - 1) // 2)) in cache
+            # and nothing should be computed for every node
+            assert 'world_transforms' not in cache
+            assert '_topology' not in cache
+            assert len(graph.nodes_geometry) == i
+
+        # everything should match a graph built from scratch
+        fresh = graph.copy()
+        world = fresh.get_world(['n{}'.format(i) for i in range(100)])
+        for i in range(100):
+            assert g.np.allclose(graph.get('n{}'.format(i))[0], world[i])
+            assert g.np.allclose(graph.get('n{}'.format(i), 'n1')[0],
+                                 fresh.get('n{}'.format(i), 'n1')[0])
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
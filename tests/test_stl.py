@@ -124,6 +124,31 @@ class STLTests(g.unittest.TestCase):
         m = g.get_mesh('ascii.stl.zip', force='mesh')
         assert m.is_watertight
 
+    def test_mmap(self):
+        path = g.os.path.join(g.dir_models, 'featuretype.STL')
+        m = g.trimesh.load(path, process=False)
+        mapped = g.trimesh.load(path, mmap=True)
+        # vertices should not have been merged
+        assert mapped.vertices.shape == (len(m.faces) * 3, 3)
+        assert g.np.allclose(mapped.triangles, m.triangles)
+        assert g.np.allclose(
+            mapped.face_attributes['stl'], m.face_attributes['stl'])
+        # merging can still be asked for
+        mapped.merge_vertices()
+        processed = g.trimesh.load(path)
+        assert mapped.vertices.shape == processed.vertices.shape
+        assert g.np.isclose(mapped.volume, processed.volume)
+
+        # explicitly passed process should be respected
+        assert g.trimesh.load(path, mmap=True, process=True).vertices.shape == (
+            processed.vertices.shape)
+
+        # file objects which can't be mapped should still load
+        with open(path, 'rb') as f:
+            data = g.trimesh.util.wrap_as_stream(f.read())
+        streamed = g.trimesh.load(data, file_type='stl', mmap=True)
+        assert g.np.allclose(streamed.triangles, m.triangles)
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
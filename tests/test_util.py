@@ -418,6 +418,26 @@ class ArrayToString(unittest.TestCase):
         with self.assertRaises(ValueError):
             g.trimesh.util.array_to_string(np.array([[[1, 2, 3], [4, 5, 6]]]))
 
+    def test_chunks(self):
+        util = g.trimesh.util
+        for array in [g.random((100, 3)),
+                      g.random(100),
+                      np.arange(300).reshape((-1, 3))]:
+            for kwargs in [{},
+                           {'value_format': '{}/{}'},
+                           {'value_format': '{:.2f}'},
+                           {'col_delim': '%', 'row_delim': '\nv '}]:
+                # chunks should combine to the whole string
+                chunks = list(util.array_to_string_chunks(
+                    array, count=7, **kwargs))
+                assert len(chunks) == int(g.np.ceil(len(array) / 7.0))
+                assert ''.join(chunks) == util.array_to_string(
+                    array, **kwargs)
+        self.assertEqual(
+            util.array_to_string(
+                np.array([[1, 2], [3, 4]]), col_delim='%', row_delim='%%'),
+            '1%2%%3%4')
+
 
 class StructuredArrayToString(unittest.TestCase):
 
@@ -490,6 +510,18 @@ class StructuredArrayToString(unittest.TestCase):
             '1 1.10000000\n2 2.20000000'
         )
 
+    def test_chunks(self):
+        array = np.zeros(
+            100, dtype=[('some_int', np.int64), ('some_float', np.float64, 2)])
+        array['some_int'] = np.arange(100)
+        array['some_float'] = g.random((100, 2))
+        chunks = list(g.trimesh.util.structured_array_to_string_chunks(
+            array, count=30))
+        assert len(chunks) == 4
+        assert ''.join(chunks) == g.trimesh.util.structured_array_to_string(
+            array)
+        assert chunks[0].startswith('0 0.')
+
     def test_raises_if_array_is_unstructured(self):
         with self.assertRaises(ValueError):
             g.trimesh.util.structured_array_to_string(np.ndarray([1, 2, 3]))
@@ -0,0 +1,76 @@
+try:
+    from . import generic as g
+except BaseException:
+    import generic as g
+
+
+class WindingTest(g.unittest.TestCase):
+
+    def test_solid_angle(self):
+        # the center of a cube sees all 12 triangles equally
+        box = g.trimesh.creation.box()
+        angle = g.trimesh.winding.solid_angle(
+            box.triangles, g.np.zeros((len(box.faces), 3)))
+        assert g.np.allclose(angle, 4 * g.np.pi / 12)
+
+    def test_contains(self):
+        for name in ['featuretype.STL', 'soup.stl']:
+            mesh = g.get_mesh(name)
+            # use normals computed from the triangles
+            mesh = g.trimesh.Trimesh(mesh.vertices, mesh.faces)
+            points = (g.random((1000, 3)) * mesh.extents * 1.2 +
+                      mesh.bounds[0] - mesh.extents * 0.1)
+
+            winding = mesh.nearest.winding_number(points)
+            # check against evaluating every triangle directly
+            exact = g.np.array([g.trimesh.winding.solid_angle(
+                mesh.triangles, g.np.tile(p, (len(mesh.faces), 1))).sum()
+                for p in points[:20]]) / (4 * g.np.pi)
+            assert g.np.allclose(winding[:20], exact, atol=0.05)
+
+            if mesh.is_watertight:
+                # should agree with rays for a clean mesh
+                truth = mesh.contains(points)
+                check = mesh.contains(points, method='winding')
+                assert (truth == check).all()
+
+                # remove some faces and it should still work
+                broken = mesh.copy()
+                broken.update_faces(g.np.arange(len(broken.faces))[10:])
+                assert not broken.is_watertight
+                holes = broken.contains(points, method='winding')
+                assert (truth == holes).mean() > 0.99
+
+                ray = mesh.nearest.signed_distance(points)
+                wind = mesh.nearest.signed_distance(
+                    points, method='winding')
+                assert g.np.allclose(ray, wind)
+
+    def test_cache(self):
+        mesh = g.trimesh.creation.icosphere()
+        engine = mesh.nearest._winding
+
+        def hashed():
+            raise AssertionError('checking cache hashed mesh!')
+
+        # checking the cache shouldn't need to hash the mesh
+        mesh._data.__hash__ = hashed
+        assert mesh.nearest._winding is engine
+        assert g.np.allclose(
+            mesh.nearest.winding_number([[0, 0, 0]]), 1.0, atol=0.05)
+        del mesh._data.__hash__
+
+        # changing the mesh should create a new engine
+        mesh.vertices += [5.0, 0, 0]
+        assert mesh.nearest._winding is not engine
+        assert g.np.allclose(
+            mesh.nearest.winding_number([[0, 0, 0]]), 0.0, atol=0.05)
+
+    def test_empty(self):
+        engine = g.trimesh.winding.WindingNumber(g.np.zeros((0, 3, 3)))
+        assert g.np.allclose(engine.winding_number([[0, 0, 0]]), 0.0)
+
+
+if __name__ == '__main__':
+    g.trimesh.util.attach_to_log()
+    g.unittest.main()
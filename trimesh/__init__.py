@@ -27,6 +27,7 @@ from .constants import tol
 from .exchange.load import (
     load,
     load_mesh,
+    load_many,
     load_path,
     load_remote,
     available_formats)
@@ -63,6 +64,7 @@ __all__ = [__version__,
            'path',
            'load',
            'load_mesh',
+           'load_many',
            'load_path',
            'load_remote',
            'primitives',
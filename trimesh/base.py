@@ -5,6 +5,7 @@ github.com/mikedh/trimesh
 Library for importing, exporting and doing simple operations on triangular meshes.
 """
 
+from . import bvh
 from . import ray
 from . import util
 from . import units
@@ -110,10 +111,13 @@ class Trimesh(Geometry3D):
         # self._cache stores information about the mesh which CAN be
         # regenerated from self._data, but may be slow to calculate.
         # In order to maintain consistency
-        # the cache is cleared when self._data.crc() changes
+        # the cache is cleared when self._data.version() changes
+        # values which declare their dependencies are only cleared
+        # when the data they were computed from has changed
         self._cache = caching.Cache(
-            id_function=self._data.__hash__,
-            force_immutable=True)
+            id_function=self._data.version,
+            force_immutable=True,
+            key_function=self._data.versions)
         self._cache.update(initial_cache)
 
         # check for None only to avoid warning messages in subclasses
@@ -786,14 +790,14 @@ class Trimesh(Geometry3D):
     @caching.cache_decorator
     def triangles_tree(self):
         """
-        An R-tree containing each face of the mesh.
+        A bounding volume hierarchy containing each face of the mesh.
 
         Returns
         ----------
-        tree : rtree.index
+        tree : trimesh.bvh.BVH
           Each triangle in self.faces has a rectangular cell
         """
-        tree = triangles.bounds_tree(self.triangles)
+        tree = bvh.triangles_bvh(self.triangles)
         return tree
 
     @caching.cache_decorator
@@ -822,7 +826,7 @@ class Trimesh(Geometry3D):
         crosses = triangles.cross(self.triangles)
         return crosses
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def edges(self):
         """
         Edges of the mesh (derived from faces).
@@ -837,7 +841,7 @@ class Trimesh(Geometry3D):
         self._cache['edges_face'] = index
         return edges
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def edges_face(self):
         """
         Which face does each edge belong to.
@@ -850,7 +854,7 @@ class Trimesh(Geometry3D):
         _ = self.edges
         return self._cache['edges_face']
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def edges_unique(self):
         """
         The unique edges of the mesh.
@@ -882,7 +886,7 @@ class Trimesh(Geometry3D):
         length = util.row_norm(vector)
         return length
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def edges_unique_inverse(self):
         """
         Return the inverse required to reproduce
@@ -899,7 +903,7 @@ class Trimesh(Geometry3D):
         _ = self.edges_unique
         return self._cache['edges_unique_inverse']
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def edges_sorted(self):
         """
         Edges sorted along axis 1
@@ -961,7 +965,7 @@ class Trimesh(Geometry3D):
         self._cache['vertices_component_label'] = labels
         return count
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def faces_unique_edges(self):
         """
         For each face return which indexes in mesh.unique_edges constructs
@@ -1269,7 +1273,7 @@ class Trimesh(Geometry3D):
         """
         return graph.split(self, **kwargs)
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def face_adjacency(self):
         """
         Find faces that share an edge i.e. 'adjacent' faces.
@@ -1322,7 +1326,7 @@ class Trimesh(Geometry3D):
         """
         return graph.face_neighborhood(self)
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def face_adjacency_edges(self):
         """
         Returns the edges that are shared by the adjacent faces.
@@ -1399,7 +1403,7 @@ class Trimesh(Geometry3D):
         are_convex = self.face_adjacency_projections < tol.merge
         return are_convex
 
-    @caching.cache_decorator
+    @caching.cache_decorator(depends=('faces',))
     def face_adjacency_unshared(self):
         """
         Return the vertex index of the two vertices not in the shared
@@ -2868,7 +2872,7 @@ class Trimesh(Geometry3D):
                                       engine=engine, **kwargs)
         return result
 
-    def contains(self, points):
+    def contains(self, points, method='ray'):
         """
         Given an array of points determine whether or not they
         are inside the mesh. This raises an error if called on a
@@ -2878,12 +2882,20 @@ class Trimesh(Geometry3D):
         ------------
         points : (n, 3) float
           Points in cartesian space
+        method : str
+          'ray' casts rays against the mesh, 'winding' uses the
+          generalized winding number which is robust to holes
+          and other defects in non-watertight meshes
 
         Returns
         ---------
         contains : (n, ) bool
           Whether or not each point is inside the mesh
         """
+        if method == 'winding':
+            return self.nearest.winding_number(points) > 0.5
+        elif method != 'ray':
+            raise ValueError('method must be `ray` or `winding`!')
         return self.ray.contains_points(points)
 
     @caching.cache_decorator
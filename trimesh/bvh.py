@@ -0,0 +1,522 @@
+"""
+bvh.py
+------------
+
+A flat, array- backed bounding volume hierarchy.
+
+Nodes are stored as a complete binary tree in contiguous arrays
+so that traversal for many queries can be done level- by- level
+with vectorized numpy operations rather than a Python loop per query.
+"""
+import numpy as np
+
+from . import util
+
+
+class BVH(object):
+    """
+    A bounding volume hierarchy built with median splits
+    over the centers of axis aligned bounding boxes.
+
+    The tree is complete and stored in heap order: node `i`
+    has children `2 * i + 1` and `2 * i + 2` and every leaf
+    is at the same depth, which means every node at a given
+    level of the tree can be tested in one vectorized operation.
+    """
+
+    def __init__(self, bounds, leaf_size=8):
+        """
+        Build a hierarchy from axis aligned bounding boxes.
+
+        Parameters
+        ------------
+        bounds : (n, 2, D) or (n, 2D) float
+          Non-interleaved bounds where D=dimension
+          E.G a 2D bounds tree:
+          [(minx, miny, maxx, maxy), ...]
+        leaf_size : int
+          Target maximum number of boxes per leaf
+        """
+        bounds = np.array(bounds, dtype=np.float64)
+        if len(bounds.shape) == 2 and bounds.shape[1] % 2 == 0:
+            bounds = bounds.reshape((len(bounds), 2, -1))
+        if len(bounds.shape) != 3 or bounds.shape[1] != 2:
+            raise ValueError('bounds must be (n, 2, dimension)!')
+
+        count = len(bounds)
+        leaf_size = max(int(leaf_size), 1)
+
+        # number of levels below the root: pick the
+        # smallest complete tree with no overfull leaves
+        # while never creating more leaves than boxes
+        if count > leaf_size:
+            depth = int(np.ceil(np.log2(float(count) / leaf_size)))
+            depth = min(depth, int(np.floor(np.log2(count))))
+        else:
+            depth = 0
+
+        # the order of boxes after sorting into leaves
+        order = np.arange(count)
+        center = bounds.mean(axis=1)
+        for level in range(depth):
+            start = _level_start(count, level)
+            # which node at this level each box is in
+            node = np.repeat(np.arange(len(start) - 1), np.diff(start))
+            current = center[order]
+            # split on the longest axis of the box centers
+            extent = (np.maximum.reduceat(current, start[:-1], axis=0) -
+                      np.minimum.reduceat(current, start[:-1], axis=0))
+            key = current[np.arange(count), extent.argmax(axis=1)[node]]
+            # the node index is already sorted so this only
+            # permutes boxes inside of the range of each node
+            order = order[np.lexsort((key, node))]
+
+        self.depth = depth
+        self.leaf_size = leaf_size
+        # the index of the original box for each sorted box
+        self.order = order
+        # the bounds of each box in sorted order
+        self.primitive_bounds = bounds[order]
+        # the range of sorted boxes contained by each leaf
+        self.leaf_start = _level_start(count, depth)
+        # the bounds of every node in heap order
+        self.node_bounds = self._node_bounds()
+
+    def _node_bounds(self):
+        """
+        Compute the bounds of every node from the leaves up.
+
+        Returns
+        -----------
+        node_bounds : (2 ** (depth + 1) - 1, 2, D) float
+          Axis aligned bounds of each node in heap order
+        """
+        dimension = self.primitive_bounds.shape[2]
+        if len(self.order) == 0:
+            return np.zeros((0, 2, dimension), dtype=np.float64)
+
+        leaf_count = 2 ** self.depth
+        result = np.zeros((leaf_count * 2 - 1, 2, dimension),
+                          dtype=np.float64)
+        starts = self.leaf_start[:-1]
+        # leaves are the last level of the heap
+        result[leaf_count - 1:, 0] = np.minimum.reduceat(
+            self.primitive_bounds[:, 0], starts, axis=0)
+        result[leaf_count - 1:, 1] = np.maximum.reduceat(
+            self.primitive_bounds[:, 1], starts, axis=0)
+        # combine pairs of children to get each parent level
+        for level in range(self.depth - 1, -1, -1):
+            lo, hi = 2 ** level - 1, 2 ** (level + 1) - 1
+            child = result[2 * lo + 1: 2 * hi + 1]
+            result[lo:hi, 0] = np.minimum(child[0::2, 0], child[1::2, 0])
+            result[lo:hi, 1] = np.maximum(child[0::2, 1], child[1::2, 1])
+        return result
+
+    def refit(self, bounds):
+        """
+        Replace the bounds of every box while keeping the
+        structure of the tree, which is much faster than
+        building a new tree but queries may be slower if
+        the boxes have moved a lot.
+
+        Parameters
+        ------------
+        bounds : (n, 2, D) or (n, 2D) float
+          New bounds for every box in the original order
+        """
+        bounds = np.array(bounds, dtype=np.float64)
+        bounds = bounds.reshape((len(bounds), 2, -1))
+        if bounds.shape != self.primitive_bounds.shape:
+            raise ValueError('bounds must match the original boxes!')
+        self.primitive_bounds = bounds[self.order]
+        self.node_bounds = self._node_bounds()
+
+    @property
+    def bounds(self):
+        """
+        The axis aligned bounds of every box in the tree.
+
+        Returns
+        -----------
+        bounds : (2, D) float
+          Minimum and maximum of the root node
+        """
+        if len(self.node_bounds) == 0:
+            return None
+        return self.node_bounds[0].copy()
+
+    def __len__(self):
+        return len(self.order)
+
+    def leaf_primitives(self, leaf):
+        """
+        Expand leaf indexes into the sorted boxes they contain.
+
+        Parameters
+        ------------
+        leaf : (p,) int
+          Index of leaves, not nodes
+
+        Returns
+        -----------
+        repeat : (q,) int
+          Index of `leaf` each box came from
+        sorted_index : (q,) int
+          Index of `self.primitive_bounds`
+        """
+        start = self.leaf_start[leaf]
+        counts = self.leaf_start[leaf + 1] - start
+        repeat = np.repeat(np.arange(len(leaf)), counts)
+        # offset within each leaf for every box
+        offset = np.arange(len(repeat)) - np.repeat(
+            np.cumsum(counts) - counts, counts)
+        return repeat, start[repeat] + offset
+
+    def traverse(self, count, check):
+        """
+        Walk every query through the tree at the same time.
+
+        Parameters
+        ------------
+        count : int
+          Number of queries
+        check : function
+          Takes `(query_index, bounds)` where bounds is
+          (p, 2, D) and returns a (p,) bool of which
+          pairs of query and box should be kept.
+
+        Returns
+        -----------
+        query_index : (h,) int
+          Index of query, sorted
+        primitive_index : (h,) int
+          Index of the original box passing `check`
+        """
+        if count == 0 or len(self.order) == 0:
+            return (np.array([], dtype=np.int64),
+                    np.array([], dtype=np.int64))
+
+        query = np.arange(count, dtype=np.int64)
+        node = np.zeros(count, dtype=np.int64)
+        for level in range(self.depth + 1):
+            ok = check(query, self.node_bounds[node])
+            query, node = query[ok], node[ok]
+            if level < self.depth:
+                # replace every node with its two children
+                query = np.repeat(query, 2)
+                node = (node.reshape((-1, 1)) * 2 +
+                        [1, 2]).ravel()
+
+        # convert node index into leaf index
+        repeat, index = self.leaf_primitives(
+            node - (2 ** self.depth - 1))
+        query = query[repeat]
+        # do the final check against the individual boxes
+        ok = check(query, self.primitive_bounds[index])
+
+        return query[ok], self.order[index[ok]]
+
+    def query_bounds(self, bounds):
+        """
+        Find every box in the tree that overlaps each
+        of a set of query boxes.
+
+        Parameters
+        ------------
+        bounds : (m, 2, D) or (m, 2D) float
+          Query bounding boxes
+
+        Returns
+        -----------
+        query_index : (h,) int
+          Index of query box, sorted
+        primitive_index : (h,) int
+          Index of box in tree which overlaps query
+        """
+        bounds = np.asanyarray(bounds, dtype=np.float64)
+        bounds = bounds.reshape((len(bounds), 2, -1))
+
+        def check(query, node):
+            # inclusive overlap test
+            return np.logical_and(
+                (bounds[query, 0] <= node[:, 1]).all(axis=1),
+                (bounds[query, 1] >= node[:, 0]).all(axis=1))
+
+        return self.traverse(len(bounds), check)
+
+    def query_rays(self, origins, directions, buffer_dist=1e-5):
+        """
+        Find every box in the tree that each ray passes through
+        using a slab test against every node level- by- level.
+
+        Parameters
+        ------------
+        origins : (m, D) float
+          Ray origin points
+        directions : (m, D) float
+          Ray direction vectors
+        buffer_dist : float
+          Distance to pad boxes so rays lying exactly on
+          a face of a zero- width box are still included
+
+        Returns
+        -----------
+        query_index : (h,) int
+          Index of ray, sorted
+        primitive_index : (h,) int
+          Index of box in tree the ray passes through
+        """
+        origins = np.asanyarray(origins, dtype=np.float64)
+        directions = np.asanyarray(directions, dtype=np.float64)
+        with np.errstate(divide='ignore'):
+            inverse = 1.0 / directions
+
+        def check(query, node):
+            origin = origins[query]
+            scale = inverse[query]
+            with np.errstate(invalid='ignore'):
+                a = (node[:, 0] - buffer_dist - origin) * scale
+                b = (node[:, 1] + buffer_dist - origin) * scale
+            # distance along the ray entering and leaving the box
+            # where NaN from zero directions is ignored by fmin/fmax
+            enter = np.fmin(a, b).max(axis=1)
+            exit = np.fmax(a, b).min(axis=1)
+            # only include boxes in front of the ray origin
+            return exit >= np.maximum(enter, 0.0)
+
+        return self.traverse(len(origins), check)
+
+    def query_points(self, points, radius):
+        """
+        Find every box in the tree that is within a distance
+        of each query point.
+
+        Parameters
+        ------------
+        points : (m, D) float
+          Query points
+        radius : float or (m,) float
+          Maximum distance from each point to a box
+
+        Returns
+        -----------
+        query_index : (h,) int
+          Index of point, sorted
+        primitive_index : (h,) int
+          Index of box in tree within radius of the point
+        """
+        points = np.asanyarray(points, dtype=np.float64)
+        radius = np.broadcast_to(
+            np.asanyarray(radius, dtype=np.float64), (len(points),))
+        radius_sq = radius ** 2
+
+        def check(query, node):
+            return distance_sq(points[query], node) <= radius_sq[query]
+
+        return self.traverse(len(points), check)
+
+    def query_nearest(self, points, radius=None, pad=0.0):
+        """
+        Find every box in the tree which may contain the closest
+        primitive to each query point with a branch- and- bound
+        search: the upper bound for each point is tightened at
+        every level by the farthest distance to any box it is
+        still considering, since any primitive in a box is at
+        most that far away, and boxes which are farther than the
+        bound are pruned along with all of their children.
+
+        Parameters
+        ------------
+        points : (m, D) float
+          Query points
+        radius : None or (m,) float
+          An initial upper bound on the distance to the
+          nearest primitive for each point
+        pad : float
+          Also return boxes within this distance of the bound
+
+        Returns
+        -----------
+        query_index : (h,) int
+          Index of point, sorted
+        primitive_index : (h,) int
+          Index of box in tree which may be nearest
+        """
+        points = np.asanyarray(points, dtype=np.float64)
+        if radius is None:
+            bound = np.full(len(points), np.inf)
+        else:
+            bound = np.array(radius, dtype=np.float64).reshape(-1) ** 2
+
+        def check(query, node):
+            if len(query) == 0:
+                return np.zeros(0, dtype=bool)
+            current = points[query]
+            # query is sorted so find where each one starts
+            start = np.concatenate(
+                ([0], np.nonzero(np.diff(query))[0] + 1))
+            unique = query[start]
+            bound[unique] = np.minimum(
+                bound[unique],
+                np.minimum.reduceat(farthest_sq(current, node), start))
+            # keep boxes which are closer than the bound
+            return distance_sq(current, node) <= (
+                np.sqrt(bound[query]) + pad) ** 2
+
+        return self.traverse(len(points), check)
+
+    def nearest_leaf(self, points):
+        """
+        Greedily descend the tree for each point by picking the
+        child with the closest box, which finds a leaf with boxes
+        that are probably, but not necessarily, the nearest.
+
+        This is used to get a tight initial upper bound on the
+        distance to the nearest primitive for each point.
+
+        Parameters
+        ------------
+        points : (m, D) float
+          Query points
+
+        Returns
+        -----------
+        query_index : (h,) int
+          Index of point, sorted
+        primitive_index : (h,) int
+          Index of box in the leaf found for the point
+        """
+        points = np.asanyarray(points, dtype=np.float64)
+        if len(points) == 0 or len(self.order) == 0:
+            return (np.array([], dtype=np.int64),
+                    np.array([], dtype=np.int64))
+
+        node = np.zeros(len(points), dtype=np.int64)
+        arange = np.arange(len(points))
+        for level in range(self.depth):
+            child = node.reshape((-1, 1)) * 2 + [1, 2]
+            distance = distance_sq(
+                points.reshape((-1, 1, points.shape[1])),
+                self.node_bounds[child])
+            node = child[arange, distance.argmin(axis=1)]
+
+        query, index = self.leaf_primitives(
+            node - (2 ** self.depth - 1))
+        return query, self.order[index]
+
+    def intersection(self, coordinates, objects=False):
+        """
+        Find the boxes in the tree that overlap a single box,
+        with the same signature as `rtree.index.Index.intersection`.
+
+        Parameters
+        ------------
+        coordinates : (2D,) or (D,) float
+          Interleaved bounds or a single point
+        objects : bool
+          Included for compatibility, must be False
+
+        Returns
+        -----------
+        index : (h,) int
+          Index of boxes that overlap query
+        """
+        if objects:
+            raise ValueError('BVH does not store objects!')
+        coordinates = np.asanyarray(coordinates, dtype=np.float64)
+        dimension = self.primitive_bounds.shape[2]
+        if coordinates.size == dimension:
+            coordinates = np.tile(coordinates.ravel(), 2)
+        return self.query_bounds(coordinates.reshape((1, 2, -1)))[1]
+
+
+def distance_sq(points, bounds):
+    """
+    Find the squared distance from points to axis aligned
+    boxes, where points inside a box have zero distance.
+
+    Parameters
+    ------------
+    points : (..., D) float
+      Points in space
+    bounds : (..., 2, D) float
+      Axis aligned bounding boxes
+
+    Returns
+    -----------
+    distance_sq : (...) float
+      Squared distance from each point to each box
+    """
+    delta = np.maximum(bounds[..., 0, :] - points,
+                       points - bounds[..., 1, :])
+    np.maximum(delta, 0.0, out=delta)
+    return (delta ** 2).sum(axis=-1)
+
+
+def farthest_sq(points, bounds):
+    """
+    Find the squared distance from points to the farthest
+    point of axis aligned boxes.
+
+    Parameters
+    ------------
+    points : (..., D) float
+      Points in space
+    bounds : (..., 2, D) float
+      Axis aligned bounding boxes
+
+    Returns
+    -----------
+    farthest_sq : (...) float
+      Squared distance from each point to farthest corner of each box
+    """
+    delta = np.maximum(np.abs(bounds[..., 0, :] - points),
+                       np.abs(points - bounds[..., 1, :]))
+    return (delta ** 2).sum(axis=-1)
+
+
+def _level_start(count, level):
+    """
+    Get the index where each node of a level starts in the
+    sorted box array. Splits are nested, so the boundaries
+    of a level are always a superset of the level above.
+
+    Parameters
+    ------------
+    count : int
+      Total number of boxes
+    level : int
+      Level of the tree where zero is the root
+
+    Returns
+    -----------
+    start : (2 ** level + 1,) int
+      Start index of each node, plus `count` at the end
+    """
+    nodes = 2 ** level
+    return (np.arange(nodes + 1, dtype=np.int64) * count) // nodes
+
+
+def triangles_bvh(triangles, leaf_size=8):
+    """
+    Given a list of triangles, create a BVH for broad- phase
+    collision detection.
+
+    Parameters
+    ---------
+    triangles : (n, 3, 3) float
+      Triangles in space
+    leaf_size : int
+      Target maximum number of triangles per leaf
+
+    Returns
+    ---------
+    tree : BVH
+      One box per triangle
+    """
+    triangles = np.asanyarray(triangles, dtype=np.float64)
+    if not util.is_shape(triangles, (-1, 3, 3)):
+        raise ValueError('Triangles must be (n, 3, 3)!')
+    return BVH(np.stack((triangles.min(axis=1),
+                         triangles.max(axis=1)), axis=1),
+               leaf_size=leaf_size)
@@ -20,8 +20,11 @@ In [25]: %timeit xxh3_64_intdigest(d)
 ```
 """
 import os
+import sys
 import time
+import weakref
 import warnings
+import itertools
 import numpy as np
 
 from functools import wraps
@@ -69,6 +72,184 @@ except BaseException:
         hash_fast = hash_fallback
 
 
+# an increasing counter shared by every cache so the least
+# recently used values can be compared between caches
+_tick = itertools.count()
+# every cache object, used to enforce the total budget
+_caches = weakref.WeakSet()
+# caches which stored values while no budget was set so
+# their values haven't been measured yet
+_unmeasured = weakref.WeakSet()
+# the approximate bytes stored in every cache combined, kept
+# as a running total so checking the budget doesn't visit
+# every cache
+_total_bytes = 0
+# an increasing counter for versions of tracked arrays so
+# a version is never reused by a different array
+_versions = itertools.count()
+
+
+class CacheBudget(object):
+    """
+    Memory budgets in bytes for values stored in `Cache`
+    objects. When a budget is exceeded the least recently
+    used values are evicted.
+
+    Attributes
+    ------------
+    cache : None or int
+      Default budget for each cache, None is unlimited
+    total : None or int
+      Budget for every cache in the process combined
+    """
+
+    def __init__(self, cache=None, total=None):
+        self.cache = cache
+        self.total = total
+
+
+# the process-wide budget which caches check when storing
+budget = CacheBudget()
+
+
+def nbytes(value, _seen=None):
+    """
+    Estimate how much memory a cached value is using.
+
+    Arrays report the size of their buffer, containers
+    and objects report the sum of their contents. Other
+    geometry referenced by a value is not included.
+
+    Parameters
+    ------------
+    value : any
+      Value stored in a cache
+
+    Returns
+    ------------
+    size : int
+      Approximate size of value in bytes
+    """
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if (len(_seen) > 1 and hasattr(value, '_data') and
+            hasattr(value, '_cache')):
+        # other geometry like the mesh a ray object references
+        # is owned and accounted for by its own cache
+        return 0
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(nbytes(k, _seen) + nbytes(v, _seen)
+                          for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(nbytes(v, _seen) for v in value)
+    if isinstance(value, Cache):
+        return size + sum(nbytes(v, _seen) for v in value.cache.values())
+    if hasattr(value, '__dict__'):
+        return size + nbytes(vars(value), _seen)
+    # extension types like `scipy.spatial.cKDTree` don't
+    # have a `__dict__` but expose their arrays
+    for name in ('data', 'indices'):
+        attr = getattr(value, name, None)
+        if isinstance(attr, np.ndarray):
+            size += nbytes(attr, _seen)
+    return size
+
+
+def evict(max_bytes, keep=None):
+    """
+    Evict the least recently used values from every cache
+    in the process until they use less than a budget.
+
+    Parameters
+    ------------
+    max_bytes : int
+      Budget for all caches combined
+    keep : None or (Cache, set)
+      Keys in a cache which should not be evicted
+
+    Returns
+    ------------
+    removed : int
+      Number of values evicted
+    """
+    # values are only measured once a budget is enforced
+    for cache in list(_unmeasured):
+        cache._measure()
+    _unmeasured.clear()
+    if _total_bytes <= max_bytes:
+        return 0
+    entries = []
+    for cache in list(_caches):
+        for key in list(cache.cache.keys()):
+            entries.append((cache._used.get(key, -1),
+                            cache._size(key), key, cache))
+    total = sum(e[1] for e in entries)
+    if total <= max_bytes:
+        return 0
+    entries.sort(key=lambda e: e[0])
+
+    removed = 0
+    for _, _, key, cache in entries:
+        if total <= max_bytes:
+            break
+        if key not in cache.cache:
+            # already evicted along with its group
+            continue
+        group = cache._group(key)
+        if (keep is not None and cache is keep[0] and
+                not keep[1].isdisjoint(group)):
+            continue
+        size = cache._bytes[0]
+        for k in group:
+            cache._remove(k)
+        total -= size - cache._bytes[0]
+        cache.stats['evictions'] += len(group)
+        removed += len(group)
+    return removed
+
+
+def _release(held):
+    """
+    Remove the bytes of a collected cache from the total.
+
+    Parameters
+    ------------
+    held : (1,) list
+      Bytes the cache was storing
+    """
+    global _total_bytes
+    _total_bytes -= held[0]
+    held[0] = 0
+
+
+def stats():
+    """
+    Get statistics summed over every cache in the process.
+
+    Returns
+    ------------
+    stats : dict
+      Counts of `hits`, `misses`, `evictions` and stored
+      values, and the approximate `nbytes` stored
+    """
+    result = {'hits': 0, 'misses': 0, 'evictions': 0,
+              'count': 0, 'nbytes': 0}
+    for cache in list(_caches):
+        for k, v in cache.stats.items():
+            result[k] += v
+        result['count'] += len(cache.cache)
+        result['nbytes'] += cache.nbytes
+    return result
+
+
 def tracked_array(array, dtype=None):
     """
     Properly subclass a numpy ndarray to track changes.
@@ -100,7 +281,7 @@ def tracked_array(array, dtype=None):
     return tracked
 
 
-def cache_decorator(function):
+def cache_decorator(function=None, depends=None):
     """
     A decorator for class methods, replaces @property
     but will store and retrieve function return values
@@ -115,7 +296,21 @@ def cache_decorator(function):
       def foo(self, things):
         return 'happy days'
       ```
+    depends : None or sequence of str
+      Keys of the data the value is computed from. If
+      passed, the value is only cleared from the cache
+      when one of these keys changes:
+      ```
+      @cache_decorator(depends=('faces',))
+      def edges(self):
+        return faces_to_edges(self.faces)
+      ```
     """
+    if function is None:
+        # called with arguments like `@cache_decorator(depends=...)`
+        return lambda f: cache_decorator(f, depends=depends)
+    if depends is not None:
+        depends = frozenset(depends)
 
     # use wraps to preserve docstring
     @wraps(function)
@@ -134,15 +329,42 @@ def cache_decorator(function):
         # since we already called cache.verify manually
         if name in self._cache.cache:
             # already stored so return value
+            self._cache.stats['hits'] += 1
+            self._cache._used[name] = next(_tick)
             return self._cache.cache[name]
+        self._cache.stats['misses'] += 1
+        # keys already in the cache before evaluating
+        before = set(self._cache.cache.keys())
         # value not in cache so execute the function
-        value = function(*args, **kwargs)
+        # tracking depth so nothing is evicted until
+        # the outermost cached value is finished
+        self._cache._depth += 1
+        try:
+            value = function(*args, **kwargs)
+        finally:
+            self._cache._depth -= 1
         # store the value
         if self._cache.force_immutable and hasattr(
                 value, 'flags') and len(value.shape) > 0:
             value.flags.writeable = False
 
         self._cache.cache[name] = value
+        # record what this value depends on: any values the
+        # function stored directly in the cache were computed
+        # from the same data so they get the same dependencies
+        self._cache.depends[name] = depends
+        added = set(self._cache.cache.keys()).difference(before)
+        for key in added:
+            if key not in self._cache.depends:
+                self._cache.depends[key] = depends
+        if len(added) > 1:
+            # values stored as a side effect are only valid
+            # alongside this one so they're evicted together
+            group = frozenset(added)
+            for key in added:
+                self._cache._groups[key] = group
+        # keep values stored as a side effect with this one
+        self._cache._stored(added)
 
         return value
 
@@ -157,16 +379,21 @@ class TrackedArray(np.ndarray):
     Subclass of numpy.ndarray that provides hash methods
     to track changes.
 
-    General method is to aggressively set 'modified' flags
-    on operations which might (but don't necessarily) alter
-    the array, ideally we sometimes compute hashes when we
-    don't need to, but we don't return wrong hashes ever.
+    General method is to bump a version counter on operations
+    which might (but don't necessarily) alter the array, so
+    we sometimes compute hashes when we don't need to, but
+    we don't return wrong hashes ever.
 
-    We store boolean modified flag for each hash type to
-    make checks fast even for queries of different hashes.
+    Views share the version counter of the array they were
+    created from so altering a view bumps the version of
+    every array that shares its memory. Checking if an array
+    has changed is then a comparison of integers and content
+    is only hashed when a hash is requested.
 
     Methods
     ----------
+    version : int
+      Changes every time the array might have been altered
     __hash__ : int
       Runs the fastest available hash in this order:
         `xxh3_64, xxh_64, blake2b, sha256`
@@ -174,32 +401,60 @@ class TrackedArray(np.ndarray):
 
     def __array_finalize__(self, obj):
         """
-        Sets a modified flag on every TrackedArray
-        This flag will be set on every change as well as
-        during copies and certain types of slicing.
+        Sets a version counter on every TrackedArray,
+        sharing it with the source array for views.
+        """
+        if (isinstance(obj, TrackedArray) and self.base is not None and
+                np.may_share_memory(self, obj)):
+            # this may be a view so share the version of the
+            # source: this is conservative as a copy sharing
+            # a counter only results in extra work
+            self._version = obj._version
+        else:
+            # a list so it can be shared between views
+            self._version = [next(_versions)]
+
+    @property
+    def version(self):
         """
+        A number which changes every time the array or
+        an array sharing memory with it is altered.
 
-        self._dirty_hash = True
-        if isinstance(obj, type(self)):
-            obj._dirty_hash = True
+        Returns
+        ------------
+        version : int
+          Current version of the array
+        """
+        return self._version[0]
 
     def __array_wrap__(self, out_arr, context=None):
         """
         Return a numpy scalar if array is 0d.
         See https://github.com/numpy/numpy/issues/5819
         """
+        if out_arr is self:
+            # a ufunc was called with `out=self`
+            self._version[0] = next(_versions)
         if out_arr.ndim:
             return np.ndarray.__array_wrap__(
                 self, out_arr, context)
         # Match numpy's behavior and return a numpy dtype scalar
         return out_arr[()]
 
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle as a regular numpy array which lets
+        protocol 5 pickle the data out of band.
+        """
+        return tracked_array, (self.view(np.ndarray),)
+
     @property
     def mutable(self):
         return self.flags['WRITEABLE']
 
     @mutable.setter
     def mutable(self, value):
+        self._version[0] = next(_versions)
         self.flags.writeable = value
 
     def hash(self):
@@ -236,7 +491,8 @@ class TrackedArray(np.ndarray):
           A hash of the array contents.
         """
         # repeat the bookkeeping to get a contiguous array
-        if not self._dirty_hash and hasattr(self, '_hashed'):
+        version = self._version[0]
+        if getattr(self, '_hashed_version', None) == version:
             # we have a valid hash without recomputing.
             return self._hashed
 
@@ -249,9 +505,9 @@ class TrackedArray(np.ndarray):
             # t = tracked_array(np.random.random(10))[::-1]
             hashed = hash_fast(np.ascontiguousarray(self))
 
-        # assign the value and set the flag
+        # assign the value and the version it was computed for
         self._hashed = hashed
-        self._dirty_hash = False
+        self._hashed_version = version
 
         return hashed
 
@@ -263,85 +519,97 @@ class TrackedArray(np.ndarray):
         so we better catch all of them.
         """
 
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__iadd__(
             *args, **kwargs)
 
     def __isub__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__isub__(
             *args, **kwargs)
 
     def __imul__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__imul__(
             *args, **kwargs)
 
     def __idiv__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__idiv__(
             *args, **kwargs)
 
     def __itruediv__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__itruediv__(
             *args, **kwargs)
 
     def __imatmul__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__imatmul__(
             *args, **kwargs)
 
     def __ipow__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__ipow__(
             *args, **kwargs)
 
     def __imod__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__imod__(
             *args, **kwargs)
 
     def __ifloordiv__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__ifloordiv__(
             *args, **kwargs)
 
     def __ilshift__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__ilshift__(
             *args, **kwargs)
 
     def __irshift__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__irshift__(
             *args, **kwargs)
 
     def __iand__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__iand__(
             *args, **kwargs)
 
     def __ixor__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__ixor__(
             *args, **kwargs)
 
     def __ior__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         return super(self.__class__, self).__ior__(
             *args, **kwargs)
 
     def __setitem__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         super(self.__class__, self).__setitem__(
             *args, **kwargs)
 
     def __setslice__(self, *args, **kwargs):
-        self._dirty_hash = True
+        self._version[0] = next(_versions)
         super(self.__class__, self).__setslice__(
             *args, **kwargs)
 
+    def fill(self, *args, **kwargs):
+        self._version[0] = next(_versions)
+        super(self.__class__, self).fill(*args, **kwargs)
+
+    def sort(self, *args, **kwargs):
+        self._version[0] = next(_versions)
+        super(self.__class__, self).sort(*args, **kwargs)
+
+    def put(self, *args, **kwargs):
+        self._version[0] = next(_versions)
+        super(self.__class__, self).put(*args, **kwargs)
+
 
 class Cache(object):
     """
@@ -349,7 +617,11 @@ class Cache(object):
     result of an ID function changes.
     """
 
-    def __init__(self, id_function, force_immutable=False):
+    def __init__(self,
+                 id_function,
+                 force_immutable=False,
+                 key_function=None,
+                 max_bytes=None):
         """
         Create a cache object.
 
@@ -359,29 +631,242 @@ class Cache(object):
           Returns hashable value
         force_immutable : bool
           If set will make all numpy arrays read-only
+        key_function : None or function
+          Returns a dict of `{key: hash}` for each item that
+          `id_function` is computed from. If passed, values
+          which declare their dependencies are only cleared
+          when one of those keys has changed.
+        max_bytes : None or int
+          Evict least recently used values when the values
+          stored use more memory than this, if None will use
+          the default from `caching.budget.cache`
         """
         self._id_function = id_function
+        self._key_function = key_function
         # force stored numpy arrays to have flags.writable=False
         self.force_immutable = bool(force_immutable)
         # call the id function for initial value
         self.id_current = self._id_function()
+        # the hash of each key of the data
+        self.key_current = self._keys()
         # a counter for locks
         self._lock = 0
         # actuSal store for data
         self.cache = {}
+        # which data keys each cached value depends on
+        # where None means it depends on everything
+        self.depends = {}
+        # memory budget in bytes
+        self.max_bytes = max_bytes
+        # counts of cache hits, misses and evictions
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        # when each value was last used from `_tick`
+        self._used = {}
+        # keys which were stored by the same cached function
+        # and have to be evicted together
+        self._groups = {}
+        # the `(id, nbytes)` of each value when it was measured
+        self._nbytes = {}
+        # the sum of `_nbytes` in a list so it can be released
+        # from the process-wide total when this is collected
+        self._bytes = [0]
+        weakref.finalize(self, _release, self._bytes)
+        # how many cached functions are currently evaluating
+        self._depth = 0
+        _caches.add(self)
+
+    def _keys(self):
+        """
+        Get the current hash of every key of the data.
+
+        Returns
+        ------------
+        keys : dict or None
+          Hash of each key or None if no key function
+        """
+        if self._key_function is None:
+            return None
+        return self._key_function()
 
     def delete(self, key):
         """
         Remove a key from the cache.
         """
-        if key in self.cache:
-            self.cache.pop(key, None)
+        self._remove(key)
+
+    def _remove(self, key):
+        """
+        Remove a key and its bookkeeping from the cache.
+        """
+        self.cache.pop(key, None)
+        self.depends.pop(key, None)
+        self._used.pop(key, None)
+        self._groups.pop(key, None)
+        stored = self._nbytes.pop(key, None)
+        if stored is not None:
+            self._account(-stored[1])
+
+    def _prune(self):
+        """
+        Drop the bookkeeping of keys which are no longer
+        in the cache and update the running total.
+        """
+        cache = self.cache
+        self._used = {k: v for k, v in self._used.items()
+                      if k in cache}
+        self._groups = {k: v for k, v in self._groups.items()
+                        if k in cache}
+        self._nbytes = {k: v for k, v in self._nbytes.items()
+                        if k in cache}
+        self._account(sum(v[1] for v in self._nbytes.values()) -
+                      self._bytes[0])
+
+    def _group(self, key):
+        """
+        Get a key and every stored key which was computed
+        alongside it, which have to be evicted together.
+
+        Parameters
+        ------------
+        key : hashable
+          Key in the cache
+
+        Returns
+        ------------
+        group : set
+          Keys in the cache including `key`
+        """
+        group = set()
+        pending = [key]
+        while len(pending) > 0:
+            current = pending.pop()
+            if current in group or current not in self.cache:
+                continue
+            group.add(current)
+            pending.extend(self._groups.get(current, ()))
+        return group
+
+    def _measure(self):
+        """
+        Measure every stored value which hasn't been measured,
+        including values stored in the dict directly.
+        """
+        if len(self._nbytes) != len(self.cache):
+            self._prune()
+        for key in list(self.cache.keys()):
+            self._size(key)
+
+    def _account(self, delta):
+        """
+        Add a change in stored bytes to the running totals.
+        """
+        global _total_bytes
+        self._bytes[0] += delta
+        _total_bytes += delta
+
+    def _size(self, key):
+        """
+        Get the approximate size of a stored value in bytes,
+        only measuring values that haven't been measured.
+        """
+        value = self.cache[key]
+        stored = self._nbytes.get(key)
+        if stored is None or stored[0] != id(value):
+            size = nbytes(value)
+            self._account(
+                size if stored is None else size - stored[1])
+            stored = (id(value), size)
+            self._nbytes[key] = stored
+        return stored[1]
+
+    @property
+    def nbytes(self):
+        """
+        The approximate memory used by values in the cache.
+
+        Returns
+        ----------
+        nbytes : int
+          Size of stored values in bytes
+        """
+        return sum(self._size(k) for k in list(self.cache.keys()))
+
+    def _stored(self, keys):
+        """
+        Mark keys as just used and if this isn't inside of
+        another cached function evict values over budget.
+
+        Parameters
+        ------------
+        keys : set
+          Keys which were just stored and won't be evicted
+        """
+        for key in keys:
+            self._used[key] = next(_tick)
+        if self._depth > 0:
+            return
+        limit = self.max_bytes
+        if limit is None:
+            limit = budget.cache
+        if limit is None and budget.total is None:
+            # measuring values can be slow so only
+            # do it once there is a budget to enforce
+            _unmeasured.add(self)
+            return
+        self._measure()
+        if limit is not None and self._bytes[0] > limit:
+            self.evict(limit, keep=keys)
+        if budget.total is not None and _total_bytes > budget.total:
+            evict(budget.total, keep=(self, keys))
+
+    def evict(self, max_bytes, keep=None):
+        """
+        Remove the least recently used values until the
+        values stored in this cache use less memory.
+
+        Parameters
+        ------------
+        max_bytes : int
+          Budget for values in this cache
+        keep : None or set
+          Keys which should not be evicted
+
+        Returns
+        ------------
+        removed : int
+          Number of values evicted
+        """
+        sizes = {k: self._size(k) for k in list(self.cache.keys())}
+        total = sum(sizes.values())
+        if total <= max_bytes:
+            return 0
+
+        removed = 0
+        for key in sorted(sizes, key=lambda k: self._used.get(k, -1)):
+            if total <= max_bytes:
+                break
+            if key not in self.cache:
+                # already evicted along with its group
+                continue
+            group = self._group(key)
+            if keep is not None and not keep.isdisjoint(group):
+                continue
+            for k in group:
+                self._remove(k)
+                total -= sizes[k]
+            removed += len(group)
+        self.stats['evictions'] += removed
+        log.debug('%d items evicted from cache', removed)
+        return removed
 
     def verify(self):
         """
         Verify that the cached values are still for the same
-        value of id_function and delete all stored items if
+        value of id_function and delete stored items if
         the value of id_function has changed.
+
+        If a `key_function` was passed only values which
+        depend on data keys that changed are deleted.
         """
         # if we are in a lock don't check anything
         if self._lock != 0:
@@ -392,14 +877,35 @@ class Cache(object):
 
         # things changed
         if id_new != self.id_current:
-            if len(self.cache) > 0:
+            if self._key_function is not None and any(
+                    self.depends.get(k) is not None for k in self.cache):
+                # find which keys of the data changed
+                key_new = self._key_function()
+                changed = set(k for k in set(key_new).union(
+                    self.key_current) if key_new.get(k) !=
+                    self.key_current.get(k))
+                # keep values that only depend on unchanged keys
+                keep = set(k for k in self.cache
+                           if self.depends.get(k) is not None and
+                           changed.isdisjoint(self.depends[k]))
+                self.key_current = key_new
+            else:
+                keep = set()
+                self.key_current = self._keys()
+
+            if len(self.cache) > len(keep):
                 log.debug('%d items cleared from cache: %s',
-                          len(self.cache),
-                          str(list(self.cache.keys())))
+                          len(self.cache) - len(keep),
+                          str([k for k in self.cache.keys()
+                               if k not in keep]))
             # hash changed, so dump the cache
             # do it manually rather than calling clear()
             # as we are internal logic and can avoid function calls
-            self.cache = {}
+            self.cache = {k: v for k, v in self.cache.items()
+                          if k in keep}
+            self.depends = {k: v for k, v in self.depends.items()
+                            if k in keep}
+            self._prune()
             # set the id to the new data hash
             self.id_current = id_new
 
@@ -414,9 +920,13 @@ class Cache(object):
         """
         if exclude is None:
             self.cache = {}
+            self.depends = {}
         else:
             self.cache = {k: v for k, v in self.cache.items()
                           if k in exclude}
+            self.depends = {k: v for k, v in self.depends.items()
+                            if k in exclude}
+        self._prune()
 
     def update(self, items):
         """
@@ -436,6 +946,7 @@ class Cache(object):
         Set the current ID to the value of the ID function.
         """
         self.id_current = self._id_function()
+        self.key_current = self._keys()
 
     def __getitem__(self, key):
         """
@@ -454,7 +965,10 @@ class Cache(object):
         """
         self.verify()
         if key in self.cache:
+            self.stats['hits'] += 1
+            self._used[key] = next(_tick)
             return self.cache[key]
+        self.stats['misses'] += 1
         return None
 
     def __setitem__(self, key, value):
@@ -475,6 +989,7 @@ class Cache(object):
             value.flags.writeable = False
         # assign data to dict
         self.cache[key] = value
+        self._stored({key})
 
         return value
 
@@ -492,6 +1007,7 @@ class Cache(object):
     def __exit__(self, *args):
         self._lock -= 1
         self.id_current = self._id_function()
+        self.key_current = self._keys()
 
 
 class DiskCache(object):
@@ -661,6 +1177,10 @@ class DataStore(Mapping):
         if hasattr(self, '_mutable'):
             # apply our mutability setting only if it was explicitly set
             tracked.mutable = self.mutable
+        if isinstance(tracked, TrackedArray):
+            # the array may be a view that shares a version
+            # with the value it is replacing
+            tracked._version[0] = next(_versions)
         # store data
         self.data[key] = tracked
 
@@ -689,6 +1209,32 @@ class DataStore(Mapping):
             [hash(v) for v in self.data.values()],
             dtype=np.int64).tobytes())
 
+    def versions(self):
+        """
+        Get the version of each item in the DataStore, which
+        changes when the item may have been altered. Unlike
+        `hash` this doesn't need to look at the contents.
+
+        Returns
+        ----------
+        versions : dict
+          Keyed the same as the DataStore with int values
+        """
+        return {k: v.version if hasattr(v, 'version') else hash(v)
+                for k, v in self.data.items()}
+
+    def version(self):
+        """
+        Get a value which changes when any item in the
+        DataStore may have been altered, added or removed.
+
+        Returns
+        ----------
+        version : int
+          Combined version of every item
+        """
+        return hash(tuple(sorted(self.versions().items())))
+
     def crc(self):
         """
         Get a CRC reflecting everything in the DataStore.
@@ -207,3 +207,91 @@ def face_ordering(mesh):
     order[diff > tol.merge] = 1
 
     return order
+
+
+def identifier_rigid(mesh):
+    """
+    Return a cheap identifier for a mesh which is invariant to
+    rigid transformations of its vertices. Unlike
+    `identifier_simple` it is not robust to different
+    tesselations: it only matches meshes with the same faces
+    and visuals, which is what an exporter produces when it
+    bakes a transform into each copy of a part.
+
+    Parameters
+    ------------
+    mesh : trimesh.Trimesh
+      Source geometry
+
+    Returns
+    ----------
+    identifier : tuple
+      Hashable values identifying the mesh
+    """
+    vertices = mesh.vertices.view(np.ndarray)
+    if len(vertices) == 0:
+        return (0, hash(mesh.faces))
+
+    # the principal second moments of the vertices don't
+    # change under rotation or translation
+    centered = vertices - vertices.mean(axis=0)
+    moments = np.linalg.eigvalsh(np.dot(centered.T, centered) /
+                                 len(vertices))
+    # round coarsely relative to the largest moment: values
+    # near a rounding boundary only lose a match and every
+    # match is verified with `rigid_transform` anyway
+    largest = moments.max()
+    if largest > tol.zero:
+        moments = np.round(moments / largest, 3)
+        largest = util.sigfig_round(largest, 3)
+    else:
+        largest = 0.0
+
+    visual = mesh.visual
+    return (len(vertices),
+            hash(mesh.faces),
+            visual.kind,
+            hash(visual),
+            hash(getattr(visual, 'material', None)),
+            float(largest),
+            tuple(moments.tolist()))
+
+
+def rigid_transform(a, b, tolerance=1e-5):
+    """
+    Find the rigid transform which moves every vertex in `a`
+    onto the vertex with the same index in `b`.
+
+    Parameters
+    ------------
+    a : (n, 3) float
+      Vertices of the first mesh
+    b : (n, 3) float
+      Vertices of the second mesh
+    tolerance : float
+      Largest allowed distance from a transformed vertex to
+      its match, relative to the radius of `b`
+
+    Returns
+    ----------
+    matrix : (4, 4) float or None
+      Homogeneous transform from `a` to `b` or None if no
+      rotation and translation moves `a` onto `b`
+    """
+    from .registration import procrustes
+
+    # avoid the overhead of tracked array subclasses
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if a.shape != b.shape or len(a) == 0:
+        return None
+
+    matrix, transformed, cost = procrustes(
+        a, b, reflection=False, scale=False, return_cost=True)
+    # compare the largest error rather than the mean square
+    # so a single mismatched vertex can't hide
+    radius = np.sqrt(((b - b.mean(axis=0)) ** 2).sum(axis=1).max())
+    limit = tolerance * max(radius, tol.merge)
+    if ((transformed - b) ** 2).sum(axis=1).max() > limit ** 2:
+        return None
+    return matrix
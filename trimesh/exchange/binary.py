@@ -0,0 +1,437 @@
+"""
+binary.py
+------------
+
+A simple uncompressed format which stores a Trimesh along
+with expensive cached values like `face_adjacency`, `facets`
+and `triangles_tree` so processed meshes can be reloaded
+without doing the work again.
+
+The file is a fixed 16 byte header, a JSON header describing
+every array, and then the raw bytes of every array aligned
+so they can be memory mapped and loaded without parsing:
+
+`b'trimesh\\x00'`, `<u4` format version, `<u4` JSON length,
+JSON padded so data starts on a 64 byte boundary, arrays
+"""
+import os
+import json
+import hashlib
+import tempfile
+
+import numpy as np
+
+from .. import bvh
+from .. import util
+from ..base import Trimesh
+from ..constants import log
+
+# the first bytes of every file
+_magic = b'trimesh\x00'
+# increment if the layout of the file changes
+_version = 1
+# arrays are stored on this byte boundary
+_align = 64
+
+# cached values which are stored by default
+_default_properties = ('face_normals',
+                       'vertex_normals',
+                       'edges_unique',
+                       'face_adjacency',
+                       'face_adjacency_edges',
+                       'facets',
+                       'triangles_tree')
+
+# values which computing a property also puts in the cache,
+# nothing recomputes them so they're stored together
+_side_effects = {
+    'edges_unique': ('edges_unique_idx', 'edges_unique_inverse')}
+
+
+def export_binary(mesh, file_obj=None, properties=None):
+    """
+    Export a mesh and some of its cached values to the
+    uncompressed binary format.
+
+    Parameters
+    ------------
+    mesh : trimesh.Trimesh
+      Mesh to export
+    file_obj : None or file-like
+      If passed write the result to this binary file object
+    properties : None or (n,) str
+      Names of cached values to store if they are currently
+      in the cache, if None a default set is used
+
+    Returns
+    ------------
+    exported : bytes or None
+      Exported result or None if written to `file_obj`
+    """
+    if properties is None:
+        properties = _default_properties
+
+    arrays = {'vertices': mesh.vertices, 'faces': mesh.faces}
+    kind = mesh.visual.kind
+    if kind == 'face':
+        arrays['face_colors'] = mesh.visual.face_colors
+    elif kind == 'vertex':
+        arrays['vertex_colors'] = mesh.visual.vertex_colors
+    elif kind is not None:
+        log.debug('visual `%s` not exported', kind)
+
+    # include the values computed as a side effect but skip
+    # a property if any of them has since been removed
+    cached = mesh._cache.cache
+    names = []
+    for name in properties:
+        group = (name,) + _side_effects.get(name, ())
+        if all(cached.get(k) is not None for k in group):
+            names.extend(group)
+
+    # describe how to restore each cached value
+    cache = {}
+    for name in names:
+        value = cached[name]
+        packed = _pack(value)
+        if packed is None:
+            log.debug('unable to export cached `%s`', name)
+            continue
+        entry, values = packed
+        depends = mesh._cache.depends.get(name)
+        if depends is not None:
+            # keys of the data the value was computed from
+            entry['depends'] = sorted(depends)
+        cache[name] = entry
+        arrays.update({'{}.{}'.format(name, k): v
+                       for k, v in values.items()})
+
+    # compute where every array is stored
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.asanyarray(array)
+        layout[name] = {'dtype': array.dtype.str,
+                        'shape': list(array.shape),
+                        'offset': offset}
+        offset += _padded(array.nbytes)
+
+    header = {'version': _version,
+              'arrays': layout,
+              'cache': cache,
+              'metadata': _jsonable(mesh.metadata)}
+    header = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    # pad the JSON so the arrays start on a boundary
+    header += b' ' * (_padded(len(header) + 16) - len(header) - 16)
+
+    chunks = [_magic,
+              np.array([_version, len(header)], dtype='<u4').tobytes(),
+              header]
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        chunks.append(array.view(np.uint8).reshape(-1).data)
+        chunks.append(b'\x00' * (_padded(array.nbytes) - array.nbytes))
+
+    if file_obj is not None:
+        for chunk in chunks:
+            file_obj.write(chunk)
+        return None
+
+    return bytes().join(chunks)
+
+
+def load_binary(file_obj, mmap=True):
+    """
+    Load a mesh and its cached values from the
+    uncompressed binary format.
+
+    Parameters
+    ------------
+    file_obj : str or file-like
+      Path or binary file object to load
+    mmap : bool
+      If the file is on disk reference it with copy-
+      on- write memory maps rather than reading it
+
+    Returns
+    ------------
+    mesh : trimesh.Trimesh
+      Mesh with the stored values in its cache
+    """
+    if util.is_string(file_obj):
+        with open(file_obj, 'rb') as f:
+            return load_binary(f, mmap=mmap)
+
+    start = file_obj.tell()
+    head = file_obj.read(16)
+    if len(head) != 16 or head[:8] != _magic:
+        raise ValueError('not a binary trimesh file!')
+    version, length = np.frombuffer(head[8:], dtype='<u4')
+    if version != _version:
+        raise ValueError(
+            'binary trimesh file is version {} not {}'.format(
+                version, _version))
+    header = json.loads(util.decode_text(file_obj.read(int(length))))
+    # where the arrays start in the file
+    data_start = start + 16 + int(length)
+
+    raw = None
+    if mmap:
+        try:
+            # raises if there is no file descriptor
+            file_obj.fileno()
+        except Exception:
+            mmap = False
+    if not mmap:
+        # a bytearray so the arrays are writeable like the
+        # copy- on- write memory maps
+        raw = bytearray(file_obj.read())
+
+    arrays = {}
+    for name, info in header['arrays'].items():
+        dtype = np.dtype(info['dtype'])
+        shape = tuple(info['shape'])
+        count = int(np.prod(shape))
+        if count == 0:
+            arrays[name] = np.zeros(shape, dtype=dtype)
+        elif mmap:
+            arrays[name] = np.memmap(file_obj,
+                                     dtype=dtype,
+                                     mode='c',
+                                     offset=data_start + info['offset'],
+                                     shape=shape)
+        else:
+            arrays[name] = np.frombuffer(
+                raw,
+                dtype=dtype,
+                count=count,
+                offset=info['offset']).reshape(shape)
+
+    mesh = Trimesh(vertices=arrays.pop('vertices'),
+                   faces=arrays.pop('faces'),
+                   face_colors=arrays.pop('face_colors', None),
+                   vertex_colors=arrays.pop('vertex_colors', None),
+                   metadata=header.get('metadata'),
+                   process=False)
+
+    cache = {}
+    for name, entry in header['cache'].items():
+        prefix = name + '.'
+        cache[name] = _unpack(entry, {
+            k[len(prefix):]: v for k, v in arrays.items()
+            if k.startswith(prefix)})
+    # the stored values are for the data we just set
+    mesh._cache.update(cache)
+    for name, entry in header['cache'].items():
+        if entry.get('depends') is not None:
+            mesh._cache.depends[name] = frozenset(entry['depends'])
+
+    return mesh
+
+
+class MeshCache(object):
+    """
+    Store processed meshes on disk in the binary format
+    keyed by the hash of the file they were loaded from.
+    """
+
+    def __init__(self, path, properties=None):
+        """
+        Create a cache of processed meshes on disk.
+
+        Parameters
+        ------------
+        path : str
+          A writeable directory to store meshes in
+        properties : None or (n,) str
+          Cached values to compute and store with each
+          mesh, if None a default set is used
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        if properties is None:
+            properties = _default_properties
+        self.properties = properties
+
+    def key(self, file_name, **kwargs):
+        """
+        Get the key for a file and the arguments it
+        is loaded with.
+
+        Parameters
+        ------------
+        file_name : str
+          Path to a mesh file
+        **kwargs : dict
+          Arguments passed to `trimesh.load`
+
+        Returns
+        ------------
+        key : str
+          Hex digest of the file and arguments
+        """
+        hasher = hashlib.sha256()
+        with open(file_name, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(block)
+        # results depend on the options they were loaded with
+        hasher.update(json.dumps(
+            [_version, sorted(self.properties), kwargs],
+            sort_keys=True, default=str).encode('utf-8'))
+        return hasher.hexdigest()
+
+    def load(self, file_name, **kwargs):
+        """
+        Load a mesh from the cache, or load it from the
+        file, compute the stored properties and add it.
+
+        Parameters
+        ------------
+        file_name : str
+          Path to a mesh file
+        **kwargs : dict
+          Passed to `trimesh.load`
+
+        Returns
+        ------------
+        mesh : trimesh.Trimesh
+          Loaded mesh
+
+        Raises
+        ------------
+        ValueError
+          If `force` is passed as results are always meshes
+        """
+        if 'force' in kwargs:
+            raise ValueError('cached results are always meshes!')
+        path = os.path.join(
+            self.path, self.key(file_name, **kwargs) + '.bin')
+        if os.path.isfile(path):
+            try:
+                return load_binary(path)
+            except Exception:
+                # the entry is replaced with a new one below
+                log.warning('unable to load cached mesh, replacing %s',
+                            path, exc_info=True)
+
+        from .load import load
+        mesh = load(file_name, force='mesh', **kwargs)
+        for name in self.properties:
+            # populate the values we want stored
+            getattr(mesh, name)
+
+        # write to a temporary file and then move it so
+        # other processes never read a partial file
+        handle, temp = tempfile.mkstemp(dir=self.path)
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                export_binary(mesh, file_obj=f, properties=self.properties)
+            os.replace(temp, path)
+        except Exception:
+            os.remove(temp)
+            raise
+
+        return mesh
+
+
+def _padded(size):
+    """
+    Round a number of bytes up to the alignment.
+    """
+    return int(np.ceil(size / float(_align))) * _align
+
+
+def _jsonable(metadata):
+    """
+    Get the items of a dict which can be stored as JSON.
+    """
+    result = {}
+    for k, v in metadata.items():
+        try:
+            json.dumps({k: v})
+            result[k] = v
+        except Exception:
+            log.debug('metadata `%s` not exported', k)
+    return result
+
+
+def _pack(value):
+    """
+    Convert a cached value to a header entry and arrays.
+
+    Parameters
+    ------------
+    value : any
+      Value from a cache
+
+    Returns
+    ------------
+    packed : None or (dict, dict)
+      Header entry and arrays keyed by name
+    """
+    if isinstance(value, bvh.BVH):
+        return ({'kind': 'bvh',
+                 'depth': value.depth,
+                 'leaf_size': value.leaf_size},
+                {'order': value.order,
+                 'primitive_bounds': value.primitive_bounds,
+                 'leaf_start': value.leaf_start,
+                 'node_bounds': value.node_bounds})
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        return {'kind': 'array'}, {'data': value}
+    elif isinstance(value, (list, tuple)):
+        # a sequence of arrays like facets
+        try:
+            values = [np.asanyarray(v) for v in value]
+            if any(v.dtype == object or len(v.shape) != 1
+                   for v in values):
+                return None
+            lengths = np.array([len(v) for v in values], dtype=np.int64)
+            if len(values) == 0:
+                data = np.zeros(0, dtype=np.int64)
+            else:
+                data = np.concatenate(values)
+        except Exception:
+            return None
+        return {'kind': 'ragged'}, {'data': data, 'lengths': lengths}
+    return None
+
+
+def _unpack(entry, arrays):
+    """
+    Convert a header entry and arrays from `_pack`
+    back to the cached value.
+
+    Parameters
+    ------------
+    entry : dict
+      Header entry
+    arrays : dict
+      Arrays keyed by name
+
+    Returns
+    ------------
+    value : any
+      Value for a cache
+    """
+    kind = entry['kind']
+    if kind == 'array':
+        return arrays['data']
+    elif kind == 'ragged':
+        if len(arrays['lengths']) == 0:
+            return []
+        split = np.cumsum(arrays['lengths'])[:-1]
+        return np.split(arrays['data'], split)
+    elif kind == 'bvh':
+        # restore the tree without building it again
+        tree = bvh.BVH.__new__(bvh.BVH)
+        tree.depth = entry['depth']
+        tree.leaf_size = entry['leaf_size']
+        for name in ['order',
+                     'primitive_bounds',
+                     'leaf_start',
+                     'node_bounds']:
+            setattr(tree, name, arrays[name])
+        return tree
+    raise ValueError('unknown cache entry `{}`'.format(kind))
@@ -8,6 +8,8 @@ as GL_TRIANGLES, and trimesh.Path2D/Path3D as GL_LINES
 
 import json
 import base64
+import shutil
+import tempfile
 import collections
 
 import numpy as np
@@ -158,7 +160,8 @@ def export_glb(
         include_normals=None,
         unitize_normals=False,
         tree_postprocessor=None,
-        buffer_postprocessor=None):
+        buffer_postprocessor=None,
+        file_obj=None):
     """
     Export a scene as a binary GLTF (GLB) file.
 
@@ -173,11 +176,18 @@ def export_glb(
     tree_postprocessor : func
       Custom function to (in-place) post-process the tree
       before exporting.
+    file_obj : None or file-like
+      If passed write the GLB to this binary file object
+      rather than returning bytes: buffers are spooled to a
+      temporary file as they are generated so only one is
+      in memory at a time unless `buffer_postprocessor`
+      needs all of them
 
     Returns
     ----------
-    exported : bytes
-      Exported result in GLB 2.0
+    exported : bytes or None
+      Exported result in GLB 2.0 or None if
+      it was written to `file_obj`
     """
     # if we were passed a bare Trimesh or Path3D object
     if (not util.is_instance_named(scene, "Scene") and
@@ -185,10 +195,19 @@ def export_glb(
         # generate a scene with just that mesh in it
         scene = scene.scene()
 
+    spooled = None
+    if file_obj is not None and buffer_postprocessor is None:
+        # write each buffer item to a temporary file as it is
+        # generated so they are never all in memory at once
+        spooled = tempfile.TemporaryFile()
+
     tree, buffer_items = _create_gltf_structure(
         scene=scene,
         unitize_normals=unitize_normals,
-        include_normals=include_normals, buffer_postprocessor=buffer_postprocessor)
+        include_normals=include_normals,
+        buffer_postprocessor=buffer_postprocessor,
+        buffer_items=(None if spooled is None
+                      else _SpooledBuffers(spooled)))
 
     # allow custom postprocessing
     if tree_postprocessor is not None:
@@ -197,12 +216,13 @@ def export_glb(
     # A bufferView is a slice of a file
     views = _build_views(buffer_items)
 
-    # combine bytes into a single blob
-    buffer_data = bytes().join(buffer_items.values())
+    # the length of every buffer item combined without
+    # copying them into a single blob
+    buffer_length = sum(len(i) for i in buffer_items.values())
 
     # add the information about the buffer data
-    if len(buffer_data) > 0:
-        tree["buffers"] = [{"byteLength": len(buffer_data)}]
+    if buffer_length > 0:
+        tree["buffers"] = [{"byteLength": buffer_length}]
         tree["bufferViews"] = views
 
     # export the tree to JSON for the header
@@ -220,7 +240,7 @@ def export_glb(
                   2,               # GLTF version
                   # length is the total length of the Binary glTF
                   # including Header and all Chunks, in bytes.
-                  len(content) + len(buffer_data) + 28,
+                  len(content) + buffer_length + 28,
                   # contentLength is the length, in bytes,
                   # of the glTF content (JSON)
                   len(content),
@@ -231,17 +251,33 @@ def export_glb(
 
     # the header of the binary data section
     bin_header = _byte_pad(
-        np.array([len(buffer_data), 0x004E4942],
+        np.array([buffer_length, 0x004E4942],
                  dtype="<u4").tobytes())
 
-    exported = bytes().join([header,
-                             content,
-                             bin_header,
-                             buffer_data])
-
     if tol.strict:
         validate(tree)
 
+    # every chunk of the file in order
+    chunks = [header, content, bin_header]
+
+    if spooled is not None:
+        # the header needed every buffer so copy them after it
+        with spooled:
+            for chunk in chunks:
+                file_obj.write(chunk)
+            spooled.seek(0)
+            shutil.copyfileobj(spooled, file_obj, 1 << 20)
+        return None
+
+    chunks.extend(buffer_items.values())
+    if file_obj is not None:
+        # write each buffer item rather than combining them
+        for chunk in chunks:
+            file_obj.write(chunk)
+        return None
+
+    exported = bytes().join(chunks)
+
     return exported
 
 
@@ -591,7 +627,8 @@ def _create_gltf_structure(scene,
                            include_normals=None,
                            include_metadata=True,
                            unitize_normals=None,
-                           buffer_postprocessor=None):
+                           buffer_postprocessor=None,
+                           buffer_items=None):
     """
     Generate a GLTF header.
 
@@ -605,6 +642,9 @@ def _create_gltf_structure(scene,
       Include vertex normals in output file?
     unitize_normals : bool
       Unitize all exported normals so as to pass GLTF validation
+    buffer_items : None or collections.OrderedDict
+      Empty container to store buffer items in, if None
+      a new `OrderedDict` is used
 
     Returns
     ---------------
@@ -642,7 +682,8 @@ def _create_gltf_structure(scene,
     # store materials as {hash : index} to avoid duplicates
     mat_hashes = {}
     # store data from geometries
-    buffer_items = collections.OrderedDict()
+    if buffer_items is None:
+        buffer_items = collections.OrderedDict()
 
     # map the name of each mesh to the index in tree['meshes']
     mesh_index = {}
@@ -872,6 +913,38 @@ def _append_mesh(mesh,
     tree["meshes"].append(current)
 
 
+class _SpooledBuffers(collections.OrderedDict):
+    """
+    Buffer items which are written to a file as they are
+    added and only keep the length of each item in memory.
+    """
+
+    def __init__(self, file_obj):
+        """
+        Parameters
+        ------------
+        file_obj : file-like
+          Binary file to write buffer items to
+        """
+        super(_SpooledBuffers, self).__init__()
+        self.file_obj = file_obj
+
+    def __setitem__(self, key, value):
+        self.file_obj.write(value)
+        super(_SpooledBuffers, self).__setitem__(
+            key, _Length(len(value)))
+
+
+class _Length(int):
+    """
+    The number of bytes of a buffer item which has been
+    written so views can still be built from `len`.
+    """
+
+    def __len__(self):
+        return int(self)
+
+
 def _build_views(buffer_items):
     """
     Create views for buffers that are simply
@@ -1206,7 +1279,7 @@ def _parse_materials(header, views, resolver=None):
     ------------
     header : dict
       Contains layout of file
-    views : (n,) bytes
+    views : (n,) bytes or memoryview
       Raw data
 
     Returns
@@ -1286,6 +1359,9 @@ def _read_buffers(header,
     """
 
     if "bufferViews" in header:
+        # slices of a memoryview reference the buffer
+        # rather than copying the data into new bytes
+        buffers = [memoryview(b) for b in buffers]
         # split buffer data into buffer views
         views = [None] * len(header["bufferViews"])
         for i, view in enumerate(header["bufferViews"]):
@@ -1332,25 +1408,22 @@ def _read_buffers(header,
                 if "byteStride" in buffer_view:
                     # how many bytes for each chunk
                     stride = buffer_view["byteStride"]
-                    # the total block we're looking at
-                    length = count * stride
-                    # we want to get the bytes for every row
-                    per_row = per_item * dtype.itemsize
-                    # we have to offset the (already offset) buffer
-                    # and then pull chunks per-stride
-                    # do as a list comprehension as the numpy
-                    # buffer wangling was
-                    raw = b''.join(
-                        data[i:i + per_row] for i in
-                        range(start, start + length, stride))
-                    # the reshape should fail if we screwed up
-                    access[index] = np.frombuffer(
-                        raw, dtype=dtype).reshape(shape)
+                    # view every row of the interleaved data
+                    # in place which will raise if the buffer
+                    # is too small for the reported layout
+                    access[index] = np.ndarray(
+                        shape=(count, per_count),
+                        dtype=dtype,
+                        buffer=data,
+                        offset=start,
+                        strides=(stride, dtype.itemsize)).reshape(shape)
                 else:
-                    # length is the number of bytes per item times total
-                    length = dtype.itemsize * count * per_count
+                    # reference the tightly packed values
                     access[index] = np.frombuffer(
-                        data[start:start + length], dtype=dtype).reshape(shape)
+                        data,
+                        dtype=dtype,
+                        count=count * per_count,
+                        offset=start).reshape(shape)
             else:
                 # a "sparse" accessor should be initialized as zeros
                 access[index] = np.zeros(
@@ -1363,6 +1436,9 @@ def _read_buffers(header,
     mesh_prim = collections.defaultdict(list)
     # load data from accessors into Trimesh objects
     meshes = collections.OrderedDict()
+    # bounds reported by the position accessors
+    # which are required by the specification
+    bounds = {}
 
     names_original = collections.defaultdict(list)
 
@@ -1440,7 +1516,8 @@ def _read_buffers(header,
                     if 'COLOR_0' in attr:
                         try:
                             # try to load vertex colors from the accessors
-                            colors = access[attr['COLOR_0']]
+                            # copying so they don't reference the buffer
+                            colors = access[attr['COLOR_0']].copy()
                             if len(colors) == len(kwargs['vertices']):
                                 if visuals is None:
                                     # just pass to mesh as vertex color
@@ -1464,7 +1541,7 @@ def _read_buffers(header,
                         kwargs['metadata']['from_gltf_primitive'] = False
 
                     # custom attributes starting with a `_`
-                    custom = {a: access[attr[a]] for a in attr.keys()
+                    custom = {a: access[attr[a]].copy() for a in attr.keys()
                               if a.startswith('_')}
                     if len(custom) > 0:
                         kwargs["vertex_attributes"] = custom
@@ -1474,6 +1551,9 @@ def _read_buffers(header,
                 # this should absolutely not be stomping on itself
                 assert name not in meshes
                 meshes[name] = kwargs
+                position = header['accessors'][attr['POSITION']]
+                if 'min' in position and 'max' in position:
+                    bounds[name] = [position['min'], position['max']]
                 mesh_prim[index].append(name)
         except BaseException as E:
             if ignore_broken:
@@ -1527,11 +1607,18 @@ def _read_buffers(header,
                 'visual': visuals,
                 'metadata': metadata,
                 'process': False}
+            if all(n in bounds for n in names):
+                stacked = np.array([bounds[n] for n in names])
+                bounds[name] = [stacked[:, 0].min(axis=0).tolist(),
+                                stacked[:, 1].max(axis=0).tolist()]
+            else:
+                bounds.pop(name, None)
             mesh_prim_replace[mesh_index] = [name]
         # avoid altering inside loop
         mesh_prim = mesh_prim_replace
         # remove outdated meshes
         [meshes.pop(p, None) for p in mesh_pop]
+        [bounds.pop(p, None) for p in mesh_pop]
 
     # make it easier to reference nodes
     nodes = header.get("nodes", [])
@@ -1665,6 +1752,7 @@ def _read_buffers(header,
     # kwargs for load_kwargs
     result = {"class": "Scene",
               "geometry": meshes,
+              "geometry_bounds": bounds,
               "graph": graph,
               "base_frame": base_frame}
     try:
@@ -1,5 +1,8 @@
 import os
 import json
+import pickle
+import functools
+import traceback
 import numpy as np
 
 from .. import util
@@ -9,6 +12,7 @@ from ..base import Trimesh
 from ..parent import Geometry
 from ..points import PointCloud
 from ..scene.scene import Scene, append_scenes
+from ..scene.lazy import LazyGeometry
 from ..util import log, now
 
 from . import misc
@@ -90,7 +94,12 @@ def load(file_obj,
       For 'mesh': try to coerce scenes into a single mesh
       For 'scene': try to coerce everything into a scene
     kwargs : dict
-      Passed to geometry __init__
+      Passed to geometry __init__, if `lazy=True` is
+      passed geometry in a loaded scene isn't created
+      until it is first accessed. If `reinstance=True` is
+      passed geometry in a loaded scene which is a rigidly
+      transformed copy of other geometry is replaced with
+      a transform, see `Scene.reinstance`
 
     Returns
     ---------
@@ -113,6 +122,8 @@ def load(file_obj,
      ) = parse_file_args(file_obj=file_obj,
                          file_type=file_type,
                          resolver=resolver)
+    # instancing is applied to the final scene
+    reinstance = kwargs.pop('reinstance', False)
 
     try:
         if isinstance(file_obj, dict):
@@ -167,7 +178,9 @@ def load(file_obj,
     if force == 'mesh' and isinstance(loaded, Scene):
         return util.concatenate(loaded.dump())
     if force == 'scene' and not isinstance(loaded, Scene):
-        return Scene(loaded)
+        loaded = Scene(loaded)
+    if reinstance and isinstance(loaded, Scene):
+        loaded.reinstance()
 
     return loaded
 
@@ -208,6 +221,8 @@ def load_mesh(file_obj,
         # make sure we keep passed kwargs to loader
         # but also make sure loader keys override passed keys
         loader = mesh_loaders[file_type]
+        # laziness is applied when creating the scene
+        lazy = kwargs.pop('lazy', False)
         tic = now()
         results = loader(file_obj,
                          file_type=file_type,
@@ -215,6 +230,7 @@ def load_mesh(file_obj,
                          **kwargs)
         if not isinstance(results, list):
             results = [results]
+        kwargs['lazy'] = lazy
 
         loaded = []
         for result in results:
@@ -403,6 +419,194 @@ def load_remote(url, **kwargs):
     return loaded
 
 
+def load_many(file_names, workers=None, **kwargs):
+    """
+    Load many files on a pool of processes, yielding each
+    result as soon as it has finished loading.
+
+    Arrays are returned from the worker processes through
+    shared memory rather than being pickled through a pipe,
+    and a file which fails to load doesn't stop the batch.
+
+    Parameters
+    ------------
+    file_names : (n,) str
+      Paths of files to load
+    workers : None or int
+      Number of processes, if None uses the CPU count
+      and if 1 loads every file in this process
+    **kwargs : passed to `load`
+
+    Yields
+    ------------
+    file_name : str
+      Path of the file which finished loading
+    loaded : Trimesh, Path, Scene or Exception
+      Loaded result or the error raised loading it
+    """
+    file_names = list(file_names)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(int(workers), len(file_names))
+
+    if workers <= 1:
+        for file_name in file_names:
+            try:
+                loaded = load(file_name, **kwargs)
+            except Exception as E:
+                log.debug('failed to load %s', file_name, exc_info=True)
+                loaded = E
+            yield file_name, loaded
+        return
+
+    from concurrent.futures import (ProcessPoolExecutor,
+                                    wait,
+                                    FIRST_COMPLETED)
+    try:
+        # start the tracker for shared memory here so workers
+        # share it rather than each starting their own
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+    except ImportError:
+        pass
+    # the process may already be running threads which
+    # aren't safe to fork so always start fresh workers
+    from multiprocessing import get_context
+    pool = ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context('spawn'))
+    # futures in flight keyed to the file they are loading
+    pending = {}
+    queue = iter(file_names)
+    try:
+        while True:
+            # only keep a bounded number of files in flight so
+            # a slow consumer doesn't accumulate every result
+            for file_name in queue:
+                pending[pool.submit(
+                    _load_shared, file_name, kwargs)] = file_name
+                if len(pending) >= workers * 2:
+                    break
+            if len(pending) == 0:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_name = pending.pop(future)
+                try:
+                    loaded = _unpack_shared(future.result())
+                except Exception as E:
+                    # a worker process may have died
+                    loaded = E
+                yield file_name, loaded
+    finally:
+        # if the consumer stopped early don't load the rest
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+        for future in pending:
+            if future.done() and not future.cancelled():
+                try:
+                    # free the shared memory of unused results
+                    _unpack_shared(future.result())
+                except Exception:
+                    pass
+
+
+def _load_shared(file_name, kwargs):
+    """
+    Load a file and pack the result into shared memory
+    so it can be returned from a worker process.
+
+    Parameters
+    ------------
+    file_name : str
+      Path of file to load
+    kwargs : dict
+      Passed to `load`
+
+    Returns
+    ------------
+    packed : tuple
+      Result which can be passed to `_unpack_shared`
+    """
+    try:
+        loaded = load(file_name, **kwargs)
+    except Exception as E:
+        try:
+            # not every exception can be pickled
+            pickle.dumps(E)
+        except Exception:
+            E = ValueError(repr(E))
+        return 'error', E, traceback.format_exc()
+
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        # Python < 3.8 so just pickle the result
+        return 'pickle', loaded, None
+
+    # pickle the result with arrays kept out of band
+    buffers = []
+    data = pickle.dumps(
+        loaded, protocol=5, buffer_callback=buffers.append)
+    raw = [b.raw() for b in buffers]
+    sizes = [r.nbytes for r in raw]
+    if sum(sizes) == 0:
+        return 'pickle', data, None
+
+    # copy the arrays into one block of shared memory
+    shared = shared_memory.SharedMemory(create=True, size=sum(sizes))
+    try:
+        start = 0
+        for r, size in zip(raw, sizes):
+            shared.buf[start:start + size] = r
+            start += size
+        name = shared.name
+    except BaseException:
+        shared.unlink()
+        raise
+    finally:
+        shared.close()
+    return 'shared', data, (name, sizes)
+
+
+def _unpack_shared(packed):
+    """
+    Get the result of `_load_shared` and free any
+    shared memory it was using.
+
+    Parameters
+    ------------
+    packed : tuple
+      Result from `_load_shared`
+
+    Returns
+    ------------
+    loaded : Trimesh, Path, Scene or Exception
+      Loaded result or the error raised loading it
+    """
+    kind, data, extra = packed
+    if kind == 'error':
+        log.debug('failed to load file:\n%s', extra)
+        return data
+    elif kind == 'pickle':
+        if isinstance(data, bytes):
+            return pickle.loads(data)
+        return data
+
+    from multiprocessing import shared_memory
+    name, sizes = extra
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        # copy each array out of the block once
+        offsets = np.append(0, np.cumsum(sizes))
+        buffers = [bytearray(shared.buf[a:b])
+                   for a, b in zip(offsets[:-1], offsets[1:])]
+    finally:
+        shared.close()
+        shared.unlink()
+    return pickle.loads(data, buffers=buffers)
+
+
 def load_kwargs(*args, **kwargs):
     """
     Load geometry from a properly formatted dict or kwargs
@@ -415,10 +619,20 @@ def load_kwargs(*args, **kwargs):
         geometry:   dict, name: Trimesh kwargs
         graph:      list of dict, kwargs for scene.graph.update
         base_frame: str, base frame of graph
+        geometry_bounds: dict, name: (2, 3) float for placeholders
         """
         graph = kwargs.get('graph', None)
-        geometry = {k: load_kwargs(v) for
-                    k, v in kwargs['geometry'].items()}
+        if lazy:
+            # only create each geometry when it is accessed
+            bounds = kwargs.get('geometry_bounds', {})
+            geometry = {k: LazyGeometry(
+                loader=functools.partial(load_kwargs, v),
+                bounds=bounds.get(k),
+                metadata=v.get('metadata'))
+                for k, v in kwargs['geometry'].items()}
+        else:
+            geometry = {k: load_kwargs(v) for
+                        k, v in kwargs['geometry'].items()}
 
         if graph is not None:
             scene = Scene()
@@ -509,6 +723,8 @@ def load_kwargs(*args, **kwargs):
 
     # filter out keys with a value of None
     kwargs = {k: v for k, v in kwargs.items() if v is not None}
+    # only scenes can defer loading their geometry
+    lazy = kwargs.pop('lazy', False)
     # loop through handler functions and expected key
     for func, expected in handlers:
         if all(i in kwargs for i in expected):
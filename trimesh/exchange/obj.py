@@ -26,6 +26,8 @@ def load_obj(file_obj,
              group_material=True,
              skip_materials=False,
              maintain_order=False,
+             stream=False,
+             block_size=16777216,
              **kwargs):
     """
     Load a Wavefront OBJ file into kwargs for a trimesh.Scene
@@ -46,6 +48,12 @@ def load_obj(file_obj,
     maintain_order : bool or None
       Do not reorder faces or vertices which may result
       in visual artifacts.
+    stream : bool
+      Read the file in blocks rather than all at once so
+      memory use is proportional to the loaded arrays
+      rather than the size of the text.
+    block_size : int
+      Number of bytes to read at a time if streaming.
 
     Returns
     -------------
@@ -53,25 +61,50 @@ def load_obj(file_obj,
       Keyword arguments which can be loaded by
       trimesh.exchange.load.load_kwargs into a trimesh.Scene
     """
-    # get text as bytes or string blob
-    text = file_obj.read()
-    # if text was bytes decode into string
-    text = util.decode_text(text)
+    if stream:
+        # parse the file in blocks into arrays
+        (v, vn, vt, vc,
+         face_tuples,
+         mtl_path) = _parse_stream(file_obj=file_obj,
+                                   group_material=group_material,
+                                   block_size=block_size)
+    else:
+        # get text as bytes or string blob
+        text = file_obj.read()
+        # if text was bytes decode into string
+        text = util.decode_text(text)
 
-    # add leading and trailing newlines so we can use the
-    # same logic even if they jump directly in to data lines
-    text = '\n{}\n'.format(text.strip().replace('\r\n', '\n'))
+        # add leading and trailing newlines so we can use the
+        # same logic even if they jump directly in to data lines
+        text = '\n{}\n'.format(text.strip().replace('\r\n', '\n'))
 
-    # remove backslash continuation characters and merge them into the same line
-    text = text.replace('\\\n', '')
+        # remove backslash continuation characters and merge them into the same line
+        text = text.replace('\\\n', '')
 
-    # Load Materials
-    materials = {}
-    mtl_position = text.find('mtllib')
-    if not skip_materials and mtl_position >= 0:
         # take the line of the material file after `mtllib`
         # which should be the file location of the .mtl file
-        mtl_path = text[mtl_position + 6:text.find('\n', mtl_position)].strip()
+        mtl_path = None
+        mtl_position = text.find('mtllib')
+        if mtl_position >= 0:
+            mtl_path = text[mtl_position + 6:text.find(
+                '\n', mtl_position)].strip()
+
+        # extract vertices from raw text
+        v, vn, vt, vc = _parse_vertices(text=text)
+
+        # get relevant chunks that have face data
+        # in the form of (material, object, chunk)
+        face_tuples = _preprocess_faces(text=text)
+
+        # combine chunks that have the same material
+        # some meshes end up with a LOT of components
+        # and will be much slower if you don't do this
+        if group_material:
+            face_tuples = _group_by_material(face_tuples)
+
+    # Load Materials
+    materials = {}
+    if not skip_materials and mtl_path is not None:
         try:
             # use the resolver to get the data
             material_kwargs = parse_mtl(resolver[mtl_path],
@@ -87,19 +120,6 @@ def load_obj(file_obj,
             log.debug('unable to load materials from: {}'.format(mtl_path),
                       exc_info=True)
 
-    # extract vertices from raw text
-    v, vn, vt, vc = _parse_vertices(text=text)
-
-    # get relevant chunks that have face data
-    # in the form of (material, object, chunk)
-    face_tuples = _preprocess_faces(text=text)
-
-    # combine chunks that have the same material
-    # some meshes end up with a LOT of components
-    # and will be much slower if you don't do this
-    if group_material:
-        face_tuples = _group_by_material(face_tuples)
-
     # no faces but points given
     # return point cloud
     if not len(face_tuples) and v is not None:
@@ -118,50 +138,25 @@ def load_obj(file_obj,
     while len(face_tuples) > 0:
         # consume the next chunk of text
         material, current_object, chunk = face_tuples.pop()
-        # do wangling in string form
-        # we need to only take the face line before a newline
-        # using builtin functions in a list comprehension
-        # is pretty fast relative to other options
-        # this operation is the only one that is O(len(faces))
-        # slower due to the tight-loop conditional:
-        # face_lines = [i[:i.find('\n')]
-        #              for i in chunk.split('\nf ')[1:]
-        #              if i.rfind('\n') >0]
-        # maxsplit=1 means that it can stop working
-        # after it finds the first newline
-        # passed as arg as it's not a kwarg in python2
-        face_lines = [i.split('\n', 1)[0]
-                      for i in chunk.split('f ')[1:]]
-
-        # then we are going to replace all slashes with spaces
-        joined = ' '.join(face_lines).replace('/', ' ')
-
-        # the fastest way to get to a numpy array
-        # processes the whole string at once into a 1D array
-        array = np.fromstring(joined, sep=' ', dtype=np.int64)
-        # also wavefront is 1-indexed (vs 0-indexed) so offset
-        # only applies to positive indices
-        array[array > 0] -= 1
-
-        # get the number of raw 2D columns in a sample line
-        columns = len(face_lines[0].strip().replace('/', ' ').split())
-
-        # make sure we have the right number of values for vectorized
-        if len(array) == (columns * len(face_lines)):
-            # everything is a nice 2D array
-            faces, faces_tex, faces_norm = _parse_faces_vectorized(
-                array=array,
-                columns=columns,
-                sample_line=face_lines[0])
+        if stream:
+            # streamed faces are already parsed into arrays
+            faces, faces_tex, faces_norm = chunk
         else:
-            # if we had something annoying like mixed in quads
-            # or faces that differ per-line we have to loop
-            # i.e. something like:
-            #  '31407 31406 31408',
-            #  '32303/2469 32304/2469 32305/2469',
-            log.debug('faces have mixed data: using slow fallback!')
-            faces, faces_tex, faces_norm = _parse_faces_fallback(
-                face_lines)
+            # do wangling in string form
+            # we need to only take the face line before a newline
+            # using builtin functions in a list comprehension
+            # is pretty fast relative to other options
+            # this operation is the only one that is O(len(faces))
+            # slower due to the tight-loop conditional:
+            # face_lines = [i[:i.find('\n')]
+            #              for i in chunk.split('\nf ')[1:]
+            #              if i.rfind('\n') >0]
+            # maxsplit=1 means that it can stop working
+            # after it finds the first newline
+            # passed as arg as it's not a kwarg in python2
+            face_lines = [i.split('\n', 1)[0]
+                          for i in chunk.split('f ')[1:]]
+            faces, faces_tex, faces_norm = _parse_faces(face_lines)
 
         if group_material:
             name = material
@@ -375,7 +370,59 @@ def parse_mtl(mtl, resolver=None):
     return materials
 
 
-def _parse_faces_vectorized(array, columns, sample_line):
+def _parse_faces(face_lines, polygons=False):
+    """
+    Parse face lines into arrays of indexes.
+
+    Parameters
+    ------------
+    face_lines : (n,) str
+      Face lines with the leading `f ` removed
+    polygons : bool
+      Keep texture and normal references for faces
+      with more than three vertices
+
+    Returns
+    --------------
+    faces : (n, d) int
+      Faces in space
+    faces_tex : (n, d) int or None
+      Texture for each vertex in face
+    faces_norm : (n, d) int or None
+      Normal index for each vertex in face
+    """
+    # then we are going to replace all slashes with spaces
+    joined = ' '.join(face_lines).replace('/', ' ')
+
+    # the fastest way to get to a numpy array
+    # processes the whole string at once into a 1D array
+    array = np.fromstring(joined, sep=' ', dtype=np.int64)
+    # also wavefront is 1-indexed (vs 0-indexed) so offset
+    # only applies to positive indices
+    array[array > 0] -= 1
+
+    # get the number of raw 2D columns in a sample line
+    columns = len(face_lines[0].strip().replace('/', ' ').split())
+
+    # make sure we have the right number of values for vectorized
+    if len(array) == (columns * len(face_lines)):
+        # everything is a nice 2D array
+        return _parse_faces_vectorized(
+            array=array,
+            columns=columns,
+            sample_line=face_lines[0],
+            polygons=polygons)
+
+    # if we had something annoying like mixed in quads
+    # or faces that differ per-line we have to loop
+    # i.e. something like:
+    #  '31407 31406 31408',
+    #  '32303/2469 32304/2469 32305/2469',
+    log.debug('faces have mixed data: using slow fallback!')
+    return _parse_faces_fallback(face_lines)
+
+
+def _parse_faces_vectorized(array, columns, sample_line, polygons=False):
     """
     Parse loaded homogeneous (tri/quad) face data in a
     vectorized manner.
@@ -388,6 +435,9 @@ def _parse_faces_vectorized(array, columns, sample_line):
       Number of columns in the file
     sample_line : str
       A single line so we can assess the ordering
+    polygons : bool
+      Keep texture and normal references for faces
+      with more than three vertices
 
     Returns
     --------------
@@ -411,10 +461,12 @@ def _parse_faces_vectorized(array, columns, sample_line):
     # slice the faces out of the blob array
     faces = array[:, index]
 
-    # TODO: probably need to support 8 and 12 columns for quads
-    # or do something more general
     faces_tex, faces_norm = None, None
-    if columns == 6:
+    if group_count != 3 and not polygons:
+        # only triangles use texture and normal references
+        return faces, faces_tex, faces_norm
+
+    if per_ref == 2:
         # if we have two values per vertex the second
         # one is index of texture coordinate (`vt`)
         # count how many delimiters are in the first face line
@@ -434,7 +486,7 @@ def _parse_faces_vectorized(array, columns, sample_line):
         else:
             log.debug('face lines are weird: {}'.format(
                 sample_line))
-    elif columns == 9:
+    elif per_ref == 3:
         # if we have three values per vertex
         # second value is always texture
         faces_tex = array[:, index + 1]
@@ -629,7 +681,8 @@ def _parse_vertices(text):
     if tol.strict:
         # check to make sure our subsetting
         # didn't miss any vertices or data
-        assert len(v) == text.count('\nv ')
+        if v is not None:
+            assert len(v) == text.count('\nv ')
         # make sure optional data matches file too
         if vn is not None:
             assert len(vn) == text.count('\nvn ')
@@ -752,6 +805,256 @@ def _preprocess_faces(text):
     return face_tuples
 
 
+class _ArrayBuffer(object):
+    """
+    A 2D numpy array which rows can be appended to
+    in amortized constant time by over- allocating.
+    """
+
+    def __init__(self, dtype):
+        self._dtype = dtype
+        self._data = None
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def shape(self):
+        if self._data is None:
+            return (0,)
+        return (self._count,) + self._data.shape[1:]
+
+    def extend(self, values):
+        """
+        Append rows to the end of the buffer.
+
+        Parameters
+        ------------
+        values : (n, d) array
+          Rows to append
+        """
+        if self._data is None:
+            self._data = np.empty((len(values) * 2, values.shape[1]),
+                                  dtype=self._dtype)
+        end = self._count + len(values)
+        if end > len(self._data):
+            # grow geometrically so appending stays cheap
+            grown = np.empty((max(end, len(self._data) * 2),
+                              self._data.shape[1]),
+                             dtype=self._dtype)
+            grown[:self._count] = self._data[:self._count]
+            self._data = grown
+        self._data[self._count:end] = values
+        self._count = end
+
+    def array(self):
+        """
+        Get the rows appended to the buffer.
+
+        Returns
+        ------------
+        array : (n, d) array or None
+          Values appended or None if empty
+        """
+        if self._data is None:
+            return None
+        # shrink storage to the data without copying
+        self._data.resize((self._count, self._data.shape[1]),
+                          refcheck=False)
+        return self._data
+
+
+def _triangulate_fan(array):
+    """
+    Convert polygon faces to triangles using a fan
+    around the first vertex of each polygon.
+
+    Parameters
+    ------------
+    array : (n, d) int
+      Polygon faces with d vertices each
+
+    Returns
+    ------------
+    triangles : (n * (d - 2), 3) int
+      Triangulated faces
+    """
+    if array is None or array.shape[1] == 3:
+        return array
+    count = array.shape[1]
+    if count == 4:
+        # match the order of `_parse_faces_fallback`
+        index = [0, 1, 2, 2, 3, 0]
+    else:
+        index = np.column_stack((np.zeros(count - 2, dtype=np.int64),
+                                 np.arange(1, count - 1),
+                                 np.arange(2, count))).ravel()
+    return array[:, index].reshape((-1, 3))
+
+
+def _parse_stream(file_obj, group_material=True, block_size=16777216):
+    """
+    Parse an OBJ file by reading it in blocks of complete
+    lines which are parsed into growing arrays, so the full
+    text of the file is never held in memory.
+
+    Parameters
+    ------------
+    file_obj : file like object
+      Contains OBJ data
+    group_material : bool
+      Group faces by material rather than by object
+    block_size : int
+      Number of bytes to read at a time
+
+    Returns
+    ------------
+    v : (n, 3) float or None
+      Vertices in space
+    vn : (m, 3) float or None
+      Vertex normals
+    vt : (p, 2) float or None
+      Vertex texture coordinates
+    vc : (n, 3) float or None
+      Per-vertex color
+    face_tuples : (q,) list
+      Tuples of (material, object, (faces, faces_tex, faces_norm))
+    mtl_path : str or None
+      Location of the first material library
+    """
+    # buffers for vertex data
+    buffers = {k: _ArrayBuffer(np.float64)
+               for k in ['v', 'vn', 'vt', 'vc']}
+    # groups of faces keyed by material or a counter
+    groups = {}
+    # current material and object, a counter which is
+    # incremented at every object or material change and
+    # the first material library referenced
+    state = {'material': None,
+             'object': None,
+             'group': 0,
+             'mtllib': None}
+
+    def consume(text):
+        """
+        Parse a block of complete lines.
+        """
+        # use the same logic as the full text parser
+        text = '\n' + text.replace('\r\n', '\n').replace('\\\n', '')
+
+        # parse vertices with the full text logic
+        parsed = _parse_vertices(text=text)
+        for key, array in zip(['v', 'vn', 'vt', 'vc'], parsed):
+            if buffers[key] is None or array is None:
+                continue
+            if (len(buffers[key]) > 0 and
+                    array.shape[1] != buffers[key].shape[1]) or (
+                    key != 'vc' and
+                    len(array) != text.count('\n{} '.format(key))):
+                # rows were malformed or don't match previous
+                # blocks so indexes into them would be wrong
+                buffers[key] = None
+                continue
+            buffers[key].extend(array)
+
+        if state['mtllib'] is None:
+            position = text.find('\nmtllib')
+            if position >= 0:
+                state['mtllib'] = text[position + 7:text.find(
+                    '\n', position + 1)].strip()
+
+        # split the block into runs of faces at every
+        # line which changes the material or object
+        splits = [0] + [m.start(0) for m in re.finditer(
+            '\n(usemtl|o) ', text)] + [len(text)]
+        for start, end in zip(splits[:-1], splits[1:]):
+            chunk = text[start:end]
+            if chunk.startswith('\no '):
+                state['object'] = chunk[3:chunk.find('\n', 1)].strip()
+                state['group'] += 1
+            elif chunk.startswith('\nusemtl '):
+                state['material'] = chunk[8:chunk.find('\n', 1)].strip()
+                state['group'] += 1
+
+            face_lines = [i.split('\n', 1)[0]
+                          for i in chunk.split('\nf ')[1:]]
+            if len(face_lines) == 0:
+                continue
+
+            if group_material:
+                key = state['material']
+            else:
+                key = state['group']
+            if key not in groups:
+                groups[key] = {'material': state['material'],
+                               'blocks': []}
+            groups[key]['object'] = state['object']
+            # store the parsed indexes for each block
+            groups[key]['blocks'].append(
+                _parse_faces(face_lines, polygons=True))
+
+    # the end of the last block which wasn't a complete line
+    tail = None
+    while True:
+        block = file_obj.read(block_size)
+        final = len(block) == 0
+        if tail is not None:
+            block = tail + block
+        if final:
+            # parse whatever is left at the end of the file
+            if len(block) > 0:
+                consume(util.decode_text(block))
+            break
+
+        if isinstance(block, bytes):
+            newline, slash = b'\n', b'\\'
+            block = block.replace(b'\r\n', newline)
+        else:
+            newline, slash = '\n', '\\'
+            block = block.replace('\r\n', newline)
+        # cut at the last newline which isn't escaped
+        cut = block.rfind(newline)
+        while cut > 0 and block[cut - 1:cut] == slash:
+            cut = block.rfind(newline, 0, cut - 1)
+        if cut < 0:
+            # no complete line in this block yet
+            tail = block
+            continue
+        consume(util.decode_text(block[:cut + 1]))
+        tail = block[cut + 1:]
+
+    v, vn, vt, vc = (None if buffers[k] is None else buffers[k].array()
+                     for k in ['v', 'vn', 'vt', 'vc'])
+    if v is None or vc is None or len(vc) != len(v):
+        # only some blocks had vertex colors
+        vc = None
+
+    face_tuples = []
+    for group in groups.values():
+        blocks = group.pop('blocks')
+        # match parsing every face line of the group at once
+        width = set(b[0].shape[1] for b in blocks)
+        if len(width) == 1 and width != {3}:
+            # the same polygons everywhere would have been parsed
+            # as a 2D array without texture or normal references
+            blocks = [(b[0], None, None) for b in blocks]
+        else:
+            # mixed polygons would have been triangulated
+            blocks = [[_triangulate_fan(i) for i in b] for b in blocks]
+        parsed = [np.vstack([b[0] for b in blocks])]
+        for i in [1, 2]:
+            # only keep texture or normal references every block had
+            if all(b[i] is not None for b in blocks):
+                parsed.append(np.vstack([b[i] for b in blocks]))
+            else:
+                parsed.append(None)
+        face_tuples.append(
+            (group['material'], group['object'], tuple(parsed)))
+
+    return v, vn, vt, vc, face_tuples, state['mtllib']
+
+
 def export_obj(mesh,
                include_normals=True,
                include_color=True,
@@ -761,7 +1064,8 @@ def export_obj(mesh,
                resolver=None,
                digits=8,
                mtl_name=None,
-               header='https://github.com/mikedh/trimesh'):
+               header='https://github.com/mikedh/trimesh',
+               file_obj=None):
     """
     Export a mesh as a Wavefront OBJ file.
     TODO: scenes with textured meshes
@@ -789,11 +1093,14 @@ def export_obj(mesh,
       If passed, the file name of the MTL file.
     header : str or None
       Header string for top of file or None for no header.
+    file_obj : None or file-like
+      If passed write the OBJ text to this file object
+      in chunks rather than returning it
 
     Returns
     -----------
-    export : str
-      OBJ format output
+    export : str or None
+      OBJ format output or None if written to `file_obj`
     texture : dict
       Contains files that need to be saved in the same
       directory as the exported mesh: {file name : bytes}
@@ -815,7 +1122,9 @@ def export_obj(mesh,
     else:
         raise ValueError('must be Trimesh or Scene!')
 
-    # collect lines to export
+    # collect lines to export: either a string or a tuple
+    # of arguments for `_format_rows` which are only
+    # converted to text when they are written
     objects = deque([])
     # keep track of the number of each export element
     counts = {'v': 0, 'vn': 0, 'vt': 0}
@@ -830,35 +1139,25 @@ def export_obj(mesh,
         if (include_color and
             current.visual.kind in ['vertex', 'face'] and
                 len(current.visual.vertex_colors)):
-
-            # create a stacked blob with position and color
-            v_blob = np.column_stack((
-                current.vertices,
-                to_float(current.visual.vertex_colors[:, :3])))
+            # position and color are stacked as each row is written
+            v_blob = (current.vertices,
+                      to_float(current.visual.vertex_colors[:, :3]))
         else:
             # otherwise just export vertices
-            v_blob = current.vertices
+            v_blob = (current.vertices,)
 
-            # add the first vertex key and convert the array
         # add the vertices
-        export = deque(
-            ['v ' + util.array_to_string(
-                v_blob,
-                col_delim=' ',
-                row_delim='\nv ',
-                digits=digits)])
+        export = deque([('v', v_blob, digits)])
         # only include vertex normals if they're already stored
         if include_normals and current._cache.cache.get('vertex_normals') is not None:
-
             try:
-                converted = util.array_to_string(
-                    current.vertex_normals,
-                    col_delim=' ',
-                    row_delim='\nvn ',
-                    digits=digits)
+                normals = np.asanyarray(
+                    current.vertex_normals, dtype=np.float64)
+                if not util.is_shape(normals, (len(current.vertices), 3)):
+                    raise ValueError('vertex normals are wrong shape!')
                 # if vertex normals are stored in cache export them
                 face_type.append('vn')
-                export.append('vn ' + converted)
+                export.append(('vn', (normals,), digits))
             except BaseException:
                 log.debug('failed to convert vertex normals',
                           exc_info=True)
@@ -887,16 +1186,13 @@ def export_obj(mesh,
                 tex_name = materials[hashed][1]
 
                 # export the UV coordinates
-                if len(np.shape(getattr(current.visual, 'uv', None))) == 2:
-                    converted = util.array_to_string(
-                        current.visual.uv,
-                        col_delim=' ',
-                        row_delim='\nvt ',
-                        digits=digits)
+                uv = getattr(current.visual, 'uv', None)
+                if len(np.shape(uv)) == 2:
+                    uv = np.asanyarray(uv, dtype=np.float64)
                     # if vertex texture exists and is the right shape
                     face_type.append('vt')
                     # add the uv coordinates
-                    export.append('vt ' + converted)
+                    export.append(('vt', (uv,), digits))
                 # add the directive to use the exported material
                 export.appendleft('usemtl {}'.format(tex_name))
             except BaseException:
@@ -907,27 +1203,25 @@ def export_obj(mesh,
         face_format = face_formats[tuple(face_type)]
         # add the exported faces to the export if available
         if hasattr(current, 'faces'):
-            export.append('f ' + util.array_to_string(
-                current.faces + 1 + counts['v'],
-                col_delim=' ',
-                row_delim='\nf ',
-                value_format=face_format))
+            # offset the one- indexed faces as they are written
+            export.append(('f', (current.faces,), digits,
+                           face_format, 1 + counts['v']))
         # offset our vertex position
         counts['v'] += len(current.vertices)
 
         # add object name if found in metadata
         if 'name' in current.metadata:
-            export.appendleft(
-                '\no {}'.format(current.metadata['name']))
+            export.appendleft('o {}'.format(current.metadata['name']))
+            export.appendleft('')
         # add this object
-        objects.append('\n'.join(export))
+        objects.extend(export)
 
+    # files like the MTL and images referenced by the OBJ
+    mtl_data = {}
     # combine materials
     if len(materials) > 0:
         # collect text for a single mtllib file
         mtl_lib = []
-        # collect files like images to write
-        mtl_data = {}
         # now loop through: keys are garbage hash
         # values are (data, name)
         for data, name in materials.values():
@@ -959,8 +1253,18 @@ def export_obj(mesh,
     if header is not None:
         # add a created-with header to the top of the file
         objects.appendleft('# {}'.format(header))
-    # combine elements into a single string
-    text = '\n'.join(objects)
+
+    # convert the lines to text one block at a time
+    chunks = (_format_rows(*item) if isinstance(item, tuple)
+              else [item + '\n'] for item in objects)
+    if file_obj is None:
+        # combine elements into a single string
+        text = ''.join(c for chunk in chunks for c in chunk)
+    else:
+        text = None
+        for chunk in chunks:
+            for c in chunk:
+                util.write_encoded(file_obj, c)
 
     # if we have a resolver and have asked to write texture
     if write_texture and resolver is not None and len(materials) > 0:
@@ -974,4 +1278,42 @@ def export_obj(mesh,
     return text
 
 
+def _format_rows(prefix, arrays, digits=8, value_format='{}',
+                 offset=0, count=65536):
+    """
+    Convert rows of arrays to OBJ lines a block at a time
+    so the whole file never has to be formatted at once.
+
+    Parameters
+    ------------
+    prefix : str
+      Keyword at the start of every line, i.e. 'v'
+    arrays : sequence of (n, d) float or int
+      Arrays with the same length stacked as columns
+    digits : int
+      Number of digits to include for floating point
+    value_format : str
+      Format for every value, i.e. '{}/{}'
+    offset : int
+      Added to every value as it is formatted
+    count : int
+      Number of rows to format at once
+
+    Yields
+    ------------
+    text : str
+      Lines for a block of rows
+    """
+    for start in range(0, len(arrays[0]), count):
+        block = np.column_stack([a[start:start + count] for a in arrays])
+        if offset != 0:
+            block += offset
+        yield prefix + ' ' + util.array_to_string(
+            block,
+            col_delim=' ',
+            row_delim='\n' + prefix + ' ',
+            digits=digits,
+            value_format=value_format) + '\n'
+
+
 _obj_loaders = {'obj': load_obj}
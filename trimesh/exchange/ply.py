@@ -70,6 +70,7 @@ def load_ply(file_obj,
              resolver=None,
              fix_texture=True,
              prefer_color=None,
+             mmap=False,
              *args,
              **kwargs):
     """
@@ -87,6 +88,10 @@ def load_ply(file_obj,
       are disconnected.
     prefer_color : None, 'vertex', or 'face'
       Which kind of color to prefer if both defined
+    mmap : bool
+      Memory map the elements of binary files rather than
+      reading them and don't merge vertices unless
+      `process` is passed
 
     Returns
     ---------
@@ -102,7 +107,7 @@ def load_ply(file_obj,
     if is_ascii:
         ply_ascii(elements, file_obj)
     else:
-        ply_binary(elements, file_obj)
+        ply_binary(elements, file_obj, mmap=mmap)
 
     # try to load the referenced image
     image = None
@@ -125,6 +130,10 @@ def load_ply(file_obj,
         fix_texture=fix_texture,
         prefer_color=prefer_color)
 
+    if mmap and 'process' not in kwargs:
+        # leave merging vertices until it is asked for
+        kwargs['process'] = False
+
     return kwargs
 
 
@@ -471,9 +480,14 @@ def elements_to_kwargs(elements,
     kwargs = {'metadata': {'_ply_raw': elements}}
 
     if 'vertex' in elements and elements['vertex']['length']:
-        vertices = np.column_stack(
-            [elements['vertex']['data'][i]
-             for i in 'xyz'])
+        vertices = None
+        if isinstance(elements['vertex']['data'], np.memmap):
+            # try to reference the mapped file without reading it
+            vertices = _field_view(elements['vertex']['data'], 'xyz')
+        if vertices is None:
+            vertices = np.column_stack(
+                [elements['vertex']['data'][i]
+                 for i in 'xyz'])
         if not util.is_shape(vertices, (-1, 3)):
             raise ValueError('Vertices were not (n,3)!')
     else:
@@ -617,6 +631,48 @@ def elements_to_kwargs(elements,
     return kwargs
 
 
+def _field_view(data, names):
+    """
+    Get multiple fields of a structured array as a 2D
+    view which references the same memory if the fields
+    have the same dtype and are next to each other.
+
+    Parameters
+    ------------
+    data : (n,) structured array
+      Contiguous array with named fields
+    names : (m,) str
+      Names of fields to include as columns
+
+    Returns
+    ------------
+    view : (n, m) array or None
+      View of the fields or None if not possible
+    """
+    try:
+        fields = [data.dtype.fields[n] for n in names]
+    except (KeyError, TypeError):
+        return None
+    dtype = fields[0][0]
+    offsets = [f[1] for f in fields]
+    # fields need to be the same scalar type and adjacent
+    if (not data.flags['C_CONTIGUOUS'] or
+            dtype.shape != () or
+            any(f[0] != dtype for f in fields) or
+            offsets != [offsets[0] + i * dtype.itemsize
+                        for i in range(len(fields))]):
+        return None
+    # bytes from the first field on as the field type, which
+    # keeps the subclass so memory mapped data stays a memmap
+    flat = data.view(np.uint8)[offsets[0]:]
+    flat = flat[:len(flat) - len(flat) % dtype.itemsize].view(dtype)
+    return np.lib.stride_tricks.as_strided(
+        flat,
+        shape=(len(data), len(names)),
+        strides=(data.dtype.itemsize, dtype.itemsize),
+        subok=True)
+
+
 def element_colors(element):
     """
     Given an element, try to extract RGBA color from
@@ -737,12 +793,16 @@ def ply_ascii(elements, file_obj):
       of the data section (past the header).
     """
 
-    # get the file contents as a string
-    text = str(file_obj.read().decode('utf-8'))
-    # split by newlines
-    lines = str.splitlines(text)
-    # get each line as an array split by whitespace
-    array = [np.fromstring(i, sep=' ') for i in lines]
+    # get the file contents as bytes
+    raw = file_obj.read()
+    if not isinstance(raw, bytes):
+        raw = raw.encode('utf-8')
+    if not raw.endswith(b'\n'):
+        raw += b'\n'
+    # the index of the newline which ends every line
+    # so each element can be sliced out as one block
+    ends = np.nonzero(np.frombuffer(
+        raw, dtype=np.uint8) == ord('\n'))[0]
     # store the line position in the file
     row_pos = 0
 
@@ -751,19 +811,22 @@ def ply_ascii(elements, file_obj):
         # if the element is empty ignore it
         if 'length' not in values or values['length'] == 0:
             continue
-        data = array[row_pos:row_pos + values['length']]
-        row_pos += values['length']
-        # try stacking the data, which simplifies column-wise access. this is only
-        # possible, if all rows have the same length.
-        try:
-            data = np.vstack(data)
-            col_count_equal = True
-        except ValueError:
-            col_count_equal = False
+        length = values['length']
+        # the range of bytes containing every row of the element
+        start = 0 if row_pos == 0 else ends[row_pos - 1] + 1
+        end = ends[min(row_pos + length, len(ends)) - 1] + 1
+        block = raw[start:end]
+        row_pos += length
 
         # number of list properties in this element
         list_count = sum(1 for dt in values['properties'].values() if '$LIST' in dt)
-        if col_count_equal and list_count <= 1:
+        if list_count <= 1:
+            # parse every row of the element in a single pass
+            data = _ascii_block(values['properties'], block, length)
+        else:
+            data = None
+
+        if data is not None:
             # all rows have the same length and we only have at most one list
             # property where all entries have the same length. this means we can
             # use the quick numpy-based loading.
@@ -774,12 +837,60 @@ def ply_ascii(elements, file_obj):
             # the data by iterating all rows and checking for list-lengths. this is
             # slower than the variant above.
             element_data = load_element_different(
-                values['properties'], data)
+                values['properties'],
+                [np.fromstring(i, sep=' ')
+                 for i in block.decode('utf-8').splitlines()])
 
         elements[key]['data'] = element_data
 
 
-def ply_binary(elements, file_obj):
+def _ascii_block(properties, block, length):
+    """
+    Parse the rows of an ASCII PLY element into a 2D
+    array with one vectorized call if every row has
+    the same number of values.
+
+    Parameters
+    ------------
+    properties : dict
+      Property definitions for the element
+    block : bytes
+      ASCII data containing every row of the element
+    length : int
+      Number of rows in the element
+
+    Returns
+    ------------
+    data : (length, n) float or None
+      Values of each row, or None if rows had
+      lists of different lengths
+    """
+    flat = np.fromstring(block, sep=' ')
+    if length == 0 or len(flat) == 0 or len(flat) % length != 0:
+        return None
+    data = flat.reshape((length, -1))
+
+    # check the count of a list property is the same
+    # for every row so the columns line up
+    index = 0
+    for dt in properties.values():
+        if index >= data.shape[1]:
+            break
+        if '$LIST' in dt:
+            count = data[:, index]
+            if (count != count[0]).any() or (
+                    index + 1 + count[0] > data.shape[1]):
+                return None
+            index += int(count[0]) + 1
+        else:
+            index += 1
+    if index != data.shape[1]:
+        # rows had values which didn't match the properties
+        return None
+    return data
+
+
+def ply_binary(elements, file_obj, mmap=False):
     """
     Load the data from a binary PLY file into the elements data structure.
 
@@ -791,6 +902,9 @@ def ply_binary(elements, file_obj):
     file_obj : open file object
       With current position at the start
       of the data section (past the header)
+    mmap : bool
+      If the file is on disk store each element as a
+      copy- on- write `np.memmap` rather than reading it
     """
 
     def populate_listsize(file_obj, elements):
@@ -854,6 +968,24 @@ def ply_binary(elements, file_obj):
         for key in elements.keys():
             items = list(elements[key]['properties'].items())
             dtype = np.dtype(items)
+            if mmap:
+                start = file_obj.tell()
+                try:
+                    # writes to the map only change memory
+                    elements[key]['data'] = np.memmap(
+                        file_obj,
+                        dtype=dtype,
+                        mode='c',
+                        offset=start,
+                        shape=(elements[key]['length'],))
+                    # move past the mapped element
+                    file_obj.seek(
+                        start + elements[key]['length'] * dtype.itemsize)
+                    continue
+                except BaseException:
+                    # file objects like BytesIO can't be mapped
+                    log.debug('unable to memory map file', exc_info=True)
+                    file_obj.seek(start)
             data = file_obj.read(elements[key]['length'] * dtype.itemsize)
             try:
                 elements[key]['data'] = np.frombuffer(
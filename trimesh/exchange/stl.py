@@ -20,7 +20,7 @@ _stl_dtype_header = np.dtype([('header', np.void, 80),
                               ('face_count', '<i4')])
 
 
-def load_stl(file_obj, **kwargs):
+def load_stl(file_obj, mmap=False, **kwargs):
     """
     Load an STL file from a file object.
 
@@ -28,6 +28,9 @@ def load_stl(file_obj, **kwargs):
     ----------
     file_obj : open file-like object
       Containing STL data
+    mmap : bool
+      Memory map binary files rather than reading them
+      and don't merge vertices unless `process` is passed
 
     Returns
     ----------
@@ -44,7 +47,11 @@ def load_stl(file_obj, **kwargs):
         # if that is true, it is almost certainly a binary STL file
         # if the header doesn't match the file length a HeaderError will be
         # raised
-        return load_stl_binary(file_obj)
+        result = load_stl_binary(file_obj, mmap=mmap)
+        if mmap and 'process' not in kwargs:
+            # leave merging vertices until it is asked for
+            result['process'] = False
+        return result
     except HeaderError:
         # move the file back to where it was initially
         file_obj.seek(file_pos)
@@ -54,7 +61,7 @@ def load_stl(file_obj, **kwargs):
         return load_stl_ascii(file_obj)
 
 
-def load_stl_binary(file_obj):
+def load_stl_binary(file_obj, mmap=False):
     """
     Load a binary STL file from a file object.
 
@@ -62,6 +69,10 @@ def load_stl_binary(file_obj):
     ----------
     file_obj : open file- like object
       Containing STL data
+    mmap : bool
+      If the file is on disk memory map it instead of
+      reading it, which avoids holding both the raw file
+      and the loaded arrays in memory at the same time
 
     Returns
     ----------
@@ -117,22 +128,50 @@ def load_stl_binary(file_obj):
             'Binary STL has incorrect length in header: {} vs {}'.format(
                 len_data, len_expected))
 
-    blob = np.frombuffer(file_obj.read(), dtype=_stl_dtype)
-
+    face_count = int(header['face_count'][0])
     # return empty geometry if there are no vertices
-    if not len(blob['vertices']):
+    if face_count == 0:
         return {'geometry': {}}
 
+    if mmap:
+        try:
+            blob = np.memmap(file_obj,
+                             dtype=_stl_dtype,
+                             mode='r',
+                             offset=data_start,
+                             shape=(face_count,))
+        except BaseException:
+            # file objects like BytesIO can't be mapped
+            util.log.debug('unable to memory map file', exc_info=True)
+            file_obj.seek(data_start)
+            mmap = False
+    if not mmap:
+        blob = np.frombuffer(file_obj.read(), dtype=_stl_dtype)
+
     # all of our vertices will be loaded in order
     # so faces are just sequential indices reshaped.
-    faces = np.arange(header['face_count'] * 3).reshape((-1, 3))
+    faces = np.arange(face_count * 3).reshape((-1, 3))
+
+    if mmap:
+        # convert directly from the mapped records into the
+        # final dtype rather than through a float32 copy
+        vertices = np.empty((face_count * 3, 3), dtype=np.float64)
+        vertices.reshape((-1, 3, 3))[:] = blob['vertices']
+        normals = np.array(blob['normals'], dtype=np.float64)
+        # copy so nothing returned references the mapped file
+        attributes = np.array(blob['attributes'])
+        del blob
+    else:
+        vertices = blob['vertices'].reshape((-1, 3))
+        normals = blob['normals'].reshape((-1, 3))
+        attributes = blob['attributes']
 
     # there are two bytes per triangle saved for anything
     # which is sometimes used for face color
-    result = {'vertices': blob['vertices'].reshape((-1, 3)),
-              'face_normals': blob['normals'].reshape((-1, 3)),
+    result = {'vertices': vertices,
+              'face_normals': normals,
               'faces': faces,
-              'face_attributes': {'stl': blob['attributes']},
+              'face_attributes': {'stl': attributes},
               'metadata': metadata}
     return result
 
@@ -418,7 +418,7 @@ class PointCloud(Geometry3D):
           Metadata about points
         """
         self._data = caching.DataStore()
-        self._cache = caching.Cache(self._data.hash)
+        self._cache = caching.Cache(self._data.version)
         self.metadata = {}
 
         if metadata is not None:
@@ -595,8 +595,16 @@ class PointCloud(Geometry3D):
         if data is None:
             self._data['vertices'] = None
         else:
-            # we want to copy data for new object
-            data = np.array(data, dtype=np.float64, copy=True)
+            if isinstance(data, np.memmap) and (
+                    getattr(data, 'mode', None) == 'c' or
+                    not data.flags.writeable):
+                # reference copy- on- write or read- only mapped
+                # files rather than reading all of them into memory
+                # but copy anything which could edit the file
+                data = np.asanyarray(data, dtype=np.float64)
+            else:
+                # we want to copy data for new object
+                data = np.array(data, dtype=np.float64, copy=True)
             if not util.is_shape(data, (-1, 3)):
                 raise ValueError('Point clouds must be (n, 3)!')
             self._data['vertices'] = data
@@ -7,11 +7,13 @@ Query mesh- point proximity.
 import numpy as np
 
 from . import util
+from . import caching
 
 from .grouping import group_min
 from .constants import tol, log_time
 from .triangles import closest_point as _corresponding
 from .triangles import points_to_barycentric
+from .winding import WindingNumber
 
 try:
     from scipy.spatial import cKDTree
@@ -19,6 +21,10 @@ except BaseException as E:
     from .exceptions import closure
     cKDTree = closure(E)
 
+# the most point- triangle candidate pairs evaluated at once
+# as every pair needs roughly 200 bytes of intermediate arrays
+_max_pairs = 1 << 20
+
 
 def nearby_faces(mesh, points):
     """
@@ -47,10 +53,37 @@ def nearby_faces(mesh, points):
     if not util.is_shape(points, (-1, 3)):
         raise ValueError('points must be (n,3)!')
 
-    # an r-tree containing the axis aligned bounding box for every triangle
-    rtree = mesh.triangles_tree
-    # a kd-tree containing every vertex of the mesh
-    kdtree = cKDTree(mesh.vertices[mesh.referenced_vertices])
+    query, faces = _nearby_pairs(mesh, points)
+    candidates = np.split(
+        faces, np.searchsorted(query, np.arange(1, len(points))))
+
+    return candidates
+
+
+def _nearby_pairs(mesh, points, kdtree=None):
+    """
+    Find every pair of query point and nearby face in one
+    vectorized query, as used by `nearby_faces`.
+
+    Parameters
+    ----------
+    mesh : trimesh.Trimesh
+      Mesh to query.
+    points : (n, 3) float
+       Points in space
+    kdtree : scipy.spatial.cKDTree or None
+      Tree of referenced vertices, created if not passed
+
+    Returns
+    -----------
+    query : (h,) int
+      Index of points, sorted
+    faces : (h,) int
+      Index of mesh.faces near each point
+    """
+    if kdtree is None:
+        # a kd-tree containing every vertex of the mesh
+        kdtree = cKDTree(mesh.vertices[mesh.referenced_vertices])
 
     # query the distance to the nearest vertex to get AABB of a sphere
     distance_vertex = kdtree.query(points)[0].reshape((-1, 1))
@@ -60,10 +93,9 @@ def nearby_faces(mesh, points):
     bounds = np.column_stack((points - distance_vertex,
                               points + distance_vertex))
 
-    # faces that intersect axis aligned bounding box
-    candidates = [list(rtree.intersection(b)) for b in bounds]
-
-    return candidates
+    # faces that intersect axis aligned bounding box for every
+    # query point in one traversal of the triangle BVH
+    return mesh.triangles_tree.query_bounds(bounds)
 
 
 def closest_point_naive(mesh, points):
@@ -117,7 +149,7 @@ def closest_point_naive(mesh, points):
     return closest, distance, triangle_id
 
 
-def closest_point(mesh, points):
+def closest_point(mesh, points, chunk=100000, workers=None):
     """
     Given a mesh and a list of points find the closest point
     on any triangle.
@@ -128,6 +160,12 @@ def closest_point(mesh, points):
       Mesh to query
     points : (m, 3) float
       Points in space
+    chunk : int
+      Number of points to process at once, the candidate
+      pairs of each block are also evaluated in runs of
+      a bounded size to limit intermediate arrays
+    workers : None or int
+      If passed, run blocks on a thread pool of this size
 
     Returns
     ----------
@@ -141,36 +179,251 @@ def closest_point(mesh, points):
     points = np.asanyarray(points, dtype=np.float64)
     if not util.is_shape(points, (-1, 3)):
         raise ValueError('points must be (n,3)!')
+    if len(points) == 0:
+        return (np.zeros((0, 3), dtype=np.float64),
+                np.zeros(0, dtype=np.float64),
+                np.zeros(0, dtype=np.int64))
 
-    # do a tree- based query for faces near each point
-    candidates = nearby_faces(mesh, points)
-    # view triangles as an ndarray so we don't have to recompute
-    # the MD5 during all of the subsequent advanced indexing
+    blocks = [block[1:] for block in closest_point_chunks(
+        mesh=mesh, points=points, chunk=chunk, workers=workers)]
+    if len(blocks) == 1:
+        return blocks[0]
+
+    # stack the results of every block
+    return tuple(np.concatenate(i) for i in zip(*blocks))
+
+
+def closest_point_chunks(mesh, points, chunk=100000, workers=None):
+    """
+    Find the closest point on a mesh for a list of points in
+    fixed size blocks, yielding the result of each block in
+    order as it completes so the result for every point never
+    has to be in memory at the same time.
+
+    As points far from the mesh may have many more candidate
+    triangles than points near the surface, each block is
+    evaluated in runs of points with at most `_max_pairs`
+    point- triangle pairs.
+
+    The numpy kernels release the GIL, so passing `workers`
+    will evaluate blocks on a thread pool.
+
+    Parameters
+    ----------
+    mesh : trimesh.Trimesh
+      Mesh to query
+    points : (m, 3) float
+      Points in space
+    chunk : int
+      Number of points in each block
+    workers : None or int
+      If passed, run blocks on a thread pool of this size
+
+    Yields
+    ----------
+    start : int
+      Index of the first point in the block
+    closest : (c, 3) float
+      Closest point on triangles for each point in block
+    distance : (c,)  float
+      Distance to mesh.
+    triangle_id : (c,) int
+      Index of triangle containing closest point
+    """
+    points = np.asanyarray(points, dtype=np.float64)
+    if not util.is_shape(points, (-1, 3)):
+        raise ValueError('points must be (n,3)!')
+
+    # evaluate the cached values used by every block here so
+    # that threads aren't racing to populate the mesh cache
+    tree = mesh.triangles_tree
     triangles = mesh.triangles.view(np.ndarray)
+    normals = mesh.face_normals.view(np.ndarray)
+
+    chunk = max(int(chunk), 1)
+    starts = range(0, len(points), chunk)
+
+    def block(start):
+        result = _closest_point_block(
+            points=points[start:start + chunk],
+            tree=tree,
+            triangles=triangles,
+            normals=normals)
+        return (start,) + result
+
+    if workers is None or workers <= 1:
+        for start in starts:
+            yield block(start)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+    from collections import deque
+    with ThreadPoolExecutor(max_workers=int(workers)) as pool:
+        # only keep a bounded number of blocks in flight so
+        # a slow consumer doesn't accumulate every result
+        pending = deque()
+        for start in starts:
+            pending.append(pool.submit(block, start))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while len(pending) > 0:
+            yield pending.popleft().result()
+
+
+def nearest_candidates(tree, triangles, points):
+    """
+    Find every triangle which may contain the closest point
+    to each query point using a branch- and- bound search of
+    the triangle BVH.
+
+    An initial upper bound on the distance for each point is found
+    from the exact distance to the triangles in the leaf reached by
+    a greedy descent of the tree, which is then tightened during
+    traversal. Unlike `nearby_faces` the number of candidates
+    doesn't depend on the local density of vertices.
+
+    Parameters
+    ----------
+    tree : trimesh.bvh.BVH
+      Tree containing the bounds of every triangle
+    triangles : (n, 3, 3) float
+      Triangles in space
+    points : (m, 3) float
+      Points in space
+
+    Returns
+    -----------
+    query : (h,) int
+      Index of points, sorted
+    faces : (h,) int
+      Index of triangles which may be closest
+    """
+    points = np.asanyarray(points, dtype=np.float64)
+    if len(points) == 0:
+        return (np.array([], dtype=np.int64),
+                np.array([], dtype=np.int64))
+
+    # exact distance to every triangle in a nearby leaf
+    query, faces = tree.nearest_leaf(points)
+    vector = points[query] - _corresponding(
+        triangles[faces], points[query])
+    # every point has a leaf and query is sorted so
+    # the minimum per point can be done with reduceat
+    starts = np.searchsorted(query, np.arange(len(points)))
+    bound = np.minimum.reduceat(
+        util.diagonal_dot(vector, vector), starts) ** 0.5
+
+    # pad the bound so ambiguous closest points
+    # on multiple faces are all included
+    return tree.query_nearest(points, radius=bound, pad=tol.merge)
+
+
+def _closest_point_block(points, tree, triangles, normals):
+    """
+    Find the closest point on a mesh for one block of points.
+
+    Parameters
+    ----------
+    points : (m, 3) float
+      Points in space
+    tree : trimesh.bvh.BVH
+      Tree containing the bounds of every triangle
+    triangles : (n, 3, 3) float
+      Triangles of the mesh
+    normals : (n, 3) float
+      Face normals of the mesh
 
+    Returns
+    ----------
+    closest : (m, 3) float
+      Closest point on triangles for each point
+    distance : (m,)  float
+      Distance to mesh.
+    triangle_id : (m,) int
+      Index of triangle containing closest point
+    """
+    # do a tree- based query for faces near each point
+    # which returns pairs sorted by the index of the point
+    query, faces = nearest_candidates(
+        tree=tree, triangles=triangles, points=points)
+    if len(query) <= _max_pairs:
+        return _closest_pairs(points=points,
+                              tile_idxs=query,
+                              all_candidates=faces,
+                              triangles=triangles,
+                              normals=normals)
+
+    # the number of candidates per point varies a lot so split
+    # the block into runs of points with a bounded number of
+    # candidate pairs, only exceeding it for a single point
+    offsets = np.append(0, np.cumsum(
+        np.bincount(query, minlength=len(points))))
+    blocks = []
+    start = 0
+    while start < len(points):
+        end = np.searchsorted(
+            offsets, offsets[start] + _max_pairs, side='right') - 1
+        end = max(end, start + 1)
+        pairs = slice(offsets[start], offsets[end])
+        blocks.append(_closest_pairs(
+            points=points[start:end],
+            tile_idxs=query[pairs] - start,
+            all_candidates=faces[pairs],
+            triangles=triangles,
+            normals=normals))
+        start = end
+
+    return tuple(np.concatenate(i) for i in zip(*blocks))
+
+
+def _closest_pairs(points, tile_idxs, all_candidates, triangles, normals):
+    """
+    Find the closest point on a mesh from candidate pairs
+    of query point and triangle.
+
+    Parameters
+    ----------
+    points : (m, 3) float
+      Points in space
+    tile_idxs : (h,) int
+      Index of points, sorted and including every point
+    all_candidates : (h,) int
+      Index of triangles which may be closest
+    triangles : (n, 3, 3) float
+      Triangles of the mesh
+    normals : (n, 3) float
+      Face normals of the mesh
+
+    Returns
+    ----------
+    closest : (m, 3) float
+      Closest point on triangles for each point
+    distance : (m,)  float
+      Distance to mesh.
+    triangle_id : (m,) int
+      Index of triangle containing closest point
+    """
     # create the corresponding list of triangles
     # and query points to send to the closest_point function
-    all_candidates = np.concatenate(candidates)
-
-    num_candidates = list(map(len, candidates))
-    tile_idxs = np.repeat(np.arange(len(points)), num_candidates)
     query_point = points[tile_idxs, :]
-
     query_tri = triangles[all_candidates]
 
     # do the computation for closest point
     query_close = _corresponding(query_tri, query_point)
-    query_group = np.cumsum(num_candidates)[:-1]
 
     # vectors and distances for
     # closest point to query point
     query_vector = query_point - query_close
     query_distance = util.diagonal_dot(query_vector, query_vector)
 
-    # get best two candidate indices by arg-sorting the per-query_distances
-    qds = np.array_split(query_distance, query_group)
-    idxs = np.int32([qd.argsort()[:2] if len(qd) > 1 else [0, 0] for qd in qds])
-    idxs[1:] += query_group.reshape(-1, 1)
+    # get best two candidate indices by sorting the distances
+    # inside of the group of candidates for each query point
+    order = np.lexsort((query_distance, tile_idxs))
+    num_candidates = np.bincount(tile_idxs, minlength=len(points))
+    first = np.cumsum(num_candidates) - num_candidates
+    # if there is only one candidate use it twice
+    second = first + (num_candidates > 1)
+    idxs = order[np.column_stack((first, second))]
 
     # points, distances and triangle ids for best two candidates
     two_points = query_close[idxs]
@@ -184,14 +437,14 @@ def closest_point(mesh, points):
 
     # however: same closest point on two different faces
     # find the best one and correct triangle ids if necessary
-    check_distance = two_dists.ptp(axis=1) < tol.merge
+    check_distance = np.ptp(two_dists, axis=1) < tol.merge
     check_magnitude = np.all(np.abs(two_dists) > tol.merge, axis=1)
 
     # mask results where corrections may be apply
     c_mask = np.bitwise_and(check_distance, check_magnitude)
 
     # get two face normals for the candidate points
-    normals = mesh.face_normals[two_candidates[c_mask]]
+    normals = normals[two_candidates[c_mask]]
     # compute normalized surface-point to query-point vectors
     vectors = (query_vector[idxs[c_mask]] /
                two_dists[c_mask].reshape(-1, 2, 1) ** 0.5)
@@ -215,7 +468,7 @@ def closest_point(mesh, points):
     return result_close, result_distance, result_tid
 
 
-def signed_distance(mesh, points):
+def signed_distance(mesh, points, method='ray'):
     """
     Find the signed distance from a mesh to a list of points.
 
@@ -229,12 +482,20 @@ def signed_distance(mesh, points):
       Mesh to query.
     points : (n, 3) float
       Points in space
+    method : str
+      How to determine the sign of points which don't project
+      on to their closest triangle: 'ray' casts rays which requires
+      a watertight mesh, 'winding' uses the generalized winding
+      number for every point which is robust to holes
 
     Returns
     ----------
     signed_distance : (n,) float
       Signed distance from point to mesh
     """
+    if method not in ('ray', 'winding'):
+        raise ValueError('method must be `ray` or `winding`!')
+
     # make sure we have a numpy array
     points = np.asanyarray(points, dtype=np.float64)
 
@@ -247,6 +508,11 @@ def signed_distance(mesh, points):
     if not nonzero.any():
         return distance
 
+    if method == 'winding':
+        inside = mesh.nearest.winding_number(points[nonzero]) > 0.5
+        distance[nonzero] *= (inside.astype(int) * 2) - 1.0
+        return distance
+
     # For closest points that project directly in to the triangle, compute sign from
     # triangle normal Project each point in to the closest triangle plane
     nonzero = np.where(nonzero)[0]
@@ -308,9 +574,44 @@ class ProximityQuery(object):
 
     def __init__(self, mesh):
         self._mesh = mesh
+        # use the same cheap version check as the mesh cache
+        # rather than hashing every array of the mesh
+        self._cache = caching.Cache(id_function=mesh._data.version)
+
+    @caching.cache_decorator
+    def _winding(self):
+        """
+        A winding number engine for the current mesh.
+
+        Returns
+        ----------
+        winding : trimesh.winding.WindingNumber
+          Uses the triangle BVH of the mesh
+        """
+        return WindingNumber(
+            triangles=self._mesh.triangles.view(np.ndarray),
+            tree=self._mesh.triangles_tree)
+
+    def winding_number(self, points):
+        """
+        Find the generalized winding number of the mesh at each
+        point, which is close to 1.0 inside and 0.0 outside even
+        if the mesh has holes or other defects.
+
+        Parameters
+        ----------
+        points : (n, 3) float
+          Points in space
+
+        Returns
+        ----------
+        winding : (n,) float
+          Generalized winding number at each point
+        """
+        return self._winding.winding_number(points)
 
     @log_time
-    def on_surface(self, points):
+    def on_surface(self, points, chunk=100000, workers=None):
         """
         Given list of points, for each point find the closest point
         on any triangle of the mesh.
@@ -318,6 +619,10 @@ class ProximityQuery(object):
         Parameters
         ----------
         points : (m,3) float, points in space
+        chunk : int
+          Number of points to process at once
+        workers : None or int
+          If passed, run blocks on a thread pool of this size
 
         Returns
         ----------
@@ -329,7 +634,38 @@ class ProximityQuery(object):
           Index of closest triangle for each point.
         """
         return closest_point(mesh=self._mesh,
-                             points=points)
+                             points=points,
+                             chunk=chunk,
+                             workers=workers)
+
+    def on_surface_chunks(self, points, chunk=100000, workers=None):
+        """
+        Find the closest point on the mesh for a large number of
+        points, yielding results one block at a time.
+
+        Parameters
+        ----------
+        points : (m,3) float, points in space
+        chunk : int
+          Number of points in each block
+        workers : None or int
+          If passed, run blocks on a thread pool of this size
+
+        Yields
+        ----------
+        start : int
+          Index of the first point in the block
+        closest : (c, 3) float
+          Closest point on triangles for each point in block
+        distance : (c,) float
+          Distance to surface
+        triangle_id : (c,) int
+          Index of closest triangle for each point.
+        """
+        return closest_point_chunks(mesh=self._mesh,
+                                    points=points,
+                                    chunk=chunk,
+                                    workers=workers)
 
     def vertex(self, points):
         """
@@ -350,7 +686,7 @@ class ProximityQuery(object):
         tree = self._mesh.kdtree
         return tree.query(points)
 
-    def signed_distance(self, points):
+    def signed_distance(self, points, method='ray'):
         """
         Find the signed distance from a mesh to a list of points.
 
@@ -362,13 +698,15 @@ class ProximityQuery(object):
         -----------
         points : (n, 3) float
           Points in space
+        method : str
+          Determine inside or outside with 'ray' or 'winding'
 
         Returns
         ----------
         signed_distance : (n,) float
           Signed distance from point to mesh.
         """
-        return signed_distance(self._mesh, points)
+        return signed_distance(self._mesh, points, method=method)
 
 
 def longest_ray(mesh, points, directions):
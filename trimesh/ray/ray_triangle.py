@@ -8,6 +8,7 @@ from .ray_util import contains_points
 
 from ..constants import tol
 
+from .. import bvh
 from .. import util
 from .. import caching
 from .. import grouping
@@ -18,11 +19,22 @@ from .. import triangles as triangles_mod
 class RayMeshIntersector(object):
     """
     An object to query a mesh for ray intersections.
-    Precomputes an r-tree for each triangle on the mesh.
+    Precomputes a BVH for each triangle on the mesh.
     """
 
-    def __init__(self, mesh):
+    def __init__(self, mesh, workers=None):
+        """
+        Do ray- mesh queries.
+
+        Parameters
+        -------------
+        mesh : Trimesh object
+          Mesh to do ray tests on
+        workers : None or int
+          Default number of threads to use for queries
+        """
         self.mesh = mesh
+        self.workers = workers
         self._cache = caching.Cache(self.mesh.__hash__)
 
     def intersects_id(self,
@@ -30,6 +42,7 @@ class RayMeshIntersector(object):
                       ray_directions,
                       return_locations=False,
                       multiple_hits=True,
+                      workers=None,
                       **kwargs):
         """
         Find the intersections between the current mesh and an
@@ -45,6 +58,9 @@ class RayMeshIntersector(object):
           Consider multiple hits of each ray or not
         return_locations : bool
           Return hit locations or not
+        workers : None or int
+          Split rays into chunks and evaluate them on a
+          thread pool of this size, if None uses `self.workers`
 
         Returns
         -----------
@@ -55,6 +71,8 @@ class RayMeshIntersector(object):
         locations : (h, 3) float
           [optional] Position of intersection in space
         """
+        if workers is None:
+            workers = self.workers
         (index_tri,
          index_ray,
          locations) = ray_triangle_id(
@@ -63,7 +81,8 @@ class RayMeshIntersector(object):
              ray_directions=ray_directions,
              tree=self.mesh.triangles_tree,
              multiple_hits=multiple_hits,
-             triangles_normal=self.mesh.face_normals)
+             triangles_normal=self.mesh.face_normals,
+             workers=workers)
         if return_locations:
             if len(index_tri) == 0:
                 return index_tri, index_ray, locations
@@ -163,7 +182,7 @@ class RayMeshIntersector(object):
           Whether any ray hit any triangle on the mesh
         """
         index_tri, index_ray = self.intersects_id(
-            ray_origins, ray_directions)
+            ray_origins, ray_directions, **kwargs)
         hit_any = np.zeros(len(ray_origins), dtype=bool)
         hit_idx = np.unique(index_ray)
         if len(hit_idx) > 0:
@@ -197,7 +216,8 @@ def ray_triangle_id(
         ray_directions,
         triangles_normal=None,
         tree=None,
-        multiple_hits=True):
+        multiple_hits=True,
+        workers=None):
     """
     Find the intersections between a group of triangles and rays
 
@@ -211,8 +231,13 @@ def ray_triangle_id(
       Ray direction vectors
     triangles_normal : (n, 3) float
       Normal vector of triangles, optional
-    tree : rtree.Index
-      Rtree object holding triangle bounds
+    tree : trimesh.bvh.BVH or rtree.Index
+      Tree holding triangle bounds
+    multiple_hits : bool
+      Return every hit or only the first hit of each ray
+    workers : None or int
+      If passed, evaluate chunks of rays on a thread pool
+      of this size and return the same result as serial
 
     Returns
     -----------
@@ -227,13 +252,23 @@ def ray_triangle_id(
     ray_origins = np.asanyarray(ray_origins, dtype=np.float64)
     ray_directions = np.asanyarray(ray_directions, dtype=np.float64)
 
-    # if we didn't get passed an r-tree for the bounds of each
+    # if we didn't get passed a tree for the bounds of each
     # triangle create one here
     if tree is None:
-        tree = triangles_mod.bounds_tree(triangles)
+        tree = bvh.triangles_bvh(triangles)
+
+    if workers is not None and workers > 1 and len(ray_origins) > 1:
+        return _ray_triangle_parallel(
+            triangles=triangles,
+            ray_origins=ray_origins,
+            ray_directions=ray_directions,
+            triangles_normal=triangles_normal,
+            tree=tree,
+            multiple_hits=multiple_hits,
+            workers=workers)
 
     # find the list of likely triangles and which ray they
-    # correspond with, via rtree queries
+    # correspond with, via tree queries
     ray_candidates, ray_id = ray_triangle_candidates(
         ray_origins=ray_origins,
         ray_directions=ray_directions,
@@ -318,27 +353,131 @@ def ray_triangle_id(
     return index_tri[first], index_ray[first], location[first]
 
 
+def _ray_triangle_parallel(triangles,
+                           ray_origins,
+                           ray_directions,
+                           triangles_normal,
+                           tree,
+                           multiple_hits,
+                           workers,
+                           chunks_per_worker=4):
+    """
+    Run `ray_triangle_id` on contiguous chunks of rays using
+    a thread pool, as the heavy numpy operations release the GIL.
+
+    Every ray is handled independently and the results of each
+    chunk are sorted by ray index, so concatenating chunks in
+    order gives exactly the result of the serial path.
+
+    Parameters
+    -------------
+    triangles : (n, 3, 3) float
+      Triangles in space
+    ray_origins : (m, 3) float
+      Ray origin points
+    ray_directions : (m, 3) float
+      Ray direction vectors
+    triangles_normal : (n, 3) float
+      Normal vector of triangles, optional
+    tree : trimesh.bvh.BVH or rtree.Index
+      Tree holding triangle bounds
+    multiple_hits : bool
+      Return every hit or only the first hit of each ray
+    workers : int
+      Number of threads to use
+    chunks_per_worker : int
+      Split rays into this many chunks per thread
+      so uneven chunks can be balanced
+
+    Returns
+    -----------
+    index_triangle : (h,) int
+      Index of triangles hit
+    index_ray : (h,) int
+      Index of ray that hit triangle
+    locations : (h, 3) float
+      Position of intersection in space
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = int(workers)
+    # boundaries of each chunk of rays
+    split = np.unique(np.linspace(
+        0, len(ray_origins),
+        workers * chunks_per_worker + 1).astype(np.int64))
+
+    def run(start, end):
+        index_tri, index_ray, location = ray_triangle_id(
+            triangles=triangles,
+            ray_origins=ray_origins[start:end],
+            ray_directions=ray_directions[start:end],
+            triangles_normal=triangles_normal,
+            tree=tree,
+            multiple_hits=multiple_hits)
+        return index_tri, index_ray + start, location.reshape((-1, 3))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run, split[:-1], split[1:]))
+
+    index_tri, index_ray, location = zip(*results)
+    if sum(len(i) for i in index_tri) == 0:
+        # match the empty result of the serial path
+        return (np.array([], dtype=np.int64),
+                np.array([], dtype=np.int64),
+                np.array([], dtype=np.float64))
+    return (np.concatenate(index_tri),
+            np.concatenate(index_ray),
+            np.concatenate(location))
+
+
 def ray_triangle_candidates(ray_origins,
                             ray_directions,
-                            tree):
+                            tree,
+                            chunk=50000):
     """
     Do broad- phase search for triangles that the rays
     may intersect.
 
-    Does this by creating a bounding box for the ray as it
-    passes through the volume occupied by the tree
+    If `tree` is a `trimesh.bvh.BVH` every ray is walked through
+    the hierarchy at once in blocks of `chunk` rays, otherwise
+    it does this by creating a bounding box for the ray as it
+    passes through the volume occupied by the tree and querying
+    the tree once per ray.
 
     Parameters
     ------------
-    ray_origins:      (m,3) float, ray origin points
-    ray_directions:   (m,3) float, ray direction vectors
-    tree:             rtree object, contains AABB of each triangle
+    ray_origins : (m, 3) float
+      Ray origin points
+    ray_directions : (m, 3) float
+      Ray direction vectors
+    tree : trimesh.bvh.BVH or rtree.Index
+      Contains AABB of each triangle
+    chunk : int
+      Maximum number of rays to traverse at once,
+      which bounds the peak memory of the query
 
     Returns
     ----------
-    ray_candidates: (n,) int, triangle indexes
-    ray_id:         (n,) int, corresponding ray index for a triangle candidate
+    ray_candidates : (n,) int
+      Triangle indexes
+    ray_id : (n,) int
+      Corresponding ray index for a triangle candidate
     """
+    if hasattr(tree, 'query_rays'):
+        ray_candidates = []
+        ray_id = []
+        for start in range(0, len(ray_origins), int(chunk)):
+            end = start + int(chunk)
+            index, candidates = tree.query_rays(
+                origins=ray_origins[start:end],
+                directions=ray_directions[start:end])
+            ray_id.append(index + start)
+            ray_candidates.append(candidates)
+        if len(ray_id) == 0:
+            return (np.array([], dtype=np.int64),
+                    np.array([], dtype=np.int64))
+        return np.concatenate(ray_candidates), np.concatenate(ray_id)
+
     ray_bounding = ray_bounds(ray_origins=ray_origins,
                               ray_directions=ray_directions,
                               bounds=tree.bounds)
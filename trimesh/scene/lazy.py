@@ -0,0 +1,135 @@
+"""
+lazy.py
+-----------
+
+Hold geometry in a scene which is only loaded the first
+time it is accessed, so large assemblies can be opened and
+their graph, bounds and metadata inspected without creating
+every mesh.
+"""
+import collections
+
+import numpy as np
+
+try:
+    from collections.abc import ItemsView, ValuesView
+except BaseException:
+    from collections import ItemsView, ValuesView
+
+
+class LazyGeometry(object):
+    """
+    A placeholder for geometry which hasn't been loaded yet.
+    """
+
+    def __init__(self, loader, bounds=None, metadata=None):
+        """
+        Create a placeholder for geometry.
+
+        Parameters
+        ------------
+        loader : callable
+          Function with no arguments which returns geometry
+        bounds : None or (2, dimension) float
+          Axis aligned bounds of the geometry if known
+        metadata : None or dict
+          Metadata of the geometry if known
+        """
+        self.loader = loader
+        if bounds is not None:
+            bounds = np.array(bounds, dtype=np.float64)
+        self.bounds = bounds
+        if metadata is None:
+            metadata = {}
+        self.metadata = metadata
+
+    def load(self):
+        """
+        Load the geometry this placeholder represents.
+
+        Returns
+        -----------
+        geometry : trimesh.parent.Geometry
+          Loaded geometry
+        """
+        return self.loader()
+
+    def __repr__(self):
+        return '<trimesh.LazyGeometry(bounds={})>'.format(
+            None if self.bounds is None else self.bounds.tolist())
+
+
+class GeometryDict(collections.OrderedDict):
+    """
+    An ordered dict of geometry which may contain
+    `LazyGeometry` placeholders: they are loaded and
+    replaced with the geometry the first time the value
+    is accessed through indexing, `get`, `values`, `items`
+    or `pop`.
+    """
+
+    def __getitem__(self, key):
+        value = super(GeometryDict, self).__getitem__(key)
+        if isinstance(value, LazyGeometry):
+            value = value.load()
+            # replace the placeholder but keep the order
+            super(GeometryDict, self).__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def pop(self, key, *args):
+        value = super(GeometryDict, self).pop(key, *args)
+        if isinstance(value, LazyGeometry):
+            return value.load()
+        return value
+
+    def copy(self):
+        copied = GeometryDict()
+        for key in self.keys():
+            copied[key] = self.peek(key)
+        return copied
+
+    def __repr__(self):
+        # avoid loading everything to print it
+        return '{}({})'.format(
+            self.__class__.__name__,
+            [(k, self.peek(k)) for k in self.keys()])
+
+    def peek(self, key):
+        """
+        Get a value without loading it.
+
+        Parameters
+        ------------
+        key : hashable
+          Key in dict
+
+        Returns
+        -----------
+        value : trimesh.parent.Geometry or LazyGeometry
+          The current value stored for the key
+        """
+        return super(GeometryDict, self).__getitem__(key)
+
+    @property
+    def lazy(self):
+        """
+        The placeholders which haven't been loaded yet.
+
+        Returns
+        -----------
+        lazy : dict
+          {key : LazyGeometry}
+        """
+        return {k: self.peek(k) for k in self.keys()
+                if isinstance(self.peek(k), LazyGeometry)}
@@ -0,0 +1,497 @@
+"""
+query.py
+-----------
+
+Ray and proximity queries against every instance of geometry
+in a scene without concatenating it: a top- level BVH over the
+bounds of each node with a mesh is used to find candidate
+instances, and the query is then moved into the frame of each
+candidate and run against the structures of the mesh itself,
+which are shared by every node that instances it.
+"""
+import numpy as np
+
+from .. import bvh
+from .. import util
+
+
+class InstanceTree(object):
+    """
+    A BVH over the world- frame bounds of every node in
+    a scene that references a mesh.
+    """
+
+    def __init__(self, scene):
+        """
+        Create a tree over the instances of a scene.
+
+        Parameters
+        ------------
+        scene : trimesh.Scene
+          Scene to query
+        """
+        self._scene = scene
+        self._hash = None
+        # node names in the order of the tree boxes
+        self.nodes = []
+        # geometry name for each node
+        self.names = []
+        self.bvh = None
+
+    def update(self):
+        """
+        Make sure the tree matches the current scene.
+
+        If the nodes and their geometry haven't changed the
+        existing tree is refit to the current bounds of each
+        node rather than being built again.
+
+        Returns
+        ------------
+        tree : InstanceTree
+          The current object
+        """
+        scene = self._scene
+        hashed = scene.__hash__()
+        if hashed == self._hash:
+            return self
+        graph = scene.graph
+        corners = scene.bounds_corners
+        node_data = graph.transforms.node_data
+        # only meshes can be queried
+        nodes = [n for n in graph.nodes_geometry if n in corners and
+                 util.is_instance_named(
+                     scene.geometry[node_data[n]['geometry']], 'Trimesh')]
+        names = [node_data[n]['geometry'] for n in nodes]
+        # the world- frame box of every node
+        bounds = np.array([corners[n] for n in nodes],
+                          dtype=np.float64).reshape((-1, 2, 3))
+        self.bounds = bounds
+
+        if (self.bvh is not None and
+                nodes == self.nodes and names == self.names):
+            # the structure is the same so only move the boxes
+            self.bvh.refit(bounds)
+        else:
+            self.bvh = bvh.BVH(bounds)
+            self.nodes = nodes
+            self.names = names
+            # the index of each node's geometry in `unique`
+            lookup = {}
+            self.unique = []
+            for name in names:
+                if name not in lookup:
+                    lookup[name] = len(self.unique)
+                    self.unique.append(name)
+            self.geometry_index = np.array(
+                [lookup[name] for name in names], dtype=np.int64)
+
+        self.transforms = graph.get_world(nodes)
+        if len(nodes) > 0:
+            self.inverse = np.linalg.inv(self.transforms)
+        else:
+            self.inverse = self.transforms.copy()
+        self._hash = hashed
+        return self
+
+    def groups(self, instance):
+        """
+        Group pairs of queries and instances by the
+        geometry the instance references.
+
+        Parameters
+        ------------
+        instance : (h,) int
+          Index of node in `self.nodes` for each pair
+
+        Yields
+        ------------
+        mesh : trimesh.Trimesh
+          Geometry referenced by the instances
+        index : (p,) int
+          Index of the pairs which reference `mesh`
+        """
+        geometry = self.geometry_index[instance]
+        order = np.argsort(geometry, kind='stable')
+        split = np.nonzero(np.diff(geometry[order]))[0] + 1
+        for index in np.split(order, split):
+            if len(index) == 0:
+                continue
+            yield (self._scene.geometry[
+                self.unique[geometry[index[0]]]], index)
+
+
+def _transform(matrices, points, translate=True):
+    """
+    Transform one point by each of a stack of matrices.
+
+    Parameters
+    ------------
+    matrices : (n, 4, 4) float
+      Homogeneous transformation matrices
+    points : (n, 3) float
+      Points or vectors
+    translate : bool
+      Apply the translation of each matrix
+
+    Returns
+    ------------
+    transformed : (n, 3) float
+      Transformed points
+    """
+    result = np.einsum('ijk,ik->ij', matrices[:, :3, :3], points)
+    if translate:
+        result += matrices[:, :3, 3]
+    return result
+
+
+class SceneRayIntersector(object):
+    """
+    Find where rays hit the meshes in a scene using the
+    ray intersector of each mesh for every instance.
+    """
+
+    def __init__(self, tree):
+        """
+        Do ray- scene queries.
+
+        Parameters
+        ------------
+        tree : InstanceTree
+          Tree over the instances of a scene
+        """
+        self._tree = tree
+
+    def intersects_id(self,
+                      ray_origins,
+                      ray_directions,
+                      return_locations=False,
+                      multiple_hits=True,
+                      **kwargs):
+        """
+        Find the intersections between the scene and an
+        array of rays.
+
+        Parameters
+        ------------
+        ray_origins : (m, 3) float
+          Ray origin points
+        ray_directions : (m, 3) float
+          Ray direction vectors
+        return_locations : bool
+          Return hit locations or not
+        multiple_hits : bool
+          Consider multiple hits of each ray or not
+        **kwargs : dict
+          Passed to the intersector of each mesh
+
+        Returns
+        -----------
+        index_triangle : (h,) int
+          Index of triangles hit in the mesh of the node
+        index_ray : (h,) int
+          Index of ray that hit triangle
+        index_node : (h,) hashable
+          Name of the node which was hit
+        locations : (h, 3) float
+          [optional] Position of intersection in space
+        """
+        tree = self._tree.update()
+        ray_origins = np.asanyarray(ray_origins, dtype=np.float64)
+        ray_directions = np.asanyarray(ray_directions, dtype=np.float64)
+
+        # rays and the instances whose boxes they pass through
+        candidate_ray, candidate_instance = tree.bvh.query_rays(
+            ray_origins, ray_directions)
+
+        index_tri = [np.zeros(0, dtype=np.int64)]
+        index_ray = [np.zeros(0, dtype=np.int64)]
+        index_instance = [np.zeros(0, dtype=np.int64)]
+        locations = [np.zeros((0, 3), dtype=np.float64)]
+        for mesh, index in tree.groups(candidate_instance):
+            ray = candidate_ray[index]
+            instance = candidate_instance[index]
+            inverse = tree.inverse[instance]
+            # move every ray into the frame of its instance
+            tri, pair, local = mesh.ray.intersects_id(
+                ray_origins=_transform(inverse, ray_origins[ray]),
+                ray_directions=_transform(
+                    inverse, ray_directions[ray], translate=False),
+                return_locations=True,
+                multiple_hits=multiple_hits,
+                **kwargs)
+            # rays can pass through the box and miss the mesh
+            # in which case locations come back shaped (0,)
+            local = np.asanyarray(
+                local, dtype=np.float64).reshape((-1, 3))
+            index_tri.append(np.asanyarray(tri, dtype=np.int64))
+            index_ray.append(ray[pair])
+            index_instance.append(instance[pair])
+            locations.append(_transform(
+                tree.transforms[instance[pair]], local))
+
+        index_tri = np.concatenate(index_tri)
+        index_ray = np.concatenate(index_ray)
+        index_instance = np.concatenate(index_instance)
+        locations = np.vstack(locations)
+
+        if multiple_hits:
+            order = np.argsort(index_ray, kind='stable')
+        else:
+            # only keep the closest hit of every ray
+            distance = util.diagonal_dot(
+                locations - ray_origins[index_ray],
+                ray_directions[index_ray])
+            order = np.lexsort((distance, index_ray))
+            keep = np.ones(len(order), dtype=bool)
+            keep[1:] = index_ray[order][1:] != index_ray[order][:-1]
+            order = order[keep]
+
+        index_node = np.array(tree.nodes, dtype=object)[
+            index_instance[order]]
+        if return_locations:
+            return (index_tri[order],
+                    index_ray[order],
+                    index_node,
+                    locations[order])
+        return index_tri[order], index_ray[order], index_node
+
+    def intersects_location(self,
+                            ray_origins,
+                            ray_directions,
+                            **kwargs):
+        """
+        Return unique cartesian locations where rays hit
+        the scene.
+
+        Parameters
+        ------------
+        ray_origins : (m, 3) float
+          Ray origin points
+        ray_directions : (m, 3) float
+          Ray direction vectors
+
+        Returns
+        ---------
+        locations : (h, 3) float
+          Intersection points
+        index_ray : (h,) int
+          Array of ray indexes
+        index_tri : (h,) int
+          Array of triangle (face) indexes
+        index_node : (h,) hashable
+          Name of the node which was hit
+        """
+        (index_tri,
+         index_ray,
+         index_node,
+         locations) = self.intersects_id(
+             ray_origins=ray_origins,
+             ray_directions=ray_directions,
+             return_locations=True,
+             **kwargs)
+        return locations, index_ray, index_tri, index_node
+
+    def intersects_first(self,
+                         ray_origins,
+                         ray_directions,
+                         **kwargs):
+        """
+        Find the first triangle and node each ray hits.
+
+        Parameters
+        ------------
+        ray_origins : (m, 3) float
+          Ray origin points
+        ray_directions : (m, 3) float
+          Ray direction vectors
+
+        Returns
+        ----------
+        triangle_index : (m,) int
+          Index of triangle ray hit, or -1 if not hit
+        node : (m,) hashable
+          Name of the node hit, or None if not hit
+        """
+        (index_tri,
+         index_ray,
+         index_node) = self.intersects_id(
+             ray_origins=ray_origins,
+             ray_directions=ray_directions,
+             multiple_hits=False,
+             **kwargs)
+
+        triangle = np.ones(len(ray_origins), dtype=np.int64) * -1
+        triangle[index_ray] = index_tri
+        node = np.array([None] * len(ray_origins), dtype=object)
+        node[index_ray] = index_node
+        return triangle, node
+
+    def intersects_any(self,
+                       ray_origins,
+                       ray_directions,
+                       **kwargs):
+        """
+        Find out if each ray hit any mesh in the scene.
+
+        Parameters
+        ------------
+        ray_origins : (m, 3) float
+          Ray origin points
+        ray_directions : (m, 3) float
+          Ray direction vectors
+
+        Returns
+        ---------
+        hit : (m,) bool
+          Whether each ray hit anything
+        """
+        index_ray = self.intersects_id(
+            ray_origins, ray_directions, **kwargs)[1]
+        hit = np.zeros(len(ray_origins), dtype=bool)
+        hit[index_ray] = True
+        return hit
+
+
+class SceneProximityQuery(object):
+    """
+    Proximity queries against every mesh in a scene using
+    the proximity query of each mesh for every instance.
+
+    Distances are exact for transforms with rotation,
+    translation and uniform scale.
+    """
+
+    def __init__(self, tree):
+        """
+        Do proximity queries on a scene.
+
+        Parameters
+        ------------
+        tree : InstanceTree
+          Tree over the instances of a scene
+        """
+        self._tree = tree
+
+    def on_surface(self, points, **kwargs):
+        """
+        Find the closest point on any mesh in the scene
+        for each point.
+
+        Parameters
+        ------------
+        points : (m, 3) float
+          Points in space
+        **kwargs : dict
+          Passed to `ProximityQuery.on_surface`
+
+        Returns
+        ----------
+        closest : (m, 3) float
+          Closest point on any mesh for each point
+        distance : (m,) float
+          Distance to the closest point
+        triangle_id : (m,) int
+          Index of the closest triangle in the mesh of the node
+        node : (m,) hashable
+          Name of the node with the closest point
+        """
+        tree = self._tree.update()
+        points = np.asanyarray(points, dtype=np.float64)
+
+        closest = np.full((len(points), 3), np.nan)
+        distance = np.full(len(points), np.inf)
+        triangle_id = np.full(len(points), -1, dtype=np.int64)
+        node = np.array([None] * len(points), dtype=object)
+
+        if len(points) == 0 or len(tree.nodes) == 0:
+            return closest, distance, triangle_id, node
+
+        # start with the instance with the closest box
+        # to get a tight bound on the distance
+        point, instance = tree.bvh.nearest_leaf(points)
+        box = bvh.distance_sq(points[point], tree.bounds[instance])
+        order = np.lexsort((box, point))
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:] = point[order][1:] != point[order][:-1]
+        first = self._candidates(
+            tree, points, point[order[keep]], instance[order[keep]], kwargs)
+
+        # every other instance whose box is within the bound
+        bound = np.full(len(points), np.inf)
+        bound[first[0]] = first[3]
+        point, instance = tree.bvh.query_nearest(points, radius=bound)
+        # skip the pairs we have already checked
+        checked = np.zeros(len(points), dtype=np.int64) - 1
+        checked[first[0]] = first[1]
+        other = checked[point] != instance
+        candidates = [first, self._candidates(
+            tree, points, point[other], instance[other], kwargs)]
+
+        point, instance, world, current, triangle = [
+            np.concatenate(c) for c in zip(*candidates)]
+        # keep only the closest candidate for each point
+        order = np.lexsort((current, point))
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:] = point[order][1:] != point[order][:-1]
+        order = order[keep]
+
+        index = point[order]
+        closest[index] = world[order]
+        distance[index] = current[order]
+        triangle_id[index] = triangle[order]
+        node[index] = np.array(tree.nodes, dtype=object)[instance[order]]
+
+        return closest, distance, triangle_id, node
+
+    def _candidates(self, tree, points, point, instance, kwargs):
+        """
+        Find the closest point on instances for pairs of
+        points and instances.
+
+        Parameters
+        ------------
+        tree : InstanceTree
+          Current tree of instances
+        points : (m, 3) float
+          Query points
+        point : (h,) int
+          Index of points for each pair
+        instance : (h,) int
+          Index of instance for each pair
+        kwargs : dict
+          Passed to `ProximityQuery.on_surface`
+
+        Returns
+        ------------
+        point : (h,) int
+          Index of points for each pair
+        instance : (h,) int
+          Index of instance for each pair
+        closest : (h, 3) float
+          Closest point on the instance in the world frame
+        distance : (h,) float
+          Distance from the point to `closest`
+        triangle_id : (h,) int
+          Index of the closest triangle on the mesh
+        """
+        result = [(np.zeros(0, dtype=np.int64),
+                   np.zeros(0, dtype=np.int64),
+                   np.zeros((0, 3), dtype=np.float64),
+                   np.zeros(0, dtype=np.float64),
+                   np.zeros(0, dtype=np.int64))]
+        for mesh, index in tree.groups(instance):
+            current = instance[index]
+            # move every point into the frame of its instance
+            local, _, triangle = mesh.nearest.on_surface(
+                _transform(tree.inverse[current], points[point[index]]),
+                **kwargs)
+            # the distance is found in the world frame
+            world = _transform(tree.transforms[current], local)
+            result.append((
+                point[index],
+                current,
+                world,
+                np.linalg.norm(world - points[point[index]], axis=1),
+                np.asanyarray(triangle, dtype=np.int64)))
+        return tuple(np.concatenate(c) for c in zip(*result))
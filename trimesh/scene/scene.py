@@ -10,13 +10,21 @@ from .. import units
 from .. import convex
 from .. import caching
 from .. import grouping
+from .. import comparison
 from .. import transformations
 
 from ..util import unique_name
+from ..constants import log
 from ..exchange import export
 from ..parent import Geometry3D
 
+from .query import InstanceTree, SceneRayIntersector, SceneProximityQuery
 from .transforms import SceneGraph
+from .lazy import GeometryDict, LazyGeometry
+
+# compute the convex hull of a mesh to find bounds
+# if it is instanced by more nodes than this
+_hull_count = 64
 
 
 class Scene(Geometry3D):
@@ -55,8 +63,8 @@ class Scene(Geometry3D):
         camera_transform : (4, 4) float or None
           Camera transform in the base frame
         """
-        # mesh name : Trimesh object
-        self.geometry = collections.OrderedDict()
+        # mesh name : Trimesh object or placeholder
+        self.geometry = GeometryDict()
 
         # create a new graph
         self.graph = SceneGraph(base_frame=base_frame)
@@ -64,6 +72,12 @@ class Scene(Geometry3D):
         # create our cache
         self._cache = caching.Cache(id_function=self.__hash__)
 
+        # ray and proximity queries for every instance of
+        # a mesh which share a BVH over the nodes
+        tree = InstanceTree(self)
+        self.ray = SceneRayIntersector(tree)
+        self.nearest = SceneProximityQuery(tree)
+
         # add passed geometry to scene
         self.add_geometry(geometry)
 
@@ -116,7 +130,8 @@ class Scene(Geometry3D):
         Parameters
         ----------
         geometry : Trimesh, Path2D, Path3D PointCloud or list
-          Geometry to initially add to the scene
+          Geometry to initially add to the scene, or a
+          LazyGeometry placeholder loaded on first access
         node_name: Name of the added node.
         geom_name: Name of the added geometry.
         parent_node_name: Name of the parent node in the graph.
@@ -157,7 +172,8 @@ class Scene(Geometry3D):
             self.graph.transforms = concat.graph.transforms
             return
 
-        if not hasattr(geometry, 'vertices'):
+        if not (hasattr(geometry, 'vertices') or
+                isinstance(geometry, LazyGeometry)):
             util.log.warning('unknown type ({}) added to scene!'.format(
                 type(geometry).__name__))
             return
@@ -247,7 +263,8 @@ class Scene(Geometry3D):
         # start with the last modified time of the scene graph
         hashable = [hex(self.graph.transforms.__hash__())]
         # take the re-hex string of the hash
-        hashable.extend(hex(geometry[k].__hash__()) for k in
+        # peek so placeholders aren't loaded to be hashed
+        hashable.extend(hex(geometry.peek(k).__hash__()) for k in
                         geometry.keys())
         return caching.hash_fast(
             ''.join(hashable).encode('utf-8'))
@@ -302,34 +319,56 @@ class Scene(Geometry3D):
           Bounds for each node with vertices:
            {node_name : (2, 3) float}
         """
-        # collect AABB for each geometry
-        corners = {}
-        # collect vertices for every mesh
-        vertices = {k: m.vertices for k, m in
-                    self.geometry.items()
-                    if hasattr(m, 'vertices') and
-                    len(m.vertices) > 0}
-        # handle 2D geometries
-        vertices.update(
-            {k: np.column_stack((v, np.zeros(len(v))))
-             for k, v in vertices.items() if v.shape[1] == 2})
-
-        # loop through every node with geometry
-        for node_name in self.graph.nodes_geometry:
-            # access the transform and geometry name from node
-            transform, geometry_name = self.graph[node_name]
-            # will be None if no vertices for this node
-            points = vertices.get(geometry_name)
-            # skip empty geometries
-            if points is None:
+        from ..bounds import corners as box_corners
+        # get the transforms for every node at once
+        nodes = self.graph.nodes_geometry
+        transforms = self.graph.get_world(nodes)
+        node_data = self.graph.transforms.node_data
+        # the index of every node grouped by geometry name
+        groups = collections.defaultdict(list)
+        for i, node_name in enumerate(nodes):
+            groups[node_data[node_name]['geometry']].append(i)
+
+        # the lower and upper corner for every node
+        lower = np.full((len(nodes), 3), np.nan)
+        upper = np.full((len(nodes), 3), np.nan)
+        for name, index in groups.items():
+            if name not in self.geometry:
+                continue
+            current = self.geometry.peek(name)
+            if isinstance(current, LazyGeometry):
+                if current.bounds is not None:
+                    # use the corners of the known box
+                    # rather than loading the geometry
+                    points = box_corners(current.bounds)
+                    current = None
+                else:
+                    current = self.geometry[name]
+            if current is not None:
+                points = _bounds_points(current, len(index))
+            if points is None or len(points) == 0:
                 continue
-            # apply just the rotation to skip N multiplies
-            dot = np.dot(transform[:3, :3], points.T)
-            # append the AABB with translation applied after
-            corners[node_name] = np.array(
-                [dot.min(axis=1) + transform[:3, 3],
-                 dot.max(axis=1) + transform[:3, 3]])
-        return corners
+            # handle 2D geometries
+            if points.shape[1] == 2:
+                points = np.column_stack((points, np.zeros(len(points))))
+
+            # transform many instances at once while keeping
+            # the (count, 3, points) temporary array small
+            index = np.array(index, dtype=np.int64)
+            chunk = max(1, (2 ** 20) // len(points))
+            for start in range(0, len(index), chunk):
+                block = index[start:start + chunk]
+                matrix = transforms[block]
+                # apply just the rotation to skip N multiplies
+                dot = np.matmul(matrix[:, :3, :3], points.T)
+                # the AABB with translation applied after
+                lower[block] = dot.min(axis=2) + matrix[:, :3, 3]
+                upper[block] = dot.max(axis=2) + matrix[:, :3, 3]
+
+        # will be NaN if no vertices for this node
+        valid = ~np.isnan(lower[:, 0])
+        return {node_name: np.array([lower[i], upper[i]])
+                for i, node_name in enumerate(nodes) if valid[i]}
 
     @caching.cache_decorator
     def bounds(self):
@@ -421,9 +460,12 @@ class Scene(Geometry3D):
         triangles = collections.deque()
         triangles_node = collections.deque()
 
-        for node_name in self.graph.nodes_geometry:
+        nodes = self.graph.nodes_geometry
+        node_data = self.graph.transforms.node_data
+        for node_name, transform in zip(
+                nodes, self.graph.get_world(nodes)):
             # which geometry does this node refer to
-            transform, geometry_name = self.graph[node_name]
+            geometry_name = node_data[node_name]['geometry']
 
             # get the actual potential mesh instance
             geometry = self.geometry[geometry_name]
@@ -487,10 +529,15 @@ class Scene(Geometry3D):
         if len(self.geometry) == 0:
             return []
 
+        # geometry which is a rigidly transformed copy of other
+        # geometry shares its identifier so only compute it once
+        duplicate = self.duplicate_geometry
         # geometry name : hash of mesh
         hashes = {k: int(m.identifier_hash, 16)
                   for k, m in self.geometry.items()
-                  if hasattr(m, 'identifier_hash')}
+                  if k not in duplicate and
+                  hasattr(m, 'identifier_hash')}
+        hashes.update({k: hashes[v[0]] for k, v in duplicate.items()})
 
         # bring into local scope for loop
         graph = self.graph
@@ -510,6 +557,82 @@ class Scene(Geometry3D):
         # we only care about the values keys are garbage
         return list(duplicates.values())
 
+    @caching.cache_decorator
+    def duplicate_geometry(self):
+        """
+        Find geometry which is identical to other geometry in
+        the scene up to a rigid transform, i.e. the same part
+        exported with a transform baked into its vertices.
+
+        Candidates are grouped by the cheap signature from
+        `comparison.identifier_rigid` and every match is then
+        checked by solving for the transform between vertices.
+
+        Returns
+        -----------
+        duplicates : dict
+          {name : (original name, (4, 4) float)} for every
+          geometry matching an earlier geometry where the matrix
+          moves the original onto the named geometry
+        """
+        # signature : names of geometry with unique shapes
+        originals = collections.defaultdict(list)
+        duplicates = {}
+        for name, geometry in self.geometry.items():
+            if not util.is_instance_named(geometry, 'Trimesh'):
+                continue
+            candidates = originals[comparison.identifier_rigid(geometry)]
+            for original in candidates:
+                matrix = comparison.rigid_transform(
+                    self.geometry[original].vertices, geometry.vertices)
+                if matrix is not None:
+                    duplicates[name] = (original, matrix)
+                    break
+            else:
+                candidates.append(name)
+        return duplicates
+
+    def reinstance(self):
+        """
+        Replace geometry which is identical to other geometry up
+        to a rigid transform with a reference to the original,
+        moving the difference into the transforms of the nodes.
+        Assemblies which repeat the same part with the transform
+        baked into its vertices then only store it once.
+
+        Returns
+        -----------
+        removed : list
+          Names of geometry removed from the scene
+        """
+        duplicates = self.duplicate_geometry
+        if len(duplicates) == 0:
+            return []
+
+        graph = self.graph
+        edges = graph.transforms.edge_data
+        parents = graph.transforms.parents
+        # updating the graph clears this so take it first
+        geometry_nodes = graph.geometry_nodes
+        removed = []
+        for name, (original, matrix) in duplicates.items():
+            nodes = geometry_nodes.get(name, [])
+            # the base frame has no transform to change
+            if any(node not in parents for node in nodes):
+                continue
+            for node in nodes:
+                parent = parents[node]
+                # keep any other attributes of the edge
+                attr = edges[(parent, node)].copy()
+                attr['matrix'] = np.dot(
+                    attr.get('matrix', np.eye(4)), matrix)
+                attr['geometry'] = original
+                graph.update(frame_to=node, frame_from=parent, **attr)
+            removed.append(name)
+
+        [self.geometry.pop(name, None) for name in removed]
+        return removed
+
     def deduplicated(self):
         """
         Return a new scene where each unique geometry is only
@@ -734,7 +857,7 @@ class Scene(Geometry3D):
                           matrix=matrix)
         self.graph.base_frame = new_base
 
-    def dump(self, concatenate=False):
+    def dump(self, concatenate=False, instanced=False):
         """
         Append all meshes in scene freezing transforms.
 
@@ -742,16 +865,46 @@ class Scene(Geometry3D):
         ------------
         concatenate : bool
           If True, concatenate results into single mesh
+        instanced : bool
+          If True return every geometry once with the nodes
+          referencing it and their transforms rather than
+          transformed copies, `concatenate` is ignored
 
         Returns
         ----------
-        dumped : (n,) Trimesh or Trimesh
+        dumped : (n,) Trimesh, Trimesh or dict
           Trimesh objects transformed to their
-          location the scene.graph
-        """
+          location the scene.graph or if `instanced`:
+          {geometry name : {'geometry' : Geometry,
+                            'nodes' : (m,) node names,
+                            'transforms' : (m, 4, 4) float}}
+        """
+        nodes = self.graph.nodes_geometry
+        node_data = self.graph.transforms.node_data
+
+        if instanced:
+            # the nodes referencing each geometry in order
+            groups = collections.OrderedDict()
+            for node_name in nodes:
+                groups.setdefault(
+                    node_data[node_name]['geometry'], []).append(node_name)
+            return collections.OrderedDict(
+                (name, {'geometry': self.geometry[name],
+                        'nodes': group,
+                        'transforms': self.graph.get_world(group)})
+                for name, group in groups.items())
+
+        if concatenate and len(nodes) > 1:
+            # transform directly into the result rather
+            # than copying and transforming every instance
+            dumped = self._dump_concatenated(nodes)
+            if dumped is not None:
+                return dumped
+
         result = []
-        for node_name in self.graph.nodes_geometry:
-            transform, geometry_name = self.graph[node_name]
+        for node_name, transform in zip(
+                nodes, self.graph.get_world(nodes)):
+            geometry_name = node_data[node_name]['geometry']
             # get a copy of the geometry
             current = self.geometry[geometry_name].copy()
             # move the geometry vertices into the requested frame
@@ -767,6 +920,113 @@ class Scene(Geometry3D):
 
         return np.array(result)
 
+    def _dump_concatenated(self, nodes):
+        """
+        Concatenate every instance of a mesh into a single
+        mesh, transforming every instance of a geometry in
+        one batch into preallocated arrays.
+
+        Parameters
+        ------------
+        nodes : (n,) hashable
+          Nodes of the graph with geometry
+
+        Returns
+        ------------
+        concatenated : Trimesh or None
+          Every instance or None if the scene has any
+          geometry which isn't a Trimesh
+        """
+        node_data = self.graph.transforms.node_data
+        names = [node_data[n]['geometry'] for n in nodes]
+        # the index of every node grouped by geometry name
+        groups = collections.OrderedDict()
+        for i, name in enumerate(names):
+            groups.setdefault(name, []).append(i)
+        geometry = {name: self.geometry[name] for name in groups}
+        if not all(util.is_instance_named(g, 'Trimesh')
+                   for g in geometry.values()):
+            return None
+
+        transforms = self.graph.get_world(nodes)
+        # transforms which flip the winding of triangles
+        flip = np.linalg.det(transforms[:, :3, :3]) < 0.0
+
+        # where each instance starts in the result
+        vertex_count = np.array(
+            [len(geometry[n].vertices) for n in names], dtype=np.int64)
+        face_count = np.array(
+            [len(geometry[n].faces) for n in names], dtype=np.int64)
+        vertex_start = np.append(0, np.cumsum(vertex_count)[:-1])
+        face_start = np.append(0, np.cumsum(face_count)[:-1])
+
+        vertices = np.zeros((vertex_count.sum(), 3), dtype=np.float64)
+        faces = np.zeros((face_count.sum(), 3), dtype=np.int64)
+        for name, index in groups.items():
+            mesh = geometry[name]
+            points = mesh.vertices.view(np.ndarray)
+            triangles = mesh.faces.view(np.ndarray)
+            if len(points) == 0:
+                continue
+            index = np.array(index, dtype=np.int64)
+            # keep the temporary arrays for each block small
+            chunk = max(1, (2 ** 20) // max(len(points), len(triangles)))
+            for start in range(0, len(index), chunk):
+                block = index[start:start + chunk]
+                matrix = transforms[block]
+                # instances next to each other in the result can
+                # be written directly without a temporary array
+                adjacent = block[-1] - block[0] == len(block) - 1
+
+                # the (len(block), len(points), 3) moved points
+                if adjacent:
+                    begin = vertex_start[block[0]]
+                    moved = vertices[
+                        begin:begin + len(block) * len(points)].reshape(
+                            (len(block), len(points), 3))
+                else:
+                    moved = np.zeros((len(block), len(points), 3))
+                np.matmul(points,
+                          matrix[:, :3, :3].transpose((0, 2, 1)),
+                          out=moved)
+                moved += matrix[:, None, :3, 3]
+                if not adjacent:
+                    for i, value in zip(block, moved):
+                        vertices[vertex_start[i]:
+                                 vertex_start[i] + len(points)] = value
+
+                if len(triangles) == 0:
+                    continue
+                # offset faces to reference each instance
+                if adjacent:
+                    begin = face_start[block[0]]
+                    current = faces[
+                        begin:begin + len(block) * len(triangles)].reshape(
+                            (len(block), len(triangles), 3))
+                    current[:] = triangles
+                else:
+                    current = np.tile(triangles, (len(block), 1, 1))
+                current[flip[block]] = np.fliplr(triangles)
+                current += vertex_start[block].reshape((-1, 1, 1))
+                if not adjacent:
+                    for i, value in zip(block, current):
+                        faces[face_start[i]:
+                              face_start[i] + len(triangles)] = value
+
+        try:
+            # concatenate visuals
+            visuals = [geometry[n].visual for n in names]
+            visual = visuals[0].concatenate(visuals[1:])
+        except BaseException:
+            log.debug('failed to combine visuals', exc_info=True)
+            visual = None
+
+        return util.type_named(geometry[names[0]], 'Trimesh')(
+            vertices=vertices,
+            faces=faces,
+            visual=visual,
+            process=False)
+
     def subscene(self, node):
         """
         Get part of a scene that succeeds a specified node.
@@ -1342,3 +1602,34 @@ def append_scenes(iterable, common=['world'], base_frame='world'):
     result.geometry.update(geometry)
 
     return result
+
+
+def _bounds_points(geometry, count):
+    """
+    Get points of a geometry which have the same bounding box
+    as the whole geometry under any transform.
+
+    Parameters
+    ------------
+    geometry : trimesh.parent.Geometry
+      Geometry in a scene
+    count : int
+      Number of nodes referencing the geometry
+
+    Returns
+    ------------
+    points : None or (n, dimension) float
+      Vertices of the convex hull or the geometry
+    """
+    vertices = getattr(geometry, 'vertices', None)
+    if vertices is None or len(vertices) == 0:
+        return None
+    if util.is_instance_named(geometry, 'Trimesh') and (
+            count > _hull_count or 'convex_hull' in geometry._cache):
+        # the hull is usually much smaller than the mesh
+        # so it is worth computing for many instances
+        try:
+            return geometry.convex_hull.vertices.view(np.ndarray)
+        except BaseException:
+            log.debug('unable to compute hull', exc_info=True)
+    return vertices.view(np.ndarray)
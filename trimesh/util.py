@@ -1068,11 +1068,50 @@ def array_to_string(array,
     formatted : str
        String representation of original array
     """
+    return ''.join(array_to_string_chunks(
+        array,
+        col_delim=col_delim,
+        row_delim=row_delim,
+        digits=digits,
+        value_format=value_format))
+
+
+def array_to_string_chunks(array,
+                           col_delim=' ',
+                           row_delim='\n',
+                           digits=8,
+                           value_format='{}',
+                           count=65536):
+    """
+    Convert a 1 or 2D array into strings a block of rows at
+    a time, so large arrays can be written to a file without
+    the whole result existing as a single string.
+
+    Parameters
+    ------------
+    array : (n,) or (n, d) float or int
+       Data to be converted
+       If shape is (n,) only column delimiter will be used
+    col_delim : str
+      What string should separate values in a column
+    row_delim : str
+      What string should separate values in a row
+    digits : int
+      How many digits should floating point numbers include
+    value_format : str
+       Format string for each value or sequence of values
+       If multiple values per value_format it must divide
+       into array evenly.
+    count : int
+      Number of rows to convert in each chunk
+
+    Yields
+    ----------
+    chunk : str
+       Strings which concatenate to `array_to_string`
+    """
     # convert inputs to correct types
     array = np.asanyarray(array)
-    digits = int(digits)
-    row_delim = str(row_delim)
-    col_delim = str(col_delim)
     value_format = str(value_format)
 
     # abort for non-flat arrays
@@ -1085,41 +1124,46 @@ def array_to_string(array,
         raise ValueError(
             'array is  structured, use structured_array_to_string instead')
 
-    # allow a value to be repeated in a value format
-    repeats = value_format.count('{')
-
+    # `%` formatting is faster but only handles bare fields
+    percent = _is_bare(value_format)
     if array.dtype.kind in ['i', 'u']:
         # integer types don't need a specified precision
-        format_str = value_format + col_delim
+        spec = '%d' if percent else '{}'
     elif array.dtype.kind == 'f':
         # add the digits formatting to floats
-        format_str = value_format.replace(
-            '{}', '{:.' + str(digits) + 'f}') + col_delim
+        if percent:
+            spec = '%.{}f'.format(int(digits))
+        else:
+            spec = '{:.' + str(int(digits)) + 'f}'
     else:
         raise ValueError('dtype %s not convertible!',
                          array.dtype.name)
 
-    # length of extra delimiters at the end
-    end_junk = len(col_delim)
-    # if we have a 2D array add a row delimiter
     if len(array.shape) == 2:
-        format_str *= array.shape[1]
-        # cut off the last column delimiter and add a row delimiter
-        format_str = format_str[:-len(col_delim)] + row_delim
-        end_junk = len(row_delim)
-
-    # expand format string to whole array
-    format_str *= len(array)
+        columns = array.shape[1]
+    else:
+        # values of a 1D array are only separated
+        # by the column delimiter
+        array = array.reshape((-1, 1))
+        columns = 1
+        row_delim = col_delim
 
-    # if an array is repeated in the value format
-    # do the shaping here so we don't need to specify indexes
-    shaped = np.tile(array.reshape((-1, 1)),
-                     (1, repeats)).reshape(-1)
+    # allow a value to be repeated in a value format
+    repeats = value_format.count('{')
+    if repeats > 1:
+        array = np.repeat(array, repeats, axis=1)
 
-    # run the format operation and remove the extra delimiters
-    formatted = format_str.format(*shaped)[:-end_junk]
+    if percent:
+        escape = _escape_percent
+    else:
+        escape = str
+    format_str = escape(value_format).replace('{}', spec)
+    row_format = escape(col_delim).join(
+        [format_str] * columns) + escape(row_delim)
 
-    return formatted
+    for chunk in _format_chunks(
+            array, row_format, len(str(row_delim)), count, percent):
+        yield chunk
 
 
 def structured_array_to_string(array,
@@ -1154,11 +1198,47 @@ def structured_array_to_string(array,
     formatted : str
        String representation of original array
     """
+    return ''.join(structured_array_to_string_chunks(
+        array,
+        col_delim=col_delim,
+        row_delim=row_delim,
+        digits=digits,
+        value_format=value_format))
+
+
+def structured_array_to_string_chunks(array,
+                                      col_delim=' ',
+                                      row_delim='\n',
+                                      digits=8,
+                                      value_format='{}',
+                                      count=65536):
+    """
+    Convert a structured array into strings a block of rows
+    at a time, so large arrays can be written to a file without
+    the whole result existing as a single string.
+
+    Parameters
+    ------------
+    array : (n,) structured array
+       Data to be converted
+    col_delim : str
+      What string should separate values in a column
+    row_delim : str
+      What string should separate values in a row
+    digits : int
+      How many digits should floating point numbers include
+    value_format : str
+       Format string for each value
+    count : int
+      Number of rows to convert in each chunk
+
+    Yields
+    ----------
+    chunk : str
+       Strings which concatenate to `structured_array_to_string`
+    """
     # convert inputs to correct types
     array = np.asanyarray(array)
-    digits = int(digits)
-    row_delim = str(row_delim)
-    col_delim = str(col_delim)
     value_format = str(value_format)
 
     # abort for non-flat arrays
@@ -1176,40 +1256,97 @@ def structured_array_to_string(array,
             'value_format %s is invalid, repeating unstructured array '
             + 'values is unsupported', value_format)
 
-    format_str = ''
+    # `%` formatting is faster but only handles bare fields
+    percent = _is_bare(value_format)
+    if percent:
+        escape = _escape_percent
+        specs = {'i': '%.0f', 'f': '%.{}f'.format(int(digits))}
+    else:
+        escape = str
+        specs = {'i': '{:0.0f}', 'f': '{:.' + str(int(digits)) + 'f}'}
+    value_format = escape(value_format)
+
+    formats = []
     for name in array.dtype.names:
         kind = array[name].dtype.kind
         element_row_length = (
             array[name].shape[1] if len(array[name].shape) == 2 else 1)
         if kind in ['i', 'u']:
             # integer types need a no-decimal formatting
-            element_format_str = value_format.replace(
-                '{}', '{:0.0f}') + col_delim
+            element_format_str = value_format.replace('{}', specs['i'])
         elif kind == 'f':
             # add the digits formatting to floats
-            element_format_str = value_format.replace(
-                '{}', '{:.' + str(digits) + 'f}') + col_delim
+            element_format_str = value_format.replace('{}', specs['f'])
         else:
             raise ValueError('dtype %s not convertible!',
                              array.dtype)
-        format_str += element_row_length * element_format_str
-
-    # length of extra delimiters at the end
-    format_str = format_str[:-len(col_delim)] + row_delim
-    # expand format string to whole array
-    format_str *= len(array)
+        formats.extend([element_format_str] * element_row_length)
+    row_format = escape(col_delim).join(formats) + escape(row_delim)
 
     # loop through flat fields and flatten to single array
-    count = len(array)
+    length = len(array)
     # will upgrade everything to a float
     flattened = np.hstack(
-        [array[k].reshape((count, -1))
-         for k in array.dtype.names]).reshape(-1)
+        [array[k].reshape((length, -1))
+         for k in array.dtype.names])
 
-    # run the format operation and remove the extra delimiters
-    formatted = format_str.format(*flattened)[:-len(row_delim)]
+    for chunk in _format_chunks(
+            flattened, row_format, len(str(row_delim)), count, percent):
+        yield chunk
 
-    return formatted
+
+def _is_bare(value_format):
+    """
+    Check if every field in a format string is a bare `{}`.
+    """
+    stripped = str(value_format).replace('{}', '')
+    return '{' not in stripped and '}' not in stripped
+
+
+def _escape_percent(text):
+    """
+    Escape a string so it is literal in a %- format string.
+    """
+    return str(text).replace('%', '%%')
+
+
+def _format_chunks(array, row_format, end_junk, count, percent=True):
+    """
+    Format a 2D array with one format string per row a block
+    of rows at a time, removing the trailing delimiter.
+
+    Parameters
+    ------------
+    array : (n, d) float or int
+      Values with one column for every field in `row_format`
+    row_format : str
+      Format string for a row including the delimiter
+    end_junk : int
+      Length of the delimiter to remove from the end
+    count : int
+      Number of rows to format at once
+    percent : bool
+      If True `row_format` is a %- format string
+      otherwise it is for `str.format`
+
+    Yields
+    ----------
+    chunk : str
+      Formatted text for a block of rows
+    """
+    length = len(array)
+    for start in range(0, length, count):
+        block = array[start:start + count]
+        # a single format operation on native values is
+        # much faster than formatting numpy scalars
+        values = block.ravel().tolist()
+        if percent:
+            chunk = (row_format * len(block)) % tuple(values)
+        else:
+            chunk = (row_format * len(block)).format(*values)
+        if start + count >= length and end_junk > 0:
+            chunk = chunk[:-end_junk]
+        yield chunk
 
 
 def array_to_encoded(array, dtype=None, encoding='base64'):
@@ -1782,7 +1919,7 @@ def wrap_as_stream(item):
 
     Parameters
     ------------
-    item: str or bytes
+    item: str, bytes or memoryview
       Item to be wrapped
 
     Returns
@@ -1795,7 +1932,7 @@ def wrap_as_stream(item):
         return StringIO(item)
     if isinstance(item, str):
         return StringIO(item)
-    elif isinstance(item, bytes):
+    elif isinstance(item, (bytes, bytearray, memoryview)):
         return BytesIO(item)
     raise ValueError('{} is not wrappable!'.format(type(item).__name__))
 
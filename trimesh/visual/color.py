@@ -59,7 +59,7 @@ class ColorVisuals(Visuals):
         self.mesh = mesh
         self._data = caching.DataStore()
         self._cache = caching.Cache(
-            id_function=self._data.__hash__)
+            id_function=self._data.version)
 
         self.defaults = {
             'material_diffuse': np.array([102, 102, 102, 255],
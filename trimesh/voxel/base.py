@@ -38,7 +38,7 @@ class VoxelGrid(Geometry):
         self.encoding = encoding
         self._data['transform'] = transforms.Transform(transform)
         self._cache = caching.Cache(
-            id_function=self._data.__hash__)
+            id_function=self._data.version)
 
         self.metadata = dict()
         # update the mesh metadata with passed metadata
@@ -0,0 +1,195 @@
+"""
+winding.py
+-------------
+
+Compute the generalized winding number of triangle soups,
+which is robust to holes, self- intersections and other
+defects that break ray- based inside/outside tests.
+
+Uses the hierarchical evaluation from:
+Barill et al. 2018 "Fast Winding Numbers for Soups and Clouds"
+where the triangles inside a BVH node that is far from a
+query point are approximated by a single dipole.
+"""
+import numpy as np
+
+from . import bvh
+from . import util
+
+
+def solid_angle(triangles, points):
+    """
+    Find the signed solid angle subtended by each triangle
+    when viewed from a corresponding point using the formula
+    from Van Oosterom and Strackee.
+
+    Parameters
+    ------------
+    triangles : (n, 3, 3) float
+      Triangles in space
+    points : (n, 3) float
+      Points in space
+
+    Returns
+    -----------
+    angle : (n,) float
+      Solid angle, positive when the point is on the
+      side of the triangle opposite to its normal
+    """
+    triangles = np.asanyarray(triangles, dtype=np.float64)
+    points = np.asanyarray(points, dtype=np.float64)
+
+    # vertices relative to the query points
+    a, b, c = (triangles - points.reshape((-1, 1, 3))).transpose((1, 0, 2))
+    la, lb, lc = (util.row_norm(i) for i in (a, b, c))
+
+    numerator = util.diagonal_dot(a, np.cross(b, c))
+    denominator = (la * lb * lc +
+                   util.diagonal_dot(a, b) * lc +
+                   util.diagonal_dot(a, c) * lb +
+                   util.diagonal_dot(b, c) * la)
+
+    return 2.0 * np.arctan2(numerator, denominator)
+
+
+class WindingNumber(object):
+    """
+    Evaluate the generalized winding number of a set of
+    triangles using a BVH where every node stores the sum
+    of area- weighted normals of the triangles it contains.
+    """
+
+    def __init__(self, triangles, tree=None):
+        """
+        Precompute the far- field approximation for every node.
+
+        Parameters
+        ------------
+        triangles : (n, 3, 3) float
+          Triangles in space
+        tree : None or trimesh.bvh.BVH
+          Tree of triangle bounds, created if not passed
+        """
+        triangles = np.asanyarray(triangles, dtype=np.float64)
+        if not util.is_shape(triangles, (-1, 3, 3)):
+            raise ValueError('Triangles must be (n, 3, 3)!')
+        if tree is None:
+            tree = bvh.triangles_bvh(triangles)
+
+        self.tree = tree
+        self.triangles = triangles
+
+        if len(triangles) == 0:
+            self.center = np.zeros((0, 3))
+            self.normal = np.zeros((0, 3))
+            self.radius = np.zeros(0)
+            return
+
+        # area weighted normal of each triangle in tree order
+        ordered = triangles[tree.order]
+        normal = np.cross(ordered[:, 1] - ordered[:, 0],
+                          ordered[:, 2] - ordered[:, 0]) / 2.0
+        area = util.row_norm(normal)
+        # moments which are summed up the tree
+        moment = np.column_stack((
+            normal, area, ordered.mean(axis=1) * area.reshape((-1, 1))))
+
+        leaf_count = 2 ** tree.depth
+        nodes = np.zeros((leaf_count * 2 - 1, moment.shape[1]))
+        nodes[leaf_count - 1:] = np.add.reduceat(
+            moment, tree.leaf_start[:-1], axis=0)
+        for level in range(tree.depth - 1, -1, -1):
+            lo, hi = 2 ** level - 1, 2 ** (level + 1) - 1
+            child = nodes[2 * lo + 1: 2 * hi + 1]
+            nodes[lo:hi] = child[0::2] + child[1::2]
+
+        # the dipole is placed at the area weighted center
+        # falling back to the center of the box for zero area
+        center = tree.node_bounds.mean(axis=1)
+        nonzero = nodes[:, 3] > 0.0
+        center[nonzero] = (nodes[nonzero, 4:] /
+                           nodes[nonzero, 3].reshape((-1, 1)))
+
+        self.center = center
+        self.normal = nodes[:, :3]
+        # everything in the node is within this distance of center
+        self.radius = np.sqrt(bvh.farthest_sq(center, tree.node_bounds))
+
+    def winding_number(self, points, beta=2.0):
+        """
+        Find the generalized winding number at each point.
+
+        Parameters
+        ------------
+        points : (m, 3) float
+          Points in space
+        beta : float
+          Nodes farther than `beta` times their radius from a
+          point use the dipole approximation, larger values
+          are more accurate and slower
+
+        Returns
+        -----------
+        winding : (m,) float
+          Winding number, which is 1.0 inside closed meshes
+          with outward normals and 0.0 outside
+        """
+        points = np.asanyarray(points, dtype=np.float64)
+        if not util.is_shape(points, (-1, 3)):
+            raise ValueError('points must be (n, 3)!')
+
+        count = len(points)
+        result = np.zeros(count, dtype=np.float64)
+        if count == 0 or len(self.triangles) == 0:
+            return result
+
+        tree = self.tree
+        query = np.arange(count, dtype=np.int64)
+        node = np.zeros(count, dtype=np.int64)
+        for level in range(tree.depth + 1):
+            vector = self.center[node] - points[query]
+            distance = util.row_norm(vector)
+            far = distance > beta * self.radius[node]
+            # far nodes contribute a single dipole
+            result += np.bincount(
+                query[far],
+                weights=(util.diagonal_dot(
+                    self.normal[node[far]], vector[far]) /
+                    distance[far] ** 3),
+                minlength=count)
+            query, node = query[~far], node[~far]
+            if level < tree.depth:
+                # replace every near node with its two children
+                query = np.repeat(query, 2)
+                node = (node.reshape((-1, 1)) * 2 + [1, 2]).ravel()
+
+        # evaluate the exact solid angle of leaf triangles
+        repeat, index = tree.leaf_primitives(
+            node - (2 ** tree.depth - 1))
+        query = query[repeat]
+        result += np.bincount(
+            query,
+            weights=solid_angle(
+                self.triangles[tree.order[index]], points[query]),
+            minlength=count)
+
+        return result / (4.0 * np.pi)
+
+    def contains(self, points, beta=2.0):
+        """
+        Check if points are inside of the triangles using
+        the generalized winding number.
+
+        Parameters
+        ------------
+        points : (m, 3) float
+          Points in space
+        beta : float
+          Accuracy parameter for `winding_number`
+
+        Returns
+        -----------
+        contains : (m,) bool
+          If winding number is over one half
+        """
+        return self.winding_number(points, beta=beta) > 0.5